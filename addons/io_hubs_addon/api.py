@@ -1,4 +1,110 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from .utils import get_prefs_dir_path, create_prefs_dir
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Resumable uploads send the file in chunks, failed chunks are retried with exponential backoff and
+# the upload is resumed from the last offset acknowledged by the server.
+RESUMABLE_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+RESUMABLE_UPLOAD_MAX_RETRIES = 5
+RESUMABLE_UPLOAD_RETRY_DELAY = 0.5
+
+# Whether each endpoint supports resumable uploads, so unsupported endpoints are only probed once.
+resumable_upload_support = {}
+
+# Uploaded files are recorded in a manifest by content hash and instance, so unchanged files are not uploaded again
+# until their upload expires.  Publishing a scene with a reused file needs its access token, so the manifest stores
+# the tokens in plain text in the add-on preferences directory (next to the browser profiles, which hold the session
+# credentials).  The file is only readable by the user and its entries are dropped once they expire.
+UPLOAD_MANIFEST_FILE = "upload_manifest.json"
+UPLOAD_MANIFEST_EXPIRY = 24 * 60 * 60
+upload_manifest_lock = threading.Lock()
+
+# All the requests share a pooled session so connections to the Reticulum instance are reused.
+session = None
+session_lock = threading.Lock()
+
+
+def get_session():
+    global session
+    with session_lock:
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
+
+def close_session():
+    global session
+    with session_lock:
+        if session is not None:
+            session.close()
+            session = None
+
+
+class MultipartUploadStream:
+    """File-like multipart/form-data body that streams a file from disk instead of loading it in memory."""
+
+    def __init__(self, file, field_name, file_name, content_type, progress=None):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self._parts = [
+            (f'--{self.boundary}\r\n'
+             f'Content-Disposition: form-data; name="{field_name}"; filename="{file_name}"\r\n'
+             f'Content-Type: {content_type}\r\n\r\n').encode(),
+            file,
+            f'\r\n--{self.boundary}--\r\n'.encode(),
+        ]
+        self._length = len(self._parts[0]) + get_file_size(file) + len(self._parts[2])
+        self._part_index = 0
+        self._part_offset = 0
+        self._bytes_read = 0
+        self._progress = progress
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self._length
+        chunks = []
+        while size > 0 and self._part_index < len(self._parts):
+            part = self._parts[self._part_index]
+            if isinstance(part, bytes):
+                chunk = part[self._part_offset:self._part_offset + size]
+                self._part_offset += len(chunk)
+                if self._part_offset >= len(part):
+                    self._part_index += 1
+                    self._part_offset = 0
+            else:
+                chunk = part.read(size)
+                if not chunk:
+                    self._part_index += 1
+                    continue
+            chunks.append(chunk)
+            size -= len(chunk)
+
+        data = b"".join(chunks)
+        self._bytes_read += len(data)
+        if self._progress:
+            self._progress(self._bytes_read, self._length)
+        return data
 
 
 def create_room(endpoint, token=None, scene_name=None, scene_id=None):
@@ -22,23 +128,138 @@ def create_room(endpoint, token=None, scene_name=None, scene_id=None):
     body = json.dumps(payload)
 
     url = f'{endpoint}/api/v1/hubs'
-    resp = requests.post(url, body, headers=headers)
+    resp = get_session().post(url, body, headers=headers)
 
     return resp.json()
 
 
-def upload_media(endpoint, file):
-    resp = requests.post(f'{endpoint}/api/v1/media', files={'media': (
-        'glb', file, 'application/octet-stream')}, verify=False)
-    json = resp.json()
+class ResumableUploadNotSupported(Exception):
+    pass
+
+
+class UploadNotFound(Exception):
+    """Some of the uploaded files referenced by the scene are unknown to the server, ie. they have expired."""
+    pass
+
 
-    if "error" in json:
+def is_upload_not_found_response(resp):
+    # Reticulum answers with a 404 about the files when an owned file id or its access token isn't valid (anymore).
+    return resp.status_code in (404, 410) and "file" in resp.text.lower()
+
+
+def get_media_data(data):
+    if "error" in data:
         raise Exception(f'Unknown error')
 
     return {
-        "file_id": json.get("file_id"),
-        "access_token": json.get("meta").get("access_token")
+        "file_id": data.get("file_id"),
+        "access_token": data.get("meta").get("access_token")
+    }
+
+
+def get_file_size(file):
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+    return size
+
+
+def get_acknowledged_offset(resp, default):
+    # The server acknowledges the received bytes with a "Range: bytes=0-<last byte>" header.
+    range_header = resp.headers.get("range")
+    if not range_header or "-" not in range_header:
+        return default
+    return int(range_header.rsplit("-", 1)[1]) + 1
+
+
+def is_retryable(err):
+    if isinstance(err, requests.HTTPError):
+        return err.response is not None and err.response.status_code >= 500
+    return isinstance(err, (requests.ConnectionError, requests.Timeout))
+
+
+def start_resumable_upload(endpoint, size, content_type):
+    try:
+        resp = get_session().post(f'{endpoint}/api/v1/media/uploads', headers={
+            "upload-length": str(size),
+            "upload-content-type": content_type
+        }, verify=False)
+    except (requests.ConnectionError, requests.Timeout) as err:
+        # Some proxies drop the requests to unknown endpoints, fall back to a regular upload this time.
+        raise ResumableUploadNotSupported() from err
+    location = resp.headers.get("location")
+    if resp.status_code not in (200, 201) or not location:
+        resumable_upload_support[endpoint] = False
+        raise ResumableUploadNotSupported()
+
+    from urllib.parse import urljoin
+    return urljoin(resp.url, location)
+
+
+def query_upload_offset(upload_url, size):
+    resp = get_session().put(upload_url, headers={"content-range": f'bytes */{size}'}, verify=False)
+    if resp.status_code == 308:
+        return get_acknowledged_offset(resp, 0), None
+    resp.raise_for_status()
+    return size, resp
+
+
+def upload_media_resumable(endpoint, file, progress=None, chunk_size=RESUMABLE_UPLOAD_CHUNK_SIZE,
+                           max_retries=RESUMABLE_UPLOAD_MAX_RETRIES, retry_delay=RESUMABLE_UPLOAD_RETRY_DELAY):
+    size = get_file_size(file)
+    upload_url = start_resumable_upload(endpoint, size, 'application/octet-stream')
+
+    offset = 0
+    retries = 0
+    while True:
+        try:
+            end = min(offset + chunk_size, size)
+            file.seek(offset)
+            resp = get_session().put(upload_url, data=file.read(end - offset), headers={
+                "content-type": "application/octet-stream",
+                "content-range": f'bytes {offset}-{end - 1}/{size}'
+            }, verify=False)
+            if resp.status_code == 308:
+                offset = get_acknowledged_offset(resp, end)
+                retries = 0
+                if progress:
+                    progress(offset, size)
+                continue
+
+            resp.raise_for_status()
+            if progress:
+                progress(size, size)
+            return get_media_data(resp.json())
+
+        except requests.RequestException as err:
+            retries += 1
+            if not is_retryable(err) or retries > max_retries:
+                raise
+            time.sleep(retry_delay * 2 ** (retries - 1))
+
+            # Resume from the last offset the server has received.
+            try:
+                offset, resp = query_upload_offset(upload_url, size)
+                if resp is not None:
+                    return get_media_data(resp.json())
+            except requests.RequestException:
+                pass
+
+
+def upload_media(endpoint, file, progress=None):
+    if get_file_size(file) > 0 and resumable_upload_support.get(endpoint, True):
+        try:
+            return upload_media_resumable(endpoint, file, progress=progress)
+        except ResumableUploadNotSupported:
+            pass
+
+    body = MultipartUploadStream(file, 'media', 'glb', 'application/octet-stream', progress=progress)
+    headers = {
+        "content-type": body.content_type,
+        "content-length": str(len(body))
     }
+    resp = get_session().post(f'{endpoint}/api/v1/media', data=body, headers=headers, verify=False)
+    return get_media_data(resp.json())
 
 
 def publish_scene(endpoint, token, scene_data, scene_id=None):
@@ -52,9 +273,12 @@ def publish_scene(endpoint, token, scene_data, scene_id=None):
 
     url = f'{endpoint}/api/v1/scenes{"/" + scene_id if scene_id else ""}'
     if scene_id:
-        resp = requests.put(url, body, headers=headers)
+        resp = get_session().put(url, body, headers=headers)
     else:
-        resp = requests.post(url, body, headers=headers)
+        resp = get_session().post(url, body, headers=headers)
+
+    if is_upload_not_found_response(resp):
+        raise UploadNotFound(resp.text)
 
     jsonFile = resp.json()
     if "error" in jsonFile:
@@ -73,7 +297,7 @@ def get_projects(endpoint, token):
         "authorization": f'Bearer {token}'
     }
 
-    resp = requests.get(
+    resp = get_session().get(
         f'{endpoint}/api/v1/scenes/projectless', headers=headers)
 
     jsonFile = resp.json()
@@ -88,3 +312,147 @@ def get_projects(endpoint, token):
         raise Exception(f'Projects request error')
     scenes = jsonFile.get("scenes")
     return scenes
+
+
+def get_upload_manifest_path():
+    return os.path.join(get_prefs_dir_path(), UPLOAD_MANIFEST_FILE)
+
+
+def load_upload_manifest():
+    try:
+        with open(get_upload_manifest_path(), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_upload_manifest(manifest):
+    create_prefs_dir()
+    path = get_upload_manifest_path()
+    # The manifest has access tokens, keep it private to the user.
+    with os.fdopen(os.open(f'{path}.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+        json.dump(manifest, f)
+    os.replace(f'{path}.tmp', path)
+
+
+def get_file_hash(file):
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: file.read(UPLOAD_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    file.seek(0)
+    return hasher.hexdigest()
+
+
+def get_upload_manifest_key(endpoint, file_hash):
+    return f'{endpoint}|{file_hash}'
+
+
+def get_manifest_upload(endpoint, file_hash):
+    with upload_manifest_lock:
+        entry = load_upload_manifest().get(get_upload_manifest_key(endpoint, file_hash))
+    if not entry or entry["expires"] <= time.time():
+        return None
+    return {
+        "file_id": entry["file_id"],
+        "access_token": entry["access_token"]
+    }
+
+
+def add_manifest_upload(endpoint, file_hash, data):
+    with upload_manifest_lock:
+        now = time.time()
+        manifest = {key: entry for key, entry in load_upload_manifest().items() if entry["expires"] > now}
+        manifest[get_upload_manifest_key(endpoint, file_hash)] = {
+            "file_id": data["file_id"],
+            "access_token": data["access_token"],
+            "expires": now + UPLOAD_MANIFEST_EXPIRY
+        }
+        save_upload_manifest(manifest)
+
+
+def remove_manifest_upload(endpoint, file_hash):
+    with upload_manifest_lock:
+        manifest = load_upload_manifest()
+        if manifest.pop(get_upload_manifest_key(endpoint, file_hash), None):
+            save_upload_manifest(manifest)
+
+
+class PublishJob:
+    """Uploads the scene files concurrently and publishes the scene from a background thread.
+    The UI polls the job's progress and state until it's done."""
+
+    def __init__(self, endpoint, token, scene_data, model_path, screenshot_path=None, scene_id=None):
+        self.endpoint = endpoint
+        self.token = token
+        self.scene_data = dict(scene_data)
+        self.scene_id = scene_id
+        self.uploads = {"model": model_path}
+        if screenshot_path:
+            self.uploads["screenshot"] = screenshot_path
+        self.uploaded_bytes = {key: 0 for key in self.uploads}
+        self.total_bytes = {key: os.path.getsize(path) for key, path in self.uploads.items()}
+        self.reused_uploads = {}
+        self.result = None
+        self.error = None
+        self.done = False
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="HubsPublishJob", daemon=True)
+        self._thread.start()
+
+    @property
+    def progress(self):
+        total = sum(self.total_bytes.values())
+        return sum(self.uploaded_bytes.values()) / total if total else 1.0
+
+    def upload(self, key, use_manifest=True):
+        def progress(read, length):
+            self.uploaded_bytes[key] = min(read, self.total_bytes[key])
+
+        with open(self.uploads[key], "rb") as file:
+            file_hash = get_file_hash(file)
+            data = get_manifest_upload(self.endpoint, file_hash) if use_manifest else None
+            if data:
+                self.reused_uploads[key] = file_hash
+                self.uploaded_bytes[key] = self.total_bytes[key]
+                return data
+
+            data = upload_media(self.endpoint, file, progress=progress)
+            add_manifest_upload(self.endpoint, file_hash, data)
+            return data
+
+    def upload_all(self, use_manifest=True):
+        with ThreadPoolExecutor(max_workers=len(self.uploads)) as executor:
+            futures = {key: executor.submit(self.upload, key, use_manifest) for key in self.uploads}
+            results = {key: future.result() for key, future in futures.items()}
+
+        scene_data = dict(self.scene_data)
+        for key, data in results.items():
+            scene_data.update({
+                f'{key}_file_id': data["file_id"],
+                f'{key}_file_token': data["access_token"]
+            })
+        return scene_data
+
+    def run(self):
+        try:
+            self.reused_uploads = {}
+            scene_data = self.upload_all()
+            try:
+                self.result = publish_scene(self.endpoint, self.token, scene_data, self.scene_id)
+            except UploadNotFound:
+                if not self.reused_uploads:
+                    raise
+                # Some of the reused uploads are not valid anymore, so upload everything again.
+                for file_hash in self.reused_uploads.values():
+                    remove_manifest_upload(self.endpoint, file_hash)
+                self.reused_uploads = {}
+                scene_data = self.upload_all(use_manifest=False)
+                self.result = publish_scene(self.endpoint, self.token, scene_data, self.scene_id)
+
+        except Exception as err:
+            self.error = err
+
+        finally:
+            self.done = True
@@ -8,7 +8,7 @@ import inspect
 import os
 from os.path import join, isfile, isdir, dirname, realpath
 
-from .hubs_component import HubsComponent
+from .hubs_component import HubsComponent, definitions_cache
 
 
 class HubsComponentName(PropertyGroup):
@@ -86,6 +86,8 @@ def get_component_module_name(component_class):
 
 
 def register_component(component_class):
+    global __components_registry
+    global __components_registry_by_id
     component_module_name = get_component_module_name(component_class)
     if component_module_name:
         print(f"Registering component: {component_module_name} - {component_class.get_name()}")
@@ -126,9 +128,23 @@ def register_component(component_class):
     from ..io.gltf_exporter import glTF2ExportUserExtension
     glTF2ExportUserExtension.add_excluded_property(component_class.get_id())
 
+    from ..io.utils import get_import_plan, get_export_plan
+    get_import_plan(component_class)
+    get_export_plan(component_class)
+
+    __components_registry[component_class.get_name()] = component_class
+    __components_registry_by_id[component_id] = component_class
+
 
 def unregister_component(component_class):
+    global __components_registry
+    global __components_registry_by_id
     component_id = component_class.get_id()
+    if __components_registry.get(component_class.get_name()) is component_class:
+        del __components_registry[component_class.get_name()]
+    if __components_registry_by_id.get(component_id) is component_class:
+        del __components_registry_by_id[component_id]
+
     if component_class.get_node_type() == NodeType.SCENE:
         delattr(bpy.types.Scene, component_id)
     elif component_class.get_node_type() == NodeType.NODE:
@@ -143,12 +159,19 @@ def unregister_component(component_class):
     from ..io.gltf_exporter import glTF2ExportUserExtension
     glTF2ExportUserExtension.remove_excluded_property(component_class.get_id())
 
+    from ..io.utils import import_plans, export_plans
+    import_plans.pop(component_class, None)
+    export_plans.pop(component_class, None)
+
     component_module_name = get_component_module_name(component_class)
     if component_module_name:
         print(f"Component unregistered: {component_module_name} - {component_class.get_name()}")
     else:
         print(f"Component unregistered: {component_class.get_name()}")
 
+    # Reloaded user components are new classes, don't keep the definitions of the old ones around.
+    definitions_cache.pop(component_class, None)
+
 
 def load_user_components():
     global __components_registry
@@ -159,7 +182,6 @@ def load_user_components():
                     if hasattr(module, 'register_module'):
                         module.register_module()
                     register_component(member)
-                    __components_registry[member.get_name()] = member
                 except Exception:
                     import traceback
                     traceback.print_exc()
@@ -167,7 +189,7 @@ def load_user_components():
 
 def unload_user_components():
     global __components_registry
-    for _, component_class in __components_registry.items():
+    for component_class in list(__components_registry.values()):
         for module_name in get_user_component_names():
             if module_name == component_class.get_name():
                 unregister_component(component_class)
@@ -179,14 +201,15 @@ def unload_user_components():
 def load_components_registry():
     """Recurse in the components directory to build the components registry"""
     global __components_registry
+    global __components_registry_by_id
     __components_registry = {}
+    __components_registry_by_id = {}
     for module in get_component_definitions():
         for _, member in inspect.getmembers(module):
             if inspect.isclass(member) and issubclass(member, HubsComponent) and module.__name__ == member.__module__:
                 if hasattr(module, 'register_module'):
                     module.register_module()
                 register_component(member)
-                __components_registry[member.get_name()] = member
 
     # When running Blender in factory startup mode and specifying an addon, that addon's register function is called.
     # As preferences are not available until the addon is enabled, the user component load fails when accessing them.
@@ -199,7 +222,7 @@ def load_components_registry():
 def unload_components_registry():
     """Recurse in the components directory to unload the registered components"""
     global __components_registry
-    for _, component_class in __components_registry.items():
+    for component_class in list(__components_registry.values()):
         unregister_component(component_class)
     for module in get_component_definitions():
         if hasattr(module, 'unregister_module'):
@@ -207,6 +230,7 @@ def unload_components_registry():
 
 
 __components_registry = {}
+__components_registry_by_id = {}
 
 
 def get_components_registry():
@@ -216,10 +240,12 @@ def get_components_registry():
 
 def get_component_by_name(component_name):
     global __components_registry
-    return next(
-        (component_class for _, component_class in __components_registry.items()
-         if component_class.get_name() == component_name),
-        None)
+    return __components_registry.get(component_name)
+
+
+def get_component_by_id(component_id):
+    global __components_registry_by_id
+    return __components_registry_by_id.get(component_id)
 
 
 def register():
@@ -259,4 +285,7 @@ def unregister():
     unload_components_registry()
 
     global __components_registry
+    global __components_registry_by_id
     del __components_registry
+    del __components_registry_by_id
+    definitions_cache.clear()
@@ -1,4 +1,4 @@
-from ..models import link
+from ..models import load_model
 from ..gizmos import CustomModelGizmo, bone_matrix_world
 from bpy.props import StringProperty
 from ..hubs_component import HubsComponent
@@ -43,7 +43,7 @@ class Link(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", link.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_model("link"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
@@ -1,6 +1,6 @@
 from bpy.props import FloatVectorProperty
 from ..hubs_component import HubsComponent
-from ..gizmos import update_gizmos
+from ..gizmos import update_gizmos_for_host
 from ..types import Category, PanelType, NodeType
 from mathutils import Matrix, Quaternion
 from math import radians
@@ -24,7 +24,7 @@ class Mirror(HubsComponent):
                                size=3,
                                min=0,
                                max=1,
-                               update=lambda self, context: update_gizmos())
+                               update=lambda self, context: update_gizmos_for_host(self))
 
     def draw(self, context, layout, panel_type):
         super().draw(context, layout, panel_type)
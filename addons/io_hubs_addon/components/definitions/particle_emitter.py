@@ -2,8 +2,8 @@ from bpy.props import FloatProperty, EnumProperty, FloatVectorProperty, StringPr
 from ..hubs_component import HubsComponent
 from ..types import Category, NodeType, PanelType, MigrationType
 from ..consts import INTERPOLATION_MODES
-from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos
-from ..models import particle_emitter
+from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos_for_host
+from ..models import load_model
 from ..utils import is_linked, get_host_reference_message
 import bpy
 from mathutils import Vector
@@ -65,7 +65,7 @@ class ParticleEmitter(HubsComponent):
                                     size=4,
                                     min=0,
                                     max=1,
-                                    update=lambda self, context: update_gizmos())
+                                    update=lambda self, context: update_gizmos_for_host(self))
 
     startOpacity: FloatProperty(
         name="Start Opacity", description="Start Opacity", default=1.0)
@@ -149,7 +149,7 @@ class ParticleEmitter(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", particle_emitter.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_model("particle_emitter"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
@@ -1,6 +1,6 @@
 from ..operators import OpenImage
 import bpy
-from bpy.props import PointerProperty, EnumProperty, StringProperty, BoolProperty, CollectionProperty
+from bpy.props import PointerProperty, EnumProperty, StringProperty, BoolProperty, CollectionProperty, IntProperty
 from bpy.types import Image, PropertyGroup, Operator
 
 from ...components.utils import is_gpu_available, redraw_component_ui, is_linked, update_image_editors
@@ -11,8 +11,13 @@ from ..types import Category, PanelType, NodeType
 from ..ui import add_link_indicator
 from ...utils import rgetattr, rsetattr
 from ...io.utils import import_component, assign_property
+from ..probe_bake_worker import setup_probe_camera
+import atexit
+import json
 import math
 import os
+import subprocess
+import time
 
 
 DEFAULT_RESOLUTION_ITEMS = [
@@ -32,6 +37,21 @@ RESOLUTION_ITEMS = DEFAULT_RESOLUTION_ITEMS[:]
 
 probe_baking = False
 bake_mode = None
+# Running background bake worker processes, they are terminated when the bake is cancelled or Blender quits.
+bake_workers = []
+
+
+def terminate_bake_workers():
+    for process in bake_workers:
+        if process.poll() is None:
+            process.terminate()
+    for process in bake_workers:
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    bake_workers.clear()
 
 
 def get_resolutions(self, context):
@@ -86,6 +106,18 @@ def get_probe_image_path(probe):
     return f"{bpy.app.tempdir}/{probe.name}.hdr"
 
 
+def get_view_suffix(index):
+    return f"_hubs_probe_{index}"
+
+
+def get_batch_image_path():
+    return f"{bpy.app.tempdir}/hubs_probe_batch.hdr"
+
+
+def get_batch_view_image_path(index):
+    return f"{bpy.app.tempdir}/hubs_probe_batch{get_view_suffix(index)}.hdr"
+
+
 def import_menu_draw(self, context):
     self.layout.operator("image.hubs_import_reflection_probe_envmaps",
                          text="Import Reflection Probe EnvMaps")
@@ -115,6 +147,29 @@ class ReflectionProbeSceneProps(PropertyGroup):
         name="Use Compositor",
         description="Controls whether the baked images will be processed by the compositor after baking", default=False)
 
+    batch_bake: BoolProperty(
+        name="Batch Bake",
+        description="Bake all the probes in a single multi-view render so the scene is only synced once. Recommended for scenes with many probes. Not used by background bakes",
+        default=False)
+
+    background_bake: BoolProperty(
+        name="Background Bake",
+        description="Bake the probes with background Blender processes using CPU Cycles, so Blender can still be used while baking",
+        default=False)
+
+    bake_processes: IntProperty(
+        name="Bake Processes",
+        description="Number of background Blender processes used for baking, each one bakes a part of the probes",
+        default=2,
+        min=1,
+        max=64)
+
+    bake_timeout: IntProperty(
+        name="Bake Timeout (s)",
+        description="Stop the background bake when no probe has finished baking for this many seconds. 0 disables the timeout",
+        default=900,
+        min=0)
+
 
 class BakeProbeOperator(Operator):
     bl_idname = "render.hubs_render_reflection_probe"
@@ -164,8 +219,9 @@ class BakeProbeOperator(Operator):
 
         self.rendering = False
         self.probe_is_setup = False
+        self.render_times.append(time.perf_counter() - self.render_start_time)
 
-        if self.probe_index == 0:
+        if self.batch or self.probe_index == 0:
             self.done = True
         else:
             self.probe_index -= 1
@@ -213,6 +269,10 @@ class BakeProbeOperator(Operator):
                 draw, title="Active probe locked", icon='ERROR')
             return {'CANCELLED'}
 
+        self.background = context.scene.hubs_scene_reflection_probe_properties.background_bake
+        if self.background:
+            return self.start_background_bake(context)
+
         bpy.app.handlers.render_post.append(self.render_post)
         bpy.app.handlers.render_cancel.append(self.render_cancelled)
 
@@ -228,6 +288,22 @@ class BakeProbeOperator(Operator):
             'Temp EnvMap Camera', self.camera_data)
         bpy.context.scene.collection.objects.link(self.camera_object)
 
+        # Batch bakes render every probe as a view of a single multi-view render, so they need a camera per probe.
+        self.batch = context.scene.hubs_scene_reflection_probe_properties.batch_bake and len(self.probes) > 1
+        self.view_cameras = []
+        self.added_views = []
+        self.saved_views_use = {}
+        if self.batch:
+            for index in range(len(self.probes)):
+                camera_data = bpy.data.cameras.new(name=f'Temp EnvMap Camera{get_view_suffix(index)}')
+                camera_object = bpy.data.objects.new(
+                    f'{self.camera_object.name}{get_view_suffix(index)}', camera_data)
+                bpy.context.scene.collection.objects.link(camera_object)
+                self.view_cameras.append((camera_object, camera_data))
+
+        self.bake_start_time = time.perf_counter()
+        self.render_start_time = self.bake_start_time
+        self.render_times = []
         self.saved_props = {}
         self.preferences_is_dirty_state = bpy.context.preferences.is_dirty
         self.cancelled = False
@@ -243,6 +319,9 @@ class BakeProbeOperator(Operator):
     def modal(self, context, event):
         global probe_baking
 
+        if self.background:
+            return self.modal_background(context, event)
+
         # print("ev: %s" % event.type)
         if event.type == 'TIMER':
             if self.cancelled or self.done:
@@ -253,72 +332,59 @@ class BakeProbeOperator(Operator):
 
                 bpy.context.scene.collection.objects.unlink(self.camera_object)
                 bpy.data.cameras.remove(self.camera_data)
+                for camera_object, camera_data in self.view_cameras:
+                    bpy.context.scene.collection.objects.unlink(camera_object)
+                    bpy.data.cameras.remove(camera_data)
 
                 self.restore_render_props()
+                self.restore_render_views(context)
                 self.rendering = False
                 self.probe_is_setup = False
 
+                if self.batch and not self.cancelled:
+                    # Move the view images to where the probes expect them.
+                    for index, probe in enumerate(self.probes):
+                        view_path = get_batch_view_image_path(index)
+                        if os.path.exists(view_path):
+                            os.replace(view_path, get_probe_image_path(probe))
+                        else:
+                            self.cancelled = True
+                            self.report(
+                                {'ERROR'}, 'Reflection probe baking error: missing batch render output for probe %s' % probe.name)
+
                 if self.cancelled:
-                    for probe in self.probes:
+                    for index, probe in enumerate(self.probes):
                         img_path = get_probe_image_path(probe)
                         if os.path.exists(img_path):
                             os.remove(img_path)
+                        view_path = get_batch_view_image_path(index)
+                        if os.path.exists(view_path):
+                            os.remove(view_path)
                     self.report(
                         {'WARNING'}, 'Reflection probe baking cancelled')
                     return {"CANCELLED"}
 
                 for probe in self.probes:
-                    probe_component = probe.hubs_component_reflection_probe
-                    old_img = probe_component.envMapTexture
-                    image_name = f"generated_cubemap-{probe.name}"
-                    # Store the old image's name in case of name juggling.
-                    old_img_name = old_img.name if old_img else ""
-
-                    conflicting_img = None
-                    for img in bpy.data.images:
-                        if img.name == image_name and not is_linked(img):
-                            conflicting_img = img
-                            break
-
-                    if conflicting_img and conflicting_img != old_img:
-                        # Rename the conflicting image to help avoid problems caused by Blender's name juggling and allow name juggled images to be more easily found.
-                        conflicting_img.name = f"{conflicting_img.name}-old"
-
-                    img_path = get_probe_image_path(probe)
-                    img = bpy.data.images.load(filepath=img_path)
-                    img.name = image_name
-                    if old_img:
-                        if image_name == old_img_name and not is_linked(old_img):
-                            old_img.user_remap(img)
-                            bpy.data.images.remove(old_img)
-                        else:
-                            update_image_editors(old_img, img)
-
-                    probe_component['envMapTexture'] = img
-
-                    # Pack image and update filepaths so that it displays/unpacks nicely for the user.
-                    # Note: updating the filepaths prints an error to the terminal, but otherwise seems to work fine.
-                    img.pack()
-                    new_filepath = f"//{image_name}.hdr"
-                    img.packed_files[0].filepath = new_filepath
-                    img.filepath_raw = new_filepath
-                    img.filepath = new_filepath
-                    if os.path.exists(img_path):
-                        os.remove(img_path)
+                    self.assign_baked_image(probe)
 
                 props = context.scene.hubs_scene_reflection_probe_properties
                 props.render_resolution = props.resolution
 
+                self.report_timings()
                 self.report({'INFO'}, 'Reflection probe baking finished')
                 return {"FINISHED"}
 
             elif not self.rendering:
                 try:
                     if not self.probe_is_setup:
-                        self.setup_probe_render(context)
+                        if self.batch:
+                            self.setup_batch_render(context)
+                        else:
+                            self.setup_probe_render(context)
 
                     # Rendering can sometimes fail if the old render is still being cleaned up.  Keep trying until it works.
                     # For more details see https://developer.blender.org/T52258
+                    self.render_start_time = time.perf_counter()
                     if bpy.ops.render.render("INVOKE_DEFAULT", write_still=True) != {'CANCELLED'}:
                         self.rendering = True
 
@@ -336,32 +402,210 @@ class BakeProbeOperator(Operator):
         bpy.context.preferences.is_dirty = self.preferences_is_dirty_state
         self.preferences_is_dirty_state = None
 
-    def setup_probe_render(self, context):
-        probe = self.probes[self.probe_index]
+    def assign_baked_image(self, probe):
+        probe_component = probe.hubs_component_reflection_probe
+        old_img = probe_component.envMapTexture
+        image_name = f"generated_cubemap-{probe.name}"
+        # Store the old image's name in case of name juggling.
+        old_img_name = old_img.name if old_img else ""
+
+        conflicting_img = None
+        for img in bpy.data.images:
+            if img.name == image_name and not is_linked(img):
+                conflicting_img = img
+                break
+
+        if conflicting_img and conflicting_img != old_img:
+            # Rename the conflicting image to help avoid problems caused by Blender's name juggling and allow name juggled images to be more easily found.
+            conflicting_img.name = f"{conflicting_img.name}-old"
+
+        img_path = get_probe_image_path(probe)
+        img = bpy.data.images.load(filepath=img_path)
+        img.name = image_name
+        if old_img:
+            if image_name == old_img_name and not is_linked(old_img):
+                old_img.user_remap(img)
+                bpy.data.images.remove(old_img)
+            else:
+                update_image_editors(old_img, img)
 
-        self.camera_data.type = "PANO"
-        self.camera_data.cycles.panorama_type = "EQUIRECTANGULAR"
+        probe_component['envMapTexture'] = img
 
-        self.camera_data.cycles.longitude_min = -math.pi
-        self.camera_data.cycles.longitude_max = math.pi
-        self.camera_data.cycles.latitude_min = -math.pi / 2
-        self.camera_data.cycles.latitude_max = math.pi / 2
+        # Pack image and update filepaths so that it displays/unpacks nicely for the user.
+        # Note: updating the filepaths prints an error to the terminal, but otherwise seems to work fine.
+        img.pack()
+        new_filepath = f"//{image_name}.hdr"
+        img.packed_files[0].filepath = new_filepath
+        img.filepath_raw = new_filepath
+        img.filepath = new_filepath
+        if os.path.exists(img_path):
+            os.remove(img_path)
 
-        self.camera_data.clip_start = probe.data.clip_start
-        self.camera_data.clip_end = probe.data.clip_end
+    def start_background_bake(self, context):
+        global probe_baking, bake_mode
 
-        self.camera_object.matrix_world = probe.matrix_world.copy()
-        self.camera_object.rotation_euler.x += math.pi / 2
-        self.camera_object.rotation_euler.z += -math.pi / 2
+        props = context.scene.hubs_scene_reflection_probe_properties
+        (x, y) = [int(i) for i in props.resolution.split('x')]
+        num_processes = min(props.bake_processes, len(self.probes))
+
+        # The workers bake from a copy of the file so the current session isn't affected.
+        self.temp_blend_path = os.path.join(bpy.app.tempdir, "hubs_probe_bake.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=self.temp_blend_path, copy=True, check_existing=False)
+
+        for probe in self.probes:
+            img_path = get_probe_image_path(probe)
+            if os.path.exists(img_path):
+                os.remove(img_path)
+
+        worker_path = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "probe_bake_worker.py")
+        self.workers = []
+        for worker_index in range(num_processes):
+            worker_probes = self.probes[worker_index::num_processes]
+            config = {
+                "scene": context.scene.name,
+                "probes": [(probe.name, get_probe_image_path(probe)) for probe in worker_probes],
+                "resolution_x": x,
+                "resolution_y": y,
+                "use_compositor": props.use_compositor,
+                "threads": max(1, (os.cpu_count() or 1) // num_processes),
+            }
+            log_path = os.path.join(bpy.app.tempdir, f"hubs_probe_bake_worker_{worker_index}.log")
+            log_file = open(log_path, "w")
+            try:
+                process = subprocess.Popen(
+                    [bpy.app.binary_path, "-b", self.temp_blend_path, "--python", worker_path, "--", json.dumps(config)],
+                    stdout=log_file, stderr=subprocess.STDOUT)
+            except OSError as err:
+                log_file.close()
+                self.stop_background_workers()
+                self.report({'ERROR'}, 'Failed to start a reflection probe bake worker: %s' % err)
+                return {'CANCELLED'}
+            bake_workers.append(process)
+            self.workers.append((process, worker_probes, log_file, log_path))
 
+        self._timer = context.window_manager.event_timer_add(
+            0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+
+        self.bake_start_time = time.perf_counter()
+        self.num_baked = 0
+        self.last_bake_time = self.bake_start_time
+        bake_mode = self.bake_mode
+        probe_baking = True
+
+        self.report({'INFO'}, 'Baking %d probes with %d background processes' % (len(self.probes), num_processes))
+        return {"RUNNING_MODAL"}
+
+    def stop_background_workers(self):
+        """Terminates the workers that are still running and removes the files used by them."""
+        terminate_bake_workers()
+        for _, _, log_file, _ in self.workers:
+            log_file.close()
+        if os.path.exists(self.temp_blend_path):
+            os.remove(self.temp_blend_path)
+
+    def finish_background_bake(self, context):
+        global probe_baking
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        probe_baking = False
+        self.stop_background_workers()
+
+        # Keep the probes that were baked, even if the bake didn't finish.
+        num_failed = 0
+        for _, worker_probes, _, _ in self.workers:
+            for probe in worker_probes:
+                try:
+                    if os.path.exists(get_probe_image_path(probe)):
+                        self.assign_baked_image(probe)
+                        continue
+                except ReferenceError:
+                    # The probe was removed while baking.
+                    pass
+                num_failed += 1
+        return num_failed
+
+    def cancel(self, context):
+        # Called when the modal handler is removed without finishing, ie. when loading another file or quitting.
+        if self.background:
+            self.finish_background_bake(context)
+
+    def modal_background(self, context, event):
+        if event.type == 'ESC':
+            self.finish_background_bake(context)
+            redraw_component_ui(context)
+            self.report({'WARNING'}, 'Reflection probe baking cancelled')
+            return {"CANCELLED"}
+
+        if event.type != 'TIMER':
+            return {"PASS_THROUGH"}
+
+        num_baked = len([probe for probe in self.probes if os.path.exists(get_probe_image_path(probe))])
+        context.workspace.status_text_set(
+            f"Baking reflection probes in the background: {num_baked}/{len(self.probes)} (Esc to cancel)")
+
+        now = time.perf_counter()
+        if num_baked != self.num_baked:
+            self.num_baked = num_baked
+            self.last_bake_time = now
+        timeout = context.scene.hubs_scene_reflection_probe_properties.bake_timeout
+        timed_out = timeout > 0 and now - self.last_bake_time > timeout
+
+        if not timed_out and any(process.poll() is None for process, _, _, _ in self.workers):
+            return {"PASS_THROUGH"}
+
+        if timed_out:
+            self.report({'ERROR'}, 'Reflection probe bake workers stopped, no probe finished baking in %ds' % timeout)
+        else:
+            for process, _, _, log_path in self.workers:
+                if process.returncode != 0:
+                    self.report({'ERROR'}, 'Reflection probe bake worker failed, see %s for details' % log_path)
+        num_failed = self.finish_background_bake(context)
+
+        props = context.scene.hubs_scene_reflection_probe_properties
+        props.render_resolution = props.resolution
+        redraw_component_ui(context)
+
+        total_time = time.perf_counter() - self.bake_start_time
+        if num_failed:
+            self.report({'WARNING'}, 'Reflection probe baking finished in %.2fs, %d probes failed to bake' %
+                        (total_time, num_failed))
+        else:
+            self.report({'INFO'}, 'Reflection probe baking finished in %.2fs' % total_time)
+        return {"FINISHED"}
+
+    def restore_render_views(self, context):
+        views = context.scene.render.views
+        for view_name in self.added_views:
+            view = views.get(view_name)
+            if view:
+                views.remove(view)
+        for view_name, use in self.saved_views_use.items():
+            view = views.get(view_name)
+            if view:
+                view.use = use
+        self.added_views = []
+        self.saved_views_use = {}
+
+    def report_timings(self):
+        total_time = time.perf_counter() - self.bake_start_time
+        if self.batch:
+            self.report({'INFO'}, 'Baked %d probes in %.2fs in a single render (%.2fs per probe)' %
+                        (len(self.probes), total_time, total_time / len(self.probes)))
+        else:
+            # The probes are baked from last to first.
+            for probe, render_time in zip(reversed(self.probes), self.render_times):
+                self.report({'INFO'}, 'Baked probe %s in %.2fs' % (probe.name, render_time))
+            self.report({'INFO'}, 'Baked %d probes in %.2fs' % (len(self.probes), total_time))
+
+    def apply_render_overrides(self, context, camera_object, output_path, extra_overrides=()):
         resolution = context.scene.hubs_scene_reflection_probe_properties.resolution
         (x, y) = [int(i) for i in resolution.split('x')]
-        output_path = get_probe_image_path(probe)
         use_compositor = context.scene.hubs_scene_reflection_probe_properties.use_compositor
 
         overrides = [
             ("preferences.view.render_display_type", "NONE"),
-            ("scene.camera", self.camera_object),
+            ("scene.camera", camera_object),
             ("scene.render.engine", "CYCLES"),
             ("scene.cycles.device", "GPU" if is_gpu_available(context) else "CPU"),
             ("scene.render.resolution_x", x),
@@ -371,16 +615,54 @@ class BakeProbeOperator(Operator):
             ("scene.render.filepath", output_path),
             ("scene.render.use_compositing", use_compositor),
             ("scene.use_nodes", use_compositor)
-        ]
+        ] + list(extra_overrides)
 
         for (prop, value) in overrides:
             if prop not in self.saved_props:
                 self.saved_props[prop] = rgetattr(bpy.context, prop)
             rsetattr(bpy.context, prop, value)
 
+    def setup_probe_render(self, context):
+        probe = self.probes[self.probe_index]
+
+        setup_probe_camera(self.camera_object, self.camera_data, probe)
+        self.apply_render_overrides(context, self.camera_object, get_probe_image_path(probe))
+
         self.report({'INFO'}, 'Baking probe %s' % probe.name)
         self.probe_is_setup = True
 
+    def setup_batch_render(self, context):
+        # Every probe gets its own view in a multi-view render.  Blender looks up the camera of each view by replacing
+        # the view suffix the scene camera's name ends with by the view's suffix, so the scene camera has to be one
+        # of the view cameras.  Each view is saved to its own file with the suffix added.
+        views = context.scene.render.views
+        for view in views:
+            if view.name not in self.saved_views_use:
+                self.saved_views_use[view.name] = view.use
+            view.use = False
+
+        for index, probe in enumerate(self.probes):
+            camera_object, camera_data = self.view_cameras[index]
+            setup_probe_camera(camera_object, camera_data, probe)
+
+            view = views.new(f"Hubs Probe {index}")
+            view.camera_suffix = get_view_suffix(index)
+            view.use = True
+            self.added_views.append(view.name)
+
+            expected_name = f"{self.camera_object.name}{view.camera_suffix}"
+            if camera_object.name != expected_name:
+                raise Exception(f"Can't batch bake, the object name {expected_name} is already in use")
+
+        self.apply_render_overrides(context, self.view_cameras[0][0], get_batch_image_path(), [
+            ("scene.render.use_multiview", True),
+            ("scene.render.views_format", "MULTIVIEW"),
+            ("scene.render.image_settings.views_format", "INDIVIDUAL"),
+        ])
+
+        self.report({'INFO'}, 'Baking %d probes in a single render' % len(self.probes))
+        self.probe_is_setup = True
+
 
 class OpenReflectionProbeEnvMap(OpenImage):
     bl_idname = "image.hubs_open_reflection_probe_envmap"
@@ -824,6 +1106,24 @@ class ReflectionProbe(HubsComponent):
             row = col.row()
             row.prop(
                 context.scene.hubs_scene_reflection_probe_properties, "use_compositor")
+            sub_row = row.row()
+            # Background bakes always render the probes one by one.
+            sub_row.enabled = not props.background_bake
+            sub_row.prop(
+                context.scene.hubs_scene_reflection_probe_properties, "batch_bake")
+
+            row = col.row()
+            row.prop(
+                context.scene.hubs_scene_reflection_probe_properties, "background_bake")
+            if context.scene.hubs_scene_reflection_probe_properties.background_bake:
+                row.prop(
+                    context.scene.hubs_scene_reflection_probe_properties, "bake_processes")
+                row = col.row()
+                row.prop(
+                    context.scene.hubs_scene_reflection_probe_properties, "bake_timeout")
+                if props.batch_bake:
+                    row = col.row()
+                    row.label(text="Batch Bake is not used by background bakes.", icon='INFO')
 
             global bake_mode
 
@@ -853,6 +1153,7 @@ class ReflectionProbe(HubsComponent):
 
     @ staticmethod
     def register():
+        atexit.register(terminate_bake_workers)
         bpy.utils.register_class(BakeProbeOperator)
         bpy.utils.register_class(ReflectionProbeSceneProps)
         bpy.utils.register_class(OpenReflectionProbeEnvMap)
@@ -868,6 +1169,11 @@ class ReflectionProbe(HubsComponent):
 
     @ staticmethod
     def unregister():
+        global probe_baking
+        if bake_workers:
+            terminate_bake_workers()
+            probe_baking = False
+        atexit.unregister(terminate_bake_workers)
         bpy.utils.unregister_class(BakeProbeOperator)
         bpy.utils.unregister_class(ReflectionProbeSceneProps)
         bpy.utils.unregister_class(OpenReflectionProbeEnvMap)
@@ -1,7 +1,7 @@
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
 from ..gizmos import CustomModelGizmo
-from ..models import scene_preview_camera
+from ..models import load_model
 from mathutils import Matrix
 from math import radians
 from bpy.types import Operator
@@ -104,7 +104,7 @@ class ScenePreviewCamera(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", scene_preview_camera.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_model("scene_preview_camera"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
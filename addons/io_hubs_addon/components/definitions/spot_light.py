@@ -1,5 +1,5 @@
-from ..models import spot_light
-from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos
+from ..models import load_model
+from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos_for_host
 from bpy.props import FloatVectorProperty, FloatProperty, BoolProperty, IntVectorProperty
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
@@ -24,7 +24,7 @@ class SpotLight(HubsComponent):
                                size=4,
                                min=0,
                                max=1,
-                               update=lambda self, context: update_gizmos())
+                               update=lambda self, context: update_gizmos_for_host(self))
 
     intensity: FloatProperty(name="Intensity",
                              description="Intensity",
@@ -88,7 +88,7 @@ class SpotLight(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", spot_light.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_model("spot_light"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
@@ -1,4 +1,4 @@
-from ..models import spawn_point
+from ..models import load_model
 from ..gizmos import CustomModelGizmo, bone_matrix_world
 from ..types import Category, PanelType, NodeType
 from ..hubs_component import HubsComponent
@@ -68,7 +68,7 @@ class Waypoint(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", spawn_point.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_model("spawn_point"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
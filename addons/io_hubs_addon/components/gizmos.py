@@ -2,6 +2,7 @@ import bpy
 from bpy.types import (Gizmo, GizmoGroup)
 from bpy.props import (IntProperty)
 from .components_registry import get_component_by_name
+from ..preferences import get_addon_pref
 from bpy.app.handlers import persistent
 from math import radians
 from mathutils import Matrix
@@ -11,6 +12,21 @@ def gizmo_update(obj, gizmo):
     gizmo.matrix_basis = obj.matrix_world.normalized()
 
 
+# Gizmo models fit in a unit cube, so use a generous bounding sphere radius (relative to the gizmo scale) for culling.
+GIZMO_CULL_RADIUS = 2.0
+
+# Custom shape batches built from the models' vertex data, shared by all the gizmos using the same shape.
+gizmo_shapes = {}
+
+
+def get_gizmo_shape(shape):
+    cached = gizmo_shapes.get(id(shape))
+    if cached is None or cached[0] is not shape:
+        cached = (shape, Gizmo.new_custom_shape('TRIS', shape))
+        gizmo_shapes[id(shape)] = cached
+    return cached[1]
+
+
 def bone_matrix_world(ob, bone, scaleOverride=None):
     loc, rot, scale = bone.matrix.to_4x4().decompose()
     # Account for bones using Y up
@@ -43,8 +59,7 @@ class CustomModelGizmo(Gizmo):
 
     def setup(self):
         if hasattr(self, "hubs_gizmo_shape"):
-            self.custom_shape = self.new_custom_shape(
-                'TRIS', self.hubs_gizmo_shape)
+            self.custom_shape = get_gizmo_shape(self.hubs_gizmo_shape)
 
     def invoke(self, context, event):
         if hasattr(self, "object") and context.mode == 'OBJECT':
@@ -69,6 +84,16 @@ class HubsGizmoGroup(GizmoGroup):
     has_widgets = False
     windows_processed = 0
 
+    def add_object_gizmos(self, ob):
+        self.add_gizmo(ob, ob, 'OBJECT')
+        if ob.type == 'ARMATURE':
+            if ob.mode == 'EDIT':
+                for edit_bone in ob.data.edit_bones:
+                    self.add_gizmo(ob, edit_bone, 'BONE')
+            else:
+                for bone in ob.data.bones:
+                    self.add_gizmo(ob, bone, 'BONE')
+
     def add_gizmo(self, ob, host, host_type):
         for component_item in host.hubs_component_list.items:
             component_name = component_item.name
@@ -84,24 +109,25 @@ class HubsGizmoGroup(GizmoGroup):
                 if host_key not in self.widgets[component_name]:
                     self.widgets[component_name][host_key] = {
                         'ob': ob,
+                        'ob_name': ob.name_full,
                         'host_name': host.name,
                         'host_type': host_type,
                         'gizmo': gizmo
                     }
 
-    def setup(self, context):
-        # A new instance of the gizmo group is instantiated, and setup is called once for each instance, for each open window.
+    def add_scene_gizmos(self, context):
         self.widgets = {}
+        self.synced_updates = gizmo_updates_offset + len(gizmo_updates)
+        gizmo_updates_synced[self.as_pointer()] = self.synced_updates
+        self.tracked_objects = set()
 
         for ob in context.scene.objects:
-            self.add_gizmo(ob, ob, 'OBJECT')
-            if ob.type == 'ARMATURE':
-                if ob.mode == 'EDIT':
-                    for edit_bone in ob.data.edit_bones:
-                        self.add_gizmo(ob, edit_bone, 'BONE')
-                else:
-                    for bone in ob.data.bones:
-                        self.add_gizmo(ob, bone, 'BONE')
+            self.add_object_gizmos(ob)
+            self.tracked_objects.add(ob.name_full)
+
+    def setup(self, context):
+        # A new instance of the gizmo group is instantiated, and setup is called once for each instance, for each open window.
+        self.add_scene_gizmos(context)
 
         if self.widgets:
             HubsGizmoGroup.has_widgets = True
@@ -113,6 +139,56 @@ class HubsGizmoGroup(GizmoGroup):
                 bpy.app.timers.register(unregister_gizmo_system)
                 return
 
+    def sync_widgets(self, context):
+        """Apply the updates queued by update_gizmos_for_host since the last sync, only adding/removing the widgets of the affected objects."""
+        if self.synced_updates == gizmo_updates_offset + len(gizmo_updates):
+            return
+
+        if self.synced_updates < gizmo_updates_offset:
+            # Some of the updates this instance hasn't applied yet have already been dropped, so re-create all its widgets.
+            self.gizmos.clear()
+            self.add_scene_gizmos(context)
+            return
+
+        pending_updates = gizmo_updates[self.synced_updates - gizmo_updates_offset:]
+        self.synced_updates = gizmo_updates_offset + len(gizmo_updates)
+        gizmo_updates_synced[self.as_pointer()] = self.synced_updates
+        trim_gizmo_updates()
+
+        try:
+            dirty_objects = {ob.as_pointer(): ob for ob in pending_updates if ob is not None}
+            scene_objects = None
+            if None in pending_updates:
+                scene_objects = {ob.name_full: ob for ob in context.scene.objects}
+
+            for component_widgets in self.widgets.values():
+                for host_key, widget in list(component_widgets.items()):
+                    try:
+                        remove = widget['ob'].as_pointer() in dirty_objects
+                    except ReferenceError:
+                        remove = True
+                    if scene_objects is not None and widget['ob_name'] not in scene_objects:
+                        remove = True
+                    if remove:
+                        self.gizmos.remove(widget['gizmo'])
+                        del component_widgets[host_key]
+
+            if scene_objects is not None:
+                self.tracked_objects.intersection_update(scene_objects)
+                for name, ob in scene_objects.items():
+                    if name not in self.tracked_objects and ob.as_pointer() not in dirty_objects:
+                        self.add_object_gizmos(ob)
+                        self.tracked_objects.add(name)
+
+            for ob in dirty_objects.values():
+                if context.scene.objects.get(ob.name) == ob:
+                    self.add_object_gizmos(ob)
+                    self.tracked_objects.add(ob.name_full)
+
+        except (ReferenceError, KeyError):
+            # Fall back to rebuilding all the widgets if the queued objects are no longer valid.
+            bpy.app.timers.register(update_gizmos)
+
     def update_gizmo(self, component_name, ob, bone, target, gizmo):
         component_class = get_component_by_name(component_name)
         component_class.update_gizmo(ob, bone, target, gizmo)
@@ -123,29 +199,111 @@ class HubsGizmoGroup(GizmoGroup):
     def update_bone_gizmo(self, component_name, ob, bone, pose_bone, gizmo):
         self.update_gizmo(component_name, ob, pose_bone, bone, gizmo)
 
+    def update_widget(self, component_name, widget):
+        gizmo = widget['gizmo']
+        ob = widget['ob']
+        host_name = widget['host_name']
+
+        if widget['host_type'] == 'BONE':
+            # https://docs.blender.org/api/current/info_gotcha.html#editbones-posebones-bone-bones
+            if ob.mode == 'EDIT':
+                edit_bone = ob.data.edit_bones[host_name]
+                self.update_bone_gizmo(
+                    component_name, ob, edit_bone, edit_bone, gizmo)
+            else:
+                bone = ob.data.bones[host_name]
+                pose_bone = ob.pose.bones[host_name]
+                self.update_bone_gizmo(
+                    component_name, ob, bone, pose_bone, gizmo)
+        else:
+            self.update_object_gizmo(
+                component_name, ob, gizmo)
+
+        # Store the gizmo's bounds relative to its host so it can be culled without updating it.
+        widget['cull_offset'] = self.get_cull_matrix(widget).inverted_safe() @ gizmo.matrix_basis.translation
+        widget['cull_radius'] = max(gizmo.matrix_basis.to_scale()) * GIZMO_CULL_RADIUS
+
+    def get_cull_matrix(self, widget):
+        """World matrix of the widget's host, bone gizmos follow their bone when it's posed."""
+        ob = widget['ob']
+        if widget['host_type'] == 'BONE':
+            if ob.mode == 'EDIT':
+                return ob.matrix_world @ ob.data.edit_bones[widget['host_name']].matrix
+            return ob.matrix_world @ ob.pose.bones[widget['host_name']].matrix
+        return ob.matrix_world
+
+    def get_cull_view(self, context):
+        rv3d = context.region_data
+        if not rv3d:
+            return None
+
+        cull_distance = get_addon_pref(context).gizmo_cull_distance
+        persp = rv3d.perspective_matrix
+        planes = []
+        for i in range(3):
+            for sign in (1, -1):
+                plane = persp[3] + persp[i] * sign
+                length = plane.xyz.length
+                if length > 0:
+                    planes.append((plane.xyz / length, plane.w / length))
+
+        view_location = rv3d.view_matrix.inverted().translation if rv3d.is_perspective and cull_distance > 0 else None
+        self.cull_view_state = (persp.copy(), cull_distance)
+        return (planes, view_location, cull_distance)
+
+    def is_widget_culled(self, widget, cull_view):
+        """Hide the widget if it's outside of the view frustum or further than the cull distance."""
+        culled = False
+        if cull_view and 'cull_offset' in widget:
+            planes, view_location, cull_distance = cull_view
+            position = self.get_cull_matrix(widget) @ widget['cull_offset']
+            radius = widget['cull_radius']
+            if view_location is not None and (position - view_location).length - radius > cull_distance:
+                culled = True
+            else:
+                culled = any(normal.dot(position) + offset < -radius for normal, offset in planes)
+
+        if culled:
+            widget['gizmo'].hide = True
+        elif widget.get('culled'):
+            # The component's update_gizmo sets its final visibility.
+            widget['gizmo'].hide = False
+        widget['culled'] = culled
+        return culled
+
+    def draw_prepare(self, context):
+        self.sync_widgets(context)
+
+        # Refresh isn't called when only the view changes, so check if any culled widgets have come back into view.
+        rv3d = context.region_data
+        if not rv3d:
+            return
+        if getattr(self, 'cull_view_state', None) == (rv3d.perspective_matrix, get_addon_pref(context).gizmo_cull_distance):
+            return
+
+        cull_view = self.get_cull_view(context)
+        for component_name, component_widgets in self.widgets.items():
+            for widget in component_widgets.values():
+                try:
+                    was_culled = widget.get('culled', False)
+                    if not self.is_widget_culled(widget, cull_view) and was_culled:
+                        self.update_widget(component_name, widget)
+
+                except (ReferenceError, KeyError):
+                    bpy.app.timers.register(update_gizmos)
+                    return
+
     def refresh(self, context):
+        self.sync_widgets(context)
+        cull_view = self.get_cull_view(context)
+
         for component_name in self.widgets:
             component_widgets = self.widgets[component_name].copy()
             for widget in component_widgets.values():
-                gizmo = widget['gizmo']
-                ob = widget['ob']
-                host_name = widget['host_name']
-
                 try:
-                    if widget['host_type'] == 'BONE':
-                        # https://docs.blender.org/api/current/info_gotcha.html#editbones-posebones-bone-bones
-                        if ob.mode == 'EDIT':
-                            edit_bone = ob.data.edit_bones[host_name]
-                            self.update_bone_gizmo(
-                                component_name, ob, edit_bone, edit_bone, gizmo)
-                        else:
-                            bone = ob.data.bones[host_name]
-                            pose_bone = ob.pose.bones[host_name]
-                            self.update_bone_gizmo(
-                                component_name, ob, bone, pose_bone, gizmo)
-                    else:
-                        self.update_object_gizmo(
-                            component_name, ob, gizmo)
+                    if self.is_widget_culled(widget, cull_view):
+                        continue
+                    self.update_widget(component_name, widget)
 
                 except (ReferenceError, KeyError):
                     # ReferenceErrors shouldn't happen, but if objects and widgets have gotten out of sync refresh the whole system.
@@ -157,6 +315,30 @@ class HubsGizmoGroup(GizmoGroup):
 objects_count = -1
 gizmo_system_registered = False
 msgbus_owners = []
+# Objects whose widgets need to be re-created, None means the scene's objects need to be re-checked. Each gizmo group instance keeps track of how many of these updates it has already applied, and the updates applied by all of them are dropped.
+gizmo_updates = []
+# Number of updates dropped from the start of gizmo_updates.
+gizmo_updates_offset = 0
+# Number of updates applied by each gizmo group instance, by pointer.
+gizmo_updates_synced = {}
+# Gizmo groups of hidden or closed 3D views stop applying updates, so stop keeping the updates around for them past this length.
+GIZMO_UPDATES_MAX_LENGTH = 256
+
+
+def trim_gizmo_updates():
+    global gizmo_updates_offset
+    num_updates = gizmo_updates_offset + len(gizmo_updates)
+    synced_updates = min(gizmo_updates_synced.values(), default=num_updates)
+    if num_updates - synced_updates > GIZMO_UPDATES_MAX_LENGTH:
+        # Forget the instances that are too far behind, they re-create all their widgets instead if they sync again.
+        for pointer, instance_synced_updates in list(gizmo_updates_synced.items()):
+            if num_updates - instance_synced_updates > GIZMO_UPDATES_MAX_LENGTH:
+                del gizmo_updates_synced[pointer]
+        synced_updates = min(gizmo_updates_synced.values(), default=num_updates)
+
+    if synced_updates > gizmo_updates_offset:
+        del gizmo_updates[:synced_updates - gizmo_updates_offset]
+        gizmo_updates_offset = synced_updates
 
 
 def msgbus_callback(*args):
@@ -191,11 +373,15 @@ def depsgraph_update_post(dummy):
                         # edited/selected objects can include objects other armatures.
                         continue
                     if len(ob.data.edit_bones) != ob.data.hubs_old_bones_length:
-                        do_gizmo_update = True
+                        queue_gizmo_update(ob)
                         ob.data.hubs_old_bones_length = len(ob.data.edit_bones)
 
     if open_scenes_object_count != objects_count:
-        do_gizmo_update = True
+        if objects_count == -1:
+            do_gizmo_update = True
+        else:
+            # Only the widgets of the added/removed objects need to be updated.
+            queue_gizmo_update(None)
 
     objects_count = open_scenes_object_count
 
@@ -237,6 +423,10 @@ def register_gizmo_system():
 
 
 def register_gizmos():
+    global gizmo_updates_offset
+    gizmo_updates.clear()
+    gizmo_updates_offset = 0
+    gizmo_updates_synced.clear()
     try:
         HubsGizmoGroup.has_widgets = False
         HubsGizmoGroup.windows_processed = 0
@@ -279,6 +469,33 @@ def update_gizmos():
     register_gizmos() if gizmo_system_registered else register_gizmo_system()
 
 
+def queue_gizmo_update(ob):
+    if not gizmo_system_registered:
+        update_gizmos()
+        return
+
+    if not gizmo_updates or gizmo_updates[-1] != ob:
+        gizmo_updates.append(ob)
+        trim_gizmo_updates()
+
+    # Redraw the 3D views so the gizmo groups pick up the update.
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def update_gizmos_for_host(host):
+    """Re-create only the widgets of the object(s) owning the host (an object, bone, or component), instead of rebuilding all the widgets."""
+    id_data = host.id_data
+    if isinstance(id_data, bpy.types.Object):
+        queue_gizmo_update(id_data)
+    else:
+        for ob in bpy.data.objects:
+            if ob.data == id_data:
+                queue_gizmo_update(ob)
+
+
 def register_functions():
     def register():
         global objects_count
@@ -303,6 +520,7 @@ def register_functions():
                 depsgraph_update_post)
 
         unregister_gizmo_system()
+        gizmo_shapes.clear()
 
         del bpy.types.Armature.hubs_old_bones_length
 
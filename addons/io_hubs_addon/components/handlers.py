@@ -6,15 +6,26 @@ from .gizmos import update_gizmos
 from .types import MigrationType, PanelType
 import io
 import sys
+import time
 import traceback
 
-previous_undo_steps_dump = ""
+previous_undo_steps_dump = b""
 previous_undo_step_index = 0
+previous_undo_fingerprint = None
+undo_history_counter = 0
 previous_window_setups = []
 file_loading = False
 msgbus_owners = []
 object_data_switched = False
 
+# Accumulated cost of undo_stack_handler, used to keep track of the per update overhead.
+undo_stack_handler_stats = {
+    "updates": 0,
+    "skipped": 0,
+    "dumps": 0,
+    "total_time": 0.0,
+}
+
 
 def migrate(component, migration_type, panel_type, host, migration_report, ob=None):
     instance_version = tuple(component.instance_version)
@@ -221,10 +232,12 @@ def handle_beta_versioning():
 def load_post(dummy):
     global previous_undo_steps_dump
     global previous_undo_step_index
+    global previous_undo_fingerprint
     global previous_window_setups
     global file_loading
-    previous_undo_steps_dump = ""
+    previous_undo_steps_dump = b""
     previous_undo_step_index = 0
+    previous_undo_fingerprint = None
     previous_window_setups = []
     file_loading = True
 
@@ -232,21 +245,57 @@ def load_post(dummy):
     register_msgbus()
 
 
-def find_active_undo_step_index(undo_steps):
-    index = 0
-    for step in undo_steps:
-        if "[*" in step:
-            return index
+def find_active_undo_step_index(undo_steps_dump):
+    # Work on the raw dump so that the undo steps don't need to be decoded and split to find the active one.
+    active_marker_position = undo_steps_dump.find(b"[*")
+    if active_marker_position == -1:
+        return None
+
+    # The first line of the dump is a header, so don't count it.
+    return undo_steps_dump.count(b"\n", 0, active_marker_position) - 1
+
+
+def get_undo_steps(undo_steps_dump, num_steps):
+    """Decode only the first num_steps undo steps of the raw dump, skipping the header and footer."""
+    # The last item is either the footer or the rest of the dump that didn't need to be split.
+    undo_steps = undo_steps_dump.split(b"\n", num_steps + 1)[1:-1]
+    return [undo_step.decode(sys.stdout.encoding) for undo_step in undo_steps]
+
+
+def get_undo_step_name(undo_step):
+    return undo_step.split("name=")[-1][1:-1]
 
-        index += 1
 
-    return None
+@persistent
+def undo_history_handler(*args):
+    global undo_history_counter
+    undo_history_counter += 1
+
+
+def get_undo_fingerprint():
+    """Cheap representation of the state that can lead to new undo steps, without dumping the undo stack."""
+    # Undo/redo (including history jumps) bump the counter, and finished operators are added to wm.operators.  Link/Append don't register themselves, but always add data-blocks.
+    wm = bpy.context.window_manager
+    last_operator = wm.operators[-1].as_pointer() if wm.operators else 0
+    data = bpy.data
+    return (undo_history_counter, len(wm.operators), last_operator, len(data.objects), len(data.collections),
+            len(data.materials), len(data.scenes), len(data.armatures), len(data.libraries))
 
 
 @persistent
 def undo_stack_handler(dummy, depsgraph):
+    start_time = time.perf_counter()
+    undo_stack_handler_stats["updates"] += 1
+    try:
+        process_undo_stack(depsgraph)
+    finally:
+        undo_stack_handler_stats["total_time"] += time.perf_counter() - start_time
+
+
+def process_undo_stack(depsgraph):
     global previous_undo_steps_dump
     global previous_undo_step_index
+    global previous_undo_fingerprint
     global file_loading
     global object_data_switched
 
@@ -257,22 +306,36 @@ def undo_stack_handler(dummy, depsgraph):
 
         file_loading = False
 
+    # Check the cheap counters first.  Depsgraph updates that don't come with an undo/redo, a finished operator or new data-blocks (e.g. every mouse move of a transform) can't have pushed an interesting undo step, so there is no need to dump the undo stack.  Steps pushed without an operator (e.g. property edits) are picked up as interim steps on the next dump.
+    undo_fingerprint = get_undo_fingerprint()
+    if undo_fingerprint == previous_undo_fingerprint:
+        undo_stack_handler_stats["skipped"] += 1
+        return
+
+    previous_undo_fingerprint = undo_fingerprint
+
     # Get a representation of the undo stack.
     binary_stream = io.BytesIO()
 
     with redirect_c_stdout(binary_stream):
         bpy.context.window_manager.print_undo_steps()
 
-    undo_steps_dump = binary_stream.getvalue().decode(sys.stdout.encoding)
+    undo_steps_dump_bytes = binary_stream.getvalue()
     binary_stream.close()
+    undo_stack_handler_stats["dumps"] += 1
 
-    if undo_steps_dump == previous_undo_steps_dump:
+    if undo_steps_dump_bytes == previous_undo_steps_dump:
         # The undo stack hasn't changed, so return early.  Note: this prevents modal operators (and anything else) from triggering things repeatedly when nothing has changed.
         return
 
-    # Convert the undo stack representation into a list of undo steps (removing the unneeded header and footer in the process) and find the active undo step index.
-    undo_steps = undo_steps_dump.split("\n")[1:-1]
-    undo_step_index = find_active_undo_step_index(undo_steps)
+    # Find the active undo step index and convert the undo stack representation into a list of undo steps (removing the unneeded header in the process).  Only the steps up to the furthest one that needs processing are decoded, and step names are only parsed for those.
+    undo_step_index = find_active_undo_step_index(undo_steps_dump_bytes)
+    if undo_step_index is None:
+        # There is no active undo step (e.g. the undo stack is empty or disabled), so there is nothing to process.
+        previous_undo_steps_dump = undo_steps_dump_bytes
+        return
+
+    undo_steps = get_undo_steps(undo_steps_dump_bytes, max(previous_undo_step_index, undo_step_index) + 1)
 
     # Get the interim undo steps that need to be processed (can be more than one) and whether the change has been forward ('DO') or backward ('UNDO').  'UNDO' includes the previous index, while 'DO' does not.
     try:
@@ -299,7 +362,7 @@ def undo_stack_handler(dummy, depsgraph):
 
     # Handle the undo steps that have passed since the previous time this executed. This accounts for steps undone, users jumping around in the history ,and any updates that might have been missed.
     for undo_step in interim_undo_steps:
-        step_name = undo_step.split("name=")[-1][1:-1]
+        step_name = get_undo_step_name(undo_step)
 
         if step_type == 'DO' and step_name in {'Link'}:
             # Components need to be migrated after they are linked, but don't need to be remigrated when returning to the link step, and don't store the migrated values in subsequent undo steps until after they have been made local.
@@ -325,16 +388,13 @@ def undo_stack_handler(dummy, depsgraph):
         task_scheduler.add('update_gizmos')
 
     # Handle the active undo step.  Migrations (or anything that modifies blend data) need to be handled here because the undo step in which they occurred holds the unmodified data, so the modifications need to be applied each time it becomes active.
-    active_step_name = undo_steps[undo_step_index].split("name=")[-1][1:-1]
+    active_step_name = get_undo_step_name(undo_steps[undo_step_index])
 
     if step_type == 'DO' and active_step_name in {'Link'}:
         # Components need to be migrated after they are linked, but don't need to be remigrated when returning to the link step, and don't store the migrated values in subsequent undo steps until after they have been made local.
         task_scheduler.add('migrate_components')
         display_report = True
 
-    if step_type == 'DO' and active_step_name in {'Add Hubs Component', 'Remove Hubs Component'}:
-        task_scheduler.add('update_gizmos')
-
     if active_step_name in {'Append'}:
         task_scheduler.add('migrate_components')
         display_report = (step_type == 'DO')
@@ -357,7 +417,7 @@ def undo_stack_handler(dummy, depsgraph):
             print('Error: unrecognized task scheduled')
 
     # Store things for comparison next time.
-    previous_undo_steps_dump = undo_steps_dump
+    previous_undo_steps_dump = undo_steps_dump_bytes
     previous_undo_step_index = undo_step_index
 
 
@@ -395,9 +455,11 @@ def register_msgbus():
 def register():
     global previous_undo_steps_dump
     global previous_undo_step_index
+    global previous_undo_fingerprint
     global previous_window_setups
-    previous_undo_steps_dump = ""
+    previous_undo_steps_dump = b""
     previous_undo_step_index = 0
+    previous_undo_fingerprint = None
     previous_window_setups = []
 
     if load_post not in bpy.app.handlers.load_post:
@@ -407,6 +469,12 @@ def register():
     if undo_stack_handler not in bpy.app.handlers.depsgraph_update_post and not bpy.app.background:
         bpy.app.handlers.depsgraph_update_post.append(undo_stack_handler)
 
+    if undo_history_handler not in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.append(undo_history_handler)
+
+    if undo_history_handler not in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.append(undo_history_handler)
+
     bpy.types.TOPBAR_HT_upper_bar.append(scene_and_view_layer_update_notifier)
 
     register_msgbus()
@@ -421,6 +489,12 @@ def unregister():
     if undo_stack_handler in bpy.app.handlers.depsgraph_update_post and not bpy.app.background:
         bpy.app.handlers.depsgraph_update_post.remove(undo_stack_handler)
 
+    if undo_history_handler in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(undo_history_handler)
+
+    if undo_history_handler in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(undo_history_handler)
+
     bpy.types.TOPBAR_HT_upper_bar.remove(scene_and_view_layer_update_notifier)
 
     for owner in msgbus_owners:
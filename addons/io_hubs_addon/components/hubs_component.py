@@ -1,7 +1,10 @@
 from bpy.types import PropertyGroup
 from bpy.props import IntVectorProperty
 from .types import Category, PanelType, NodeType
-from ..io.utils import import_component, assign_property
+from ..io.utils import import_component, get_import_plan, assign_unplanned_property
+
+# Resolved definition values per component class, the definitions are static so they only need to be looked up once.
+definitions_cache = {}
 
 
 class HubsComponent(PropertyGroup):
@@ -31,9 +34,11 @@ class HubsComponent(PropertyGroup):
 
     @classmethod
     def __get_definition(cls, key, default):
-        if key in cls._definition and cls._definition[key]:
-            return cls._definition[key]
-        return default
+        class_definitions = definitions_cache.get(cls)
+        if class_definitions is None:
+            class_definitions = definitions_cache[cls] = {
+                def_key: def_value for def_key, def_value in cls._definition.items() if def_value}
+        return class_definitions.get(key, default)
 
     @classmethod
     def get_id(cls):
@@ -124,9 +129,10 @@ class HubsComponent(PropertyGroup):
     def gather_import(cls, gltf, blender_host, component_name, component_value, import_report, blender_ob=None):
         component = import_component(component_name, blender_host)
         if component_value:
+            import_plan = get_import_plan(cls)
             for property_name, property_value in component_value.items():
-                assign_property(gltf.vnodes, component,
-                                property_name, property_value)
+                assign = import_plan.get(property_name, assign_unplanned_property)
+                assign(gltf.vnodes, component, property_name, property_value)
 
     def post_export(self, export_settings, host, ob=None):
         '''This is called by the exporter after the export process has finished'''
@@ -0,0 +1,15 @@
+import os
+import numpy as np
+
+# Gizmo models are stored as packed little-endian float32 (x, y, z) triangle vertices, see scripts/export_gizmo.py.
+# They are only read from disk the first time a gizmo using them is created.
+models = {}
+
+
+def load_model(name):
+    shape = models.get(name)
+    if shape is None:
+        path = os.path.join(os.path.dirname(os.path.realpath(__file__)), f"{name}.bin")
+        shape = np.fromfile(path, dtype='<f4').reshape(-1, 3)
+        models[name] = shape
+    return shape
@@ -1 +0,0 @@
-SHAPE = ((0.153029, -0.091493, -0.027939),(0.036019, -0.018590, 0.143833),(0.046648, -0.042210, 0.187375),(0.153029, -0.091493, -0.027939),(0.046648, -0.042210, 0.187375),(0.174287, -0.121736, -0.000000),(-0.007655, -0.109699, -0.173613),(0.330949, -0.109699, -0.173613),(0.303646, -0.114328, -0.122298),(-0.007655, -0.109699, -0.173613),(0.303646, -0.114328, -0.122298),(0.019648, -0.114328, -0.122298),(0.367100, -0.090125, 0.028674),(0.303646, -0.051107, -0.064950),(0.291960, -0.089904, -0.076381),(0.367100, -0.090125, 0.028674),(0.291960, -0.089904, -0.076381),(0.343727, -0.121736, 0.000000),(0.019648, -0.114328, -0.122298),(0.303646, -0.114328, -0.122298),(0.291960, -0.089904, -0.076381),(0.019648, -0.114328, -0.122298),(0.291960, -0.089904, -0.076381),(0.031335, -0.089904, -0.076381),(0.019648, -0.051107, -0.064950),(0.303646, -0.051107, -0.064950),(0.330949, -0.022160, -0.094205),(0.019648, -0.051107, -0.064950),(0.330949, -0.022160, -0.094205),(-0.007655, -0.022160, -0.094205),(0.474212, -0.091339, 0.027573),(0.357202, -0.019389, -0.145071),(0.330949, -0.022160, -0.094205),(0.474212, -0.091339, 0.027573),(0.330949, -0.022160, -0.094205),(0.421706, -0.077966, 0.039704),(-0.007655, -0.221312, 0.094205),(-0.033908, -0.224082, 0.145071),(-0.150918, -0.152133, -0.027573),(-0.007655, -0.221312, 0.094205),(-0.150918, -0.152133, -0.027573),(-0.098412, -0.165505, -0.039704),(-0.033908, -0.224082, 0.145071),(-0.044537, -0.200221, 0.188328),(-0.172177, -0.121736, 0.000000),(-0.033908, -0.224082, 0.145071),(-0.172177, -0.121736, 0.000000),(-0.150918, -0.152133, -0.027573),(-0.044537, -0.043250, -0.188328),(0.367831, -0.043250, -0.188328),(0.357202, -0.080183, -0.200218),(-0.044537, -0.043250, -0.188328),(0.357202, -0.080183, -0.200218),(-0.033908, -0.080183, -0.200218),(0.019648, -0.192364, 0.064950),(-0.007655, -0.221312, 0.094205),(-0.098412, -0.165505, -0.039704),(0.019648, -0.192364, 0.064950),(-0.098412, -0.165505, -0.039704),(-0.043806, -0.153346, -0.028674),(0.291960, -0.089904, -0.076381),(0.303646, -0.114328, -0.122298),(0.367100, -0.153346, -0.028674),(0.291960, -0.089904, -0.076381),(0.367100, -0.153346, -0.028674),(0.343727, -0.121736, 0.000000),(0.031335, -0.089904, -0.076381),(0.291960, -0.089904, -0.076381),(0.303646, -0.051107, -0.064950),(0.031335, -0.089904, -0.076381),(0.303646, -0.051107, -0.064950),(0.019648, -0.051107, -0.064950),(0.421706, -0.165505, -0.039704),(0.330949, -0.221312, 0.094205),(0.303646, -0.192364, 0.064950),(0.421706, -0.165505, -0.039704),(0.303646, -0.192364, 0.064950),(0.367100, -0.153346, -0.028674),(-0.007655, -0.221312, 0.094205),(0.330949, -0.221312, 0.094205),(0.357202, -0.224082, 0.145071),(-0.007655, -0.221312, 0.094205),(0.357202, -0.224082, 0.145071),(-0.033908, -0.224082, 0.145071),(0.474212, -0.152133, -0.027573),(0.495471, -0.121736, 0.000000),(0.367831, -0.200221, 0.188328),(0.474212, -0.152133, -0.027573),(0.367831, -0.200221, 0.188328),(0.357202, -0.224082, 0.145071),(-0.044537, -0.200221, 0.188328),(0.367831, -0.200221, 0.188328),(0.357202, -0.163288, 0.200218),(-0.044537, -0.200221, 0.188328),(0.357202, -0.163288, 0.200218),(-0.033908, -0.163288, 0.200218),(-0.007655, -0.133772, 0.173613),(0.330949, -0.133772, 0.173613),(0.303646, -0.129143, 0.122299),(-0.007655, -0.133772, 0.173613),(0.303646, -0.129143, 0.122299),(0.019648, -0.129143, 0.122299),(0.343727, -0.121736, 0.000000),(0.367100, -0.153346, -0.028674),(0.303646, -0.192364, 0.064950),(0.343727, -0.121736, 0.000000),(0.303646, -0.192364, 0.064950),(0.291960, -0.153567, 0.076381),(-0.043806, -0.153346, -0.028674),(-0.098412, -0.165505, -0.039704),(-0.007655, -0.109699, -0.173613),(-0.043806, -0.153346, -0.028674),(-0.007655, -0.109699, -0.173613),(0.019648, -0.114328, -0.122298),(-0.007655, -0.022160, -0.094205),(0.330949, -0.022160, -0.094205),(0.357202, -0.019389, -0.145071),(-0.007655, -0.022160, -0.094205),(0.357202, -0.019389, -0.145071),(-0.033908, -0.019389, -0.145071),(-0.020433, -0.121736, 0.000000),(-0.043806, -0.153346, -0.028674),(0.019648, -0.114328, -0.122298),(-0.020433, -0.121736, 0.000000),(0.019648, -0.114328, -0.122298),(0.031335, -0.089904, -0.076381),(-0.007655, -0.109699, -0.173613),(-0.098412, -0.165505, -0.039704),(-0.150918, -0.152133, -0.027573),(-0.007655, -0.109699, -0.173613),(-0.150918, -0.152133, -0.027573),(-0.033908, -0.080183, -0.200218),(-0.033908, -0.163288, 0.200218),(0.357202, -0.163288, 0.200218),(0.330949, -0.133772, 0.173613),(-0.033908, -0.163288, 0.200218),(0.330949, -0.133772, 0.173613),(-0.007655, -0.133772, 0.173613),(0.367831, -0.043250, -0.188328),(0.357202, -0.019389, -0.145071),(0.474212, -0.091339, 0.027573),(0.367831, -0.043250, -0.188328),(0.474212, -0.091339, 0.027573),(0.495471, -0.121736, 0.000000),(0.357202, -0.080183, -0.200218),(0.367831, -0.043250, -0.188328),(0.495471, -0.121736, 0.000000),(0.357202, -0.080183, -0.200218),(0.495471, -0.121736, 0.000000),(0.474212, -0.152133, -0.027573),(-0.007655, -0.133772, 0.173613),(0.019648, -0.129143, 0.122299),(-0.043806, -0.090125, 0.028674),(-0.007655, -0.133772, 0.173613),(-0.043806, -0.090125, 0.028674),(-0.098412, -0.077966, 0.039704),(0.031335, -0.153567, 0.076381),(0.291960, -0.153567, 0.076381),(0.303646, -0.192364, 0.064950),(0.031335, -0.153567, 0.076381),(0.303646, -0.192364, 0.064950),(0.019648, -0.192364, 0.064950),(-0.043806, -0.090125, 0.028674),(-0.020433, -0.121736, 0.000000),(0.031335, -0.089904, -0.076381),(-0.043806, -0.090125, 0.028674),(0.031335, -0.089904, -0.076381),(0.019648, -0.051107, -0.064950),(0.421706, -0.077966, 0.039704),(0.330949, -0.022160, -0.094205),(0.303646, -0.051107, -0.064950),(0.421706, -0.077966, 0.039704),(0.303646, -0.051107, -0.064950),(0.367100, -0.090125, 0.028674),(-0.150918, -0.091339, 0.027573),(-0.033908, -0.163288, 0.200218),(-0.007655, -0.133772, 0.173613),(-0.150918, -0.091339, 0.027573),(-0.007655, -0.133772, 0.173613),(-0.098412, -0.077966, 0.039704),(0.421706, -0.165505, -0.039704),(0.474212, -0.152133, -0.027573),(0.357202, -0.224082, 0.145071),(0.421706, -0.165505, -0.039704),(0.357202, -0.224082, 0.145071),(0.330949, -0.221312, 0.094205),(-0.044537, -0.200221, 0.188328),(-0.033908, -0.224082, 0.145071),(0.357202, -0.224082, 0.145071),(-0.044537, -0.200221, 0.188328),(0.357202, -0.224082, 0.145071),(0.367831, -0.200221, 0.188328),(-0.044537, -0.200221, 0.188328),(-0.033908, -0.163288, 0.200218),(-0.150918, -0.091339, 0.027573),(-0.044537, -0.200221, 0.188328),(-0.150918, -0.091339, 0.027573),(-0.172177, -0.121736, 0.000000),(-0.007655, -0.221312, 0.094205),(0.019648, -0.192364, 0.064950),(0.303646, -0.192364, 0.064950),(-0.007655, -0.221312, 0.094205),(0.303646, -0.192364, 0.064950),(0.330949, -0.221312, 0.094205),(0.019648, -0.129143, 0.122299),(0.031335, -0.153567, 0.076381),(-0.020433, -0.121736, 0.000000),(0.019648, -0.129143, 0.122299),(-0.020433, -0.121736, 0.000000),(-0.043806, -0.090125, 0.028674),(0.019648, -0.129143, 0.122299),(0.303646, -0.129143, 0.122299),(0.291960, -0.153567, 0.076381),(0.019648, -0.129143, 0.122299),(0.291960, -0.153567, 0.076381),(0.031335, -0.153567, 0.076381),(-0.098412, -0.077966, 0.039704),(-0.043806, -0.090125, 0.028674),(0.019648, -0.051107, -0.064950),(-0.098412, -0.077966, 0.039704),(0.019648, -0.051107, -0.064950),(-0.007655, -0.022160, -0.094205),(0.421706, -0.077966, 0.039704),(0.330949, -0.133772, 0.173613),(0.357202, -0.163288, 0.200218),(0.421706, -0.077966, 0.039704),(0.357202, -0.163288, 0.200218),(0.474212, -0.091339, 0.027573),(-0.033908, -0.019389, -0.145071),(0.357202, -0.019389, -0.145071),(0.367831, -0.043250, -0.188328),(-0.033908, -0.019389, -0.145071),(0.367831, -0.043250, -0.188328),(-0.044537, -0.043250, -0.188328),(-0.033908, -0.080183, -0.200218),(0.357202, -0.080183, -0.200218),(0.330949, -0.109699, -0.173613),(-0.033908, -0.080183, -0.200218),(0.330949, -0.109699, -0.173613),(-0.007655, -0.109699, -0.173613),(0.303646, -0.114328, -0.122298),(0.330949, -0.109699, -0.173613),(0.421706, -0.165505, -0.039704),(0.303646, -0.114328, -0.122298),(0.421706, -0.165505, -0.039704),(0.367100, -0.153346, -0.028674),(0.421706, -0.077966, 0.039704),(0.367100, -0.090125, 0.028674),(0.303646, -0.129143, 0.122299),(0.421706, -0.077966, 0.039704),(0.303646, -0.129143, 0.122299),(0.330949, -0.133772, 0.173613),(0.367100, -0.090125, 0.028674),(0.343727, -0.121736, 0.000000),(0.291960, -0.153567, 0.076381),(0.367100, -0.090125, 0.028674),(0.291960, -0.153567, 0.076381),(0.303646, -0.129143, 0.122299),(0.330949, -0.109699, -0.173613),(0.357202, -0.080183, -0.200218),(0.474212, -0.152133, -0.027573),(0.330949, -0.109699, -0.173613),(0.474212, -0.152133, -0.027573),(0.421706, -0.165505, -0.039704),(-0.020433, -0.121736, 0.000000),(0.031335, -0.153567, 0.076381),(0.019648, -0.192364, 0.064950),(-0.020433, -0.121736, 0.000000),(0.019648, -0.192364, 0.064950),(-0.043806, -0.153346, -0.028674),(-0.172177, -0.121736, 0.000000),(-0.150918, -0.091339, 0.027573),(-0.033908, -0.019389, -0.145071),(-0.172177, -0.121736, 0.000000),(-0.033908, -0.019389, -0.145071),(-0.044537, -0.043250, -0.188328),(-0.150918, -0.091339, 0.027573),(-0.098412, -0.077966, 0.039704),(-0.007655, -0.022160, -0.094205),(-0.150918, -0.091339, 0.027573),(-0.007655, -0.022160, -0.094205),(-0.033908, -0.019389, -0.145071),(-0.305757, -0.192721, -0.064097),(-0.333060, -0.221830, -0.093001),(0.009765, -0.221830, -0.093001),(-0.305757, -0.192721, -0.064097),(0.009765, -0.221830, -0.093001),(-0.017537, -0.192721, -0.064097),(-0.333060, -0.134733, -0.173462),(0.009765, -0.134733, -0.173462),(0.036019, -0.164396, -0.199710),(-0.333060, -0.134733, -0.173462),(0.036019, -0.164396, -0.199710),(-0.359313, -0.164396, -0.199710),(-0.345838, -0.121736, -0.000000),(-0.294070, -0.153989, -0.075995),(-0.305757, -0.129820, -0.122205),(-0.345838, -0.121736, -0.000000),(-0.305757, -0.129820, -0.122205),(-0.369211, -0.090285, -0.029054),(-0.423816, -0.165284, 0.040230),(-0.369211, -0.153186, 0.029054),(-0.305757, -0.113651, 0.122205),(-0.423816, -0.165284, 0.040230),(-0.305757, -0.113651, 0.122205),(-0.333060, -0.108738, 0.173462),(0.100522, -0.165284, 0.040230),(0.009765, -0.221830, -0.093001),(0.036019, -0.224882, -0.143833),(0.100522, -0.165284, 0.040230),(0.036019, -0.224882, -0.143833),(0.153029, -0.151979, 0.027939),(0.036019, -0.079076, 0.199710),(0.009765, -0.108738, 0.173462),(0.100522, -0.165284, 0.040230),(0.036019, -0.079076, 0.199710),(0.100522, -0.165284, 0.040230),(0.153029, -0.151979, 0.027939),(-0.369942, -0.042210, 0.187375),(-0.359313, -0.079076, 0.199710),(0.036019, -0.079076, 0.199710),(-0.369942, -0.042210, 0.187375),(0.036019, -0.079076, 0.199710),(0.046648, -0.042210, 0.187375),(-0.497581, -0.121736, -0.000000),(-0.369942, -0.201262, -0.187375),(-0.359313, -0.224882, -0.143833),(-0.497581, -0.121736, -0.000000),(-0.359313, -0.224882, -0.143833),(-0.476323, -0.151979, 0.027939),(-0.369211, -0.090285, -0.029054),(-0.305757, -0.129820, -0.122205),(-0.333060, -0.134733, -0.173462),(-0.369211, -0.090285, -0.029054),(-0.333060, -0.134733, -0.173462),(-0.423816, -0.078187, -0.040230),(-0.305757, -0.113651, 0.122205),(-0.369211, -0.153186, 0.029054),(-0.345838, -0.121736, -0.000000),(-0.305757, -0.113651, 0.122205),(-0.345838, -0.121736, -0.000000),(-0.294070, -0.089482, 0.075995),(-0.305757, -0.192721, -0.064097),(-0.294070, -0.153989, -0.075995),(-0.345838, -0.121736, -0.000000),(-0.305757, -0.192721, -0.064097),(-0.345838, -0.121736, -0.000000),(-0.369211, -0.153186, 0.029054),(-0.305757, -0.129820, -0.122205),(-0.017537, -0.129820, -0.122205),(0.009765, -0.134733, -0.173462),(-0.305757, -0.129820, -0.122205),(0.009765, -0.134733, -0.173462),(-0.333060, -0.134733, -0.173462),(-0.359313, -0.224882, -0.143833),(0.036019, -0.224882, -0.143833),(0.009765, -0.221830, -0.093001),(-0.359313, -0.224882, -0.143833),(0.009765, -0.221830, -0.093001),(-0.333060, -0.221830, -0.093001),(-0.359313, -0.018590, 0.143833),(-0.476323, -0.091493, -0.027939),(-0.497581, -0.121736, -0.000000),(-0.359313, -0.018590, 0.143833),(-0.497581, -0.121736, -0.000000),(-0.369942, -0.042210, 0.187375),(-0.359313, -0.164396, -0.199710),(-0.369942, -0.201262, -0.187375),(-0.497581, -0.121736, -0.000000),(-0.359313, -0.164396, -0.199710),(-0.497581, -0.121736, -0.000000),(-0.476323, -0.091493, -0.027939),(0.009765, -0.021641, 0.093001),(0.036019, -0.018590, 0.143833),(0.153029, -0.091493, -0.027939),(0.009765, -0.021641, 0.093001),(0.153029, -0.091493, -0.027939),(0.100522, -0.078187, -0.040230),(-0.369942, -0.201262, -0.187375),(0.046648, -0.201262, -0.187375),(0.036019, -0.224882, -0.143833),(-0.369942, -0.201262, -0.187375),(0.036019, -0.224882, -0.143833),(-0.359313, -0.224882, -0.143833),(0.100522, -0.165284, 0.040230),(0.045917, -0.153186, 0.029054),(-0.017537, -0.192721, -0.064097),(0.100522, -0.165284, 0.040230),(-0.017537, -0.192721, -0.064097),(0.009765, -0.221830, -0.093001),(-0.305757, -0.192721, -0.064097),(-0.017537, -0.192721, -0.064097),(-0.029224, -0.153989, -0.075995),(-0.305757, -0.192721, -0.064097),(-0.029224, -0.153989, -0.075995),(-0.294070, -0.153989, -0.075995),(0.022543, -0.121736, -0.000000),(0.045917, -0.090285, -0.029054),(-0.017537, -0.129820, -0.122205),(0.022543, -0.121736, -0.000000),(-0.017537, -0.129820, -0.122205),(-0.029224, -0.153989, -0.075995),(0.367831, -0.200221, 0.188328),(0.495471, -0.121736, 0.000000),(0.474212, -0.091339, 0.027573),(0.367831, -0.200221, 0.188328),(0.474212, -0.091339, 0.027573),(0.357202, -0.163288, 0.200218),(-0.333060, -0.021641, 0.093001),(-0.423816, -0.078187, -0.040230),(-0.476323, -0.091493, -0.027939),(-0.333060, -0.021641, 0.093001),(-0.476323, -0.091493, -0.027939),(-0.359313, -0.018590, 0.143833),(-0.476323, -0.151979, 0.027939),(-0.359313, -0.224882, -0.143833),(-0.333060, -0.221830, -0.093001),(-0.476323, -0.151979, 0.027939),(-0.333060, -0.221830, -0.093001),(-0.423816, -0.165284, 0.040230),(-0.497581, -0.121736, -0.000000),(-0.476323, -0.151979, 0.027939),(-0.359313, -0.079076, 0.199710),(-0.497581, -0.121736, -0.000000),(-0.359313, -0.079076, 0.199710),(-0.369942, -0.042210, 0.187375),(0.046648, -0.201262, -0.187375),(0.174287, -0.121736, -0.000000),(0.153029, -0.151979, 0.027939),(0.046648, -0.201262, -0.187375),(0.153029, -0.151979, 0.027939),(0.036019, -0.224882, -0.143833),(-0.305757, -0.050750, 0.064096),(-0.333060, -0.021641, 0.093001),(0.009765, -0.021641, 0.093001),(-0.305757, -0.050750, 0.064096),(0.009765, -0.021641, 0.093001),(-0.017537, -0.050750, 0.064096),(0.045917, -0.153186, 0.029054),(0.022543, -0.121736, -0.000000),(-0.029224, -0.153989, -0.075995),(0.045917, -0.153186, 0.029054),(-0.029224, -0.153989, -0.075995),(-0.017537, -0.192721, -0.064097),(-0.017537, -0.113651, 0.122205),(-0.029224, -0.089482, 0.075995),(0.022543, -0.121736, -0.000000),(-0.017537, -0.113651, 0.122205),(0.022543, -0.121736, -0.000000),(0.045917, -0.153186, 0.029054),(0.100522, -0.078187, -0.040230),(0.009765, -0.134733, -0.173462),(-0.017537, -0.129820, -0.122205),(0.100522, -0.078187, -0.040230),(-0.017537, -0.129820, -0.122205),(0.045917, -0.090285, -0.029054),(-0.333060, -0.108738, 0.173462),(0.009765, -0.108738, 0.173462),(0.036019, -0.079076, 0.199710),(-0.333060, -0.108738, 0.173462),(0.036019, -0.079076, 0.199710),(-0.359313, -0.079076, 0.199710),(-0.369942, -0.201262, -0.187375),(-0.359313, -0.164396, -0.199710),(0.036019, -0.164396, -0.199710),(-0.369942, -0.201262, -0.187375),(0.036019, -0.164396, -0.199710),(0.046648, -0.201262, -0.187375),(-0.359313, -0.079076, 0.199710),(-0.476323, -0.151979, 0.027939),(-0.423816, -0.165284, 0.040230),(-0.359313, -0.079076, 0.199710),(-0.423816, -0.165284, 0.040230),(-0.333060, -0.108738, 0.173462),(-0.369942, -0.042210, 0.187375),(0.046648, -0.042210, 0.187375),(0.036019, -0.018590, 0.143833),(-0.369942, -0.042210, 0.187375),(0.036019, -0.018590, 0.143833),(-0.359313, -0.018590, 0.143833),(-0.333060, -0.221830, -0.093001),(-0.305757, -0.192721, -0.064097),(-0.369211, -0.153186, 0.029054),(-0.333060, -0.221830, -0.093001),(-0.369211, -0.153186, 0.029054),(-0.423816, -0.165284, 0.040230),(-0.294070, -0.089482, 0.075995),(-0.029224, -0.089482, 0.075995),(-0.017537, -0.113651, 0.122205),(-0.294070, -0.089482, 0.075995),(-0.017537, -0.113651, 0.122205),(-0.305757, -0.113651, 0.122205),(-0.294070, -0.089482, 0.075995),(-0.305757, -0.050750, 0.064096),(-0.017537, -0.050750, 0.064096),(-0.294070, -0.089482, 0.075995),(-0.017537, -0.050750, 0.064096),(-0.029224, -0.089482, 0.075995),(0.100522, -0.165284, 0.040230),(0.009765, -0.108738, 0.173462),(-0.017537, -0.113651, 0.122205),(0.100522, -0.165284, 0.040230),(-0.017537, -0.113651, 0.122205),(0.045917, -0.153186, 0.029054),(-0.359313, -0.018590, 0.143833),(0.036019, -0.018590, 0.143833),(0.009765, -0.021641, 0.093001),(-0.359313, -0.018590, 0.143833),(0.009765, -0.021641, 0.093001),(-0.333060, -0.021641, 0.093001),(-0.029224, -0.089482, 0.075995),(-0.017537, -0.050750, 0.064096),(0.045917, -0.090285, -0.029054),(-0.029224, -0.089482, 0.075995),(0.045917, -0.090285, -0.029054),(0.022543, -0.121736, -0.000000),(0.009765, -0.134733, -0.173462),(0.100522, -0.078187, -0.040230),(0.153029, -0.091493, -0.027939),(0.009765, -0.134733, -0.173462),(0.153029, -0.091493, -0.027939),(0.036019, -0.164396, -0.199710),(-0.017537, -0.050750, 0.064096),(0.009765, -0.021641, 0.093001),(0.100522, -0.078187, -0.040230),(-0.017537, -0.050750, 0.064096),(0.100522, -0.078187, -0.040230),(0.045917, -0.090285, -0.029054),(-0.369211, -0.090285, -0.029054),(-0.423816, -0.078187, -0.040230),(-0.333060, -0.021641, 0.093001),(-0.369211, -0.090285, -0.029054),(-0.333060, -0.021641, 0.093001),(-0.305757, -0.050750, 0.064096),(-0.294070, -0.153989, -0.075995),(-0.029224, -0.153989, -0.075995),(-0.017537, -0.129820, -0.122205),(-0.294070, -0.153989, -0.075995),(-0.017537, -0.129820, -0.122205),(-0.305757, -0.129820, -0.122205),(-0.305757, -0.113651, 0.122205),(-0.017537, -0.113651, 0.122205),(0.009765, -0.108738, 0.173462),(-0.305757, -0.113651, 0.122205),(0.009765, -0.108738, 0.173462),(-0.333060, -0.108738, 0.173462),(-0.345838, -0.121736, -0.000000),(-0.369211, -0.090285, -0.029054),(-0.305757, -0.050750, 0.064096),(-0.345838, -0.121736, -0.000000),(-0.305757, -0.050750, 0.064096),(-0.294070, -0.089482, 0.075995),(0.046648, -0.042210, 0.187375),(0.036019, -0.079076, 0.199710),(0.153029, -0.151979, 0.027939),(0.046648, -0.042210, 0.187375),(0.153029, -0.151979, 0.027939),(0.174287, -0.121736, -0.000000),(-0.333060, -0.134733, -0.173462),(-0.359313, -0.164396, -0.199710),(-0.476323, -0.091493, -0.027939),(-0.333060, -0.134733, -0.173462),(-0.476323, -0.091493, -0.027939),(-0.423816, -0.078187, -0.040230),(-0.150918, -0.152133, -0.027573),(-0.172177, -0.121736, 0.000000),(-0.044537, -0.043250, -0.188328),(-0.150918, -0.152133, -0.027573),(-0.044537, -0.043250, -0.188328),(-0.033908, -0.080183, -0.200218),(-0.500488, 0.000000, -0.246896),(0.500488, 0.000000, -0.246896),(0.500488, 0.000000, 0.246896),(-0.500488, 0.000000, -0.246896),(0.500488, 0.000000, 0.246896),(-0.500488, 0.000000, 0.246896),(0.153029, -0.091493, -0.027939),(0.174287, -0.121736, -0.000000),(0.046648, -0.201262, -0.187375),(0.153029, -0.091493, -0.027939),(0.046648, -0.201262, -0.187375),(0.036019, -0.164396, -0.199710),)
\ No newline at end of file
@@ -1 +0,0 @@
-SHAPE = ((-0.480059, 0.000000, 1.590102),(-0.480059, 0.000000, 1.797271),(-0.272890, 0.000000, 1.797271),(-0.480059, 0.000000, 1.590102),(-0.272890, 0.000000, 1.797271),(-0.272890, 0.000000, 1.590102),(0.025917, -0.000000, 0.663329),(0.025917, 0.000000, 0.893517),(0.256106, 0.000000, 0.893517),(0.025917, -0.000000, 0.663329),(0.256106, 0.000000, 0.893517),(0.256106, -0.000000, 0.663329),(-0.727202, 0.000000, 0.252196),(-0.727202, 0.000000, 0.528422),(-0.450976, 0.000000, 0.528422),(-0.727202, 0.000000, 0.252196),(-0.450976, 0.000000, 0.528422),(-0.450976, 0.000000, 0.252196),(-0.253207, -0.000000, 0.207170),(-0.253207, -0.000000, 0.483396),(0.023019, -0.000000, 0.483396),(-0.253207, -0.000000, 0.207170),(0.023019, -0.000000, 0.483396),(0.023019, -0.000000, 0.207170),(-0.230188, 0.000000, 1.150942),(-0.230188, 0.000000, 1.381130),(0.000000, 0.000000, 1.381130),(-0.230188, 0.000000, 1.150942),(0.000000, 0.000000, 1.381130),(0.000000, 0.000000, 1.150942),(-0.522977, -0.000000, 0.645539),(-0.522977, -0.000000, 0.875728),(-0.292788, -0.000000, 0.875728),(-0.522977, -0.000000, 0.645539),(-0.292788, -0.000000, 0.875728),(-0.292788, -0.000000, 0.645539),(0.085573, 0.000000, 1.549731),(0.085573, 0.000000, 1.687844),(0.223686, 0.000000, 1.687844),(0.085573, 0.000000, 1.549731),(0.223686, 0.000000, 1.687844),(0.223686, 0.000000, 1.549731),(-0.588475, 0.000000, 1.071826),(-0.588475, 0.000000, 1.255976),(-0.404325, 0.000000, 1.255976),(-0.588475, 0.000000, 1.071826),(-0.404325, 0.000000, 1.255976),(-0.404325, 0.000000, 1.071826),(0.299069, -0.000000, 0.218679),(0.299069, -0.000000, 0.471886),(0.552276, -0.000000, 0.471886),(0.299069, -0.000000, 0.218679),(0.552276, -0.000000, 0.471886),(0.552276, -0.000000, 0.218679),(-0.218725, -0.000000, 2.048898),(-0.218725, -0.000000, 2.210031),(-0.057593, -0.000000, 2.210031),(-0.218725, -0.000000, 2.048898),(-0.057593, -0.000000, 2.210031),(-0.057593, -0.000000, 2.048898),(0.103454, 0.000000, 1.076043),(0.103454, 0.000000, 1.306231),(0.333643, 0.000000, 1.306231),(0.103454, 0.000000, 1.076043),(0.333643, 0.000000, 1.306231),(0.333643, 0.000000, 1.076043),(-0.480059, 0.100000, 1.590102),(-0.272890, 0.100000, 1.590102),(-0.272890, 0.100000, 1.797271),(-0.480059, 0.100000, 1.590102),(-0.272890, 0.100000, 1.797271),(-0.480059, 0.100000, 1.797271),(0.025917, 0.100000, 0.663329),(0.256106, 0.100000, 0.663329),(0.256106, 0.100000, 0.893517),(0.025917, 0.100000, 0.663329),(0.256106, 0.100000, 0.893517),(0.025917, 0.100000, 0.893517),(-0.727202, 0.100000, 0.252196),(-0.450976, 0.100000, 0.252196),(-0.450976, 0.100000, 0.528422),(-0.727202, 0.100000, 0.252196),(-0.450976, 0.100000, 0.528422),(-0.727202, 0.100000, 0.528422),(-0.253207, 0.100000, 0.207170),(0.023019, 0.100000, 0.207170),(0.023019, 0.100000, 0.483396),(-0.253207, 0.100000, 0.207170),(0.023019, 0.100000, 0.483396),(-0.253207, 0.100000, 0.483396),(-0.230188, 0.100000, 1.150942),(0.000000, 0.100000, 1.150942),(0.000000, 0.100000, 1.381130),(-0.230188, 0.100000, 1.150942),(0.000000, 0.100000, 1.381130),(-0.230188, 0.100000, 1.381130),(-0.522977, 0.100000, 0.645539),(-0.292788, 0.100000, 0.645539),(-0.292788, 0.100000, 0.875728),(-0.522977, 0.100000, 0.645539),(-0.292788, 0.100000, 0.875728),(-0.522977, 0.100000, 0.875728),(0.085573, 0.100000, 1.549731),(0.223686, 0.100000, 1.549731),(0.223686, 0.100000, 1.687844),(0.085573, 0.100000, 1.549731),(0.223686, 0.100000, 1.687844),(0.085573, 0.100000, 1.687844),(-0.588475, 0.100000, 1.071826),(-0.404325, 0.100000, 1.071826),(-0.404325, 0.100000, 1.255976),(-0.588475, 0.100000, 1.071826),(-0.404325, 0.100000, 1.255976),(-0.588475, 0.100000, 1.255976),(0.299069, 0.100000, 0.218679),(0.552276, 0.100000, 0.218679),(0.552276, 0.100000, 0.471886),(0.299069, 0.100000, 0.218679),(0.552276, 0.100000, 0.471886),(0.299069, 0.100000, 0.471886),(-0.218725, 0.100000, 2.048898),(-0.057593, 0.100000, 2.048898),(-0.057593, 0.100000, 2.210031),(-0.218725, 0.100000, 2.048898),(-0.057593, 0.100000, 2.210031),(-0.218725, 0.100000, 2.210031),(0.103454, 0.100000, 1.076043),(0.333643, 0.100000, 1.076043),(0.333643, 0.100000, 1.306231),(0.103454, 0.100000, 1.076043),(0.333643, 0.100000, 1.306231),(0.103454, 0.100000, 1.306231),(0.085573, 0.000000, 1.687844),(0.085573, 0.000000, 1.549731),(0.085573, 0.100000, 1.549731),(0.085573, 0.000000, 1.687844),(0.085573, 0.100000, 1.549731),(0.085573, 0.100000, 1.687844),(-0.450976, 0.000000, 0.528422),(-0.727202, 0.000000, 0.528422),(-0.727202, 0.100000, 0.528422),(-0.450976, 0.000000, 0.528422),(-0.727202, 0.100000, 0.528422),(-0.450976, 0.100000, 0.528422),(-0.218725, -0.000000, 2.210031),(-0.218725, -0.000000, 2.048898),(-0.218725, 0.100000, 2.048898),(-0.218725, -0.000000, 2.210031),(-0.218725, 0.100000, 2.048898),(-0.218725, 0.100000, 2.210031),(0.223686, 0.000000, 1.687844),(0.085573, 0.000000, 1.687844),(0.085573, 0.100000, 1.687844),(0.223686, 0.000000, 1.687844),(0.085573, 0.100000, 1.687844),(0.223686, 0.100000, 1.687844),(0.256106, 0.000000, 0.893517),(0.025917, 0.000000, 0.893517),(0.025917, 0.100000, 0.893517),(0.256106, 0.000000, 0.893517),(0.025917, 0.100000, 0.893517),(0.256106, 0.100000, 0.893517),(-0.057593, -0.000000, 2.210031),(-0.218725, -0.000000, 2.210031),(-0.218725, 0.100000, 2.210031),(-0.057593, -0.000000, 2.210031),(-0.218725, 0.100000, 2.210031),(-0.057593, 0.100000, 2.210031),(-0.230188, 0.000000, 1.381130),(-0.230188, 0.000000, 1.150942),(-0.230188, 0.100000, 1.150942),(-0.230188, 0.000000, 1.381130),(-0.230188, 0.100000, 1.150942),(-0.230188, 0.100000, 1.381130),(-0.480059, 0.000000, 1.797271),(-0.480059, 0.000000, 1.590102),(-0.480059, 0.100000, 1.590102),(-0.480059, 0.000000, 1.797271),(-0.480059, 0.100000, 1.590102),(-0.480059, 0.100000, 1.797271),(-0.480059, 0.000000, 1.590102),(-0.272890, 0.000000, 1.590102),(-0.272890, 0.100000, 1.590102),(-0.480059, 0.000000, 1.590102),(-0.272890, 0.100000, 1.590102),(-0.480059, 0.100000, 1.590102),(-0.230188, 0.000000, 1.150942),(0.000000, 0.000000, 1.150942),(0.000000, 0.100000, 1.150942),(-0.230188, 0.000000, 1.150942),(0.000000, 0.100000, 1.150942),(-0.230188, 0.100000, 1.150942),(-0.218725, -0.000000, 2.048898),(-0.057593, -0.000000, 2.048898),(-0.057593, 0.100000, 2.048898),(-0.218725, -0.000000, 2.048898),(-0.057593, 0.100000, 2.048898),(-0.218725, 0.100000, 2.048898),(-0.272890, 0.000000, 1.590102),(-0.272890, 0.000000, 1.797271),(-0.272890, 0.100000, 1.797271),(-0.272890, 0.000000, 1.590102),(-0.272890, 0.100000, 1.797271),(-0.272890, 0.100000, 1.590102),(-0.404325, 0.000000, 1.255976),(-0.588475, 0.000000, 1.255976),(-0.588475, 0.100000, 1.255976),(-0.404325, 0.000000, 1.255976),(-0.588475, 0.100000, 1.255976),(-0.404325, 0.100000, 1.255976),(0.023019, -0.000000, 0.483396),(-0.253207, -0.000000, 0.483396),(-0.253207, 0.100000, 0.483396),(0.023019, -0.000000, 0.483396),(-0.253207, 0.100000, 0.483396),(0.023019, 0.100000, 0.483396),(0.333643, 0.000000, 1.076043),(0.333643, 0.000000, 1.306231),(0.333643, 0.100000, 1.306231),(0.333643, 0.000000, 1.076043),(0.333643, 0.100000, 1.306231),(0.333643, 0.100000, 1.076043),(-0.272890, 0.000000, 1.797271),(-0.480059, 0.000000, 1.797271),(-0.480059, 0.100000, 1.797271),(-0.272890, 0.000000, 1.797271),(-0.480059, 0.100000, 1.797271),(-0.272890, 0.100000, 1.797271),(-0.404325, 0.000000, 1.071826),(-0.404325, 0.000000, 1.255976),(-0.404325, 0.100000, 1.255976),(-0.404325, 0.000000, 1.071826),(-0.404325, 0.100000, 1.255976),(-0.404325, 0.100000, 1.071826),(-0.588475, 0.000000, 1.071826),(-0.404325, 0.000000, 1.071826),(-0.404325, 0.100000, 1.071826),(-0.588475, 0.000000, 1.071826),(-0.404325, 0.100000, 1.071826),(-0.588475, 0.100000, 1.071826),(0.333643, 0.000000, 1.306231),(0.103454, 0.000000, 1.306231),(0.103454, 0.100000, 1.306231),(0.333643, 0.000000, 1.306231),(0.103454, 0.100000, 1.306231),(0.333643, 0.100000, 1.306231),(-0.522977, -0.000000, 0.645539),(-0.292788, -0.000000, 0.645539),(-0.292788, 0.100000, 0.645539),(-0.522977, -0.000000, 0.645539),(-0.292788, 0.100000, 0.645539),(-0.522977, 0.100000, 0.645539),(-0.253207, -0.000000, 0.483396),(-0.253207, -0.000000, 0.207170),(-0.253207, 0.100000, 0.207170),(-0.253207, -0.000000, 0.483396),(-0.253207, 0.100000, 0.207170),(-0.253207, 0.100000, 0.483396),(-0.588475, 0.000000, 1.255976),(-0.588475, 0.000000, 1.071826),(-0.588475, 0.100000, 1.071826),(-0.588475, 0.000000, 1.255976),(-0.588475, 0.100000, 1.071826),(-0.588475, 0.100000, 1.255976),(0.103454, 0.000000, 1.306231),(0.103454, 0.000000, 1.076043),(0.103454, 0.100000, 1.076043),(0.103454, 0.000000, 1.306231),(0.103454, 0.100000, 1.076043),(0.103454, 0.100000, 1.306231),(0.000000, 0.000000, 1.150942),(0.000000, 0.000000, 1.381130),(0.000000, 0.100000, 1.381130),(0.000000, 0.000000, 1.150942),(0.000000, 0.100000, 1.381130),(0.000000, 0.100000, 1.150942),(-0.253207, -0.000000, 0.207170),(0.023019, -0.000000, 0.207170),(0.023019, 0.100000, 0.207170),(-0.253207, -0.000000, 0.207170),(0.023019, 0.100000, 0.207170),(-0.253207, 0.100000, 0.207170),(0.000000, 0.000000, 1.381130),(-0.230188, 0.000000, 1.381130),(-0.230188, 0.100000, 1.381130),(0.000000, 0.000000, 1.381130),(-0.230188, 0.100000, 1.381130),(0.000000, 0.100000, 1.381130),(0.103454, 0.000000, 1.076043),(0.333643, 0.000000, 1.076043),(0.333643, 0.100000, 1.076043),(0.103454, 0.000000, 1.076043),(0.333643, 0.100000, 1.076043),(0.103454, 0.100000, 1.076043),(0.023019, -0.000000, 0.207170),(0.023019, -0.000000, 0.483396),(0.023019, 0.100000, 0.483396),(0.023019, -0.000000, 0.207170),(0.023019, 0.100000, 0.483396),(0.023019, 0.100000, 0.207170),(-0.727202, 0.000000, 0.528422),(-0.727202, 0.000000, 0.252196),(-0.727202, 0.100000, 0.252196),(-0.727202, 0.000000, 0.528422),(-0.727202, 0.100000, 0.252196),(-0.727202, 0.100000, 0.528422),(0.223686, 0.000000, 1.549731),(0.223686, 0.000000, 1.687844),(0.223686, 0.100000, 1.687844),(0.223686, 0.000000, 1.549731),(0.223686, 0.100000, 1.687844),(0.223686, 0.100000, 1.549731),(0.256106, -0.000000, 0.663329),(0.256106, 0.000000, 0.893517),(0.256106, 0.100000, 0.893517),(0.256106, -0.000000, 0.663329),(0.256106, 0.100000, 0.893517),(0.256106, 0.100000, 0.663329),(-0.727202, 0.000000, 0.252196),(-0.450976, 0.000000, 0.252196),(-0.450976, 0.100000, 0.252196),(-0.727202, 0.000000, 0.252196),(-0.450976, 0.100000, 0.252196),(-0.727202, 0.100000, 0.252196),(0.085573, 0.000000, 1.549731),(0.223686, 0.000000, 1.549731),(0.223686, 0.100000, 1.549731),(0.085573, 0.000000, 1.549731),(0.223686, 0.100000, 1.549731),(0.085573, 0.100000, 1.549731),(0.299069, -0.000000, 0.471886),(0.299069, -0.000000, 0.218679),(0.299069, 0.100000, 0.218679),(0.299069, -0.000000, 0.471886),(0.299069, 0.100000, 0.218679),(0.299069, 0.100000, 0.471886),(0.552276, -0.000000, 0.218679),(0.552276, -0.000000, 0.471886),(0.552276, 0.100000, 0.471886),(0.552276, -0.000000, 0.218679),(0.552276, 0.100000, 0.471886),(0.552276, 0.100000, 0.218679),(-0.522977, -0.000000, 0.875728),(-0.522977, -0.000000, 0.645539),(-0.522977, 0.100000, 0.645539),(-0.522977, -0.000000, 0.875728),(-0.522977, 0.100000, 0.645539),(-0.522977, 0.100000, 0.875728),(0.552276, -0.000000, 0.471886),(0.299069, -0.000000, 0.471886),(0.299069, 0.100000, 0.471886),(0.552276, -0.000000, 0.471886),(0.299069, 0.100000, 0.471886),(0.552276, 0.100000, 0.471886),(0.299069, -0.000000, 0.218679),(0.552276, -0.000000, 0.218679),(0.552276, 0.100000, 0.218679),(0.299069, -0.000000, 0.218679),(0.552276, 0.100000, 0.218679),(0.299069, 0.100000, 0.218679),(-0.292788, -0.000000, 0.875728),(-0.522977, -0.000000, 0.875728),(-0.522977, 0.100000, 0.875728),(-0.292788, -0.000000, 0.875728),(-0.522977, 0.100000, 0.875728),(-0.292788, 0.100000, 0.875728),(-0.450976, 0.000000, 0.252196),(-0.450976, 0.000000, 0.528422),(-0.450976, 0.100000, 0.528422),(-0.450976, 0.000000, 0.252196),(-0.450976, 0.100000, 0.528422),(-0.450976, 0.100000, 0.252196),(0.025917, 0.000000, 0.893517),(0.025917, -0.000000, 0.663329),(0.025917, 0.100000, 0.663329),(0.025917, 0.000000, 0.893517),(0.025917, 0.100000, 0.663329),(0.025917, 0.100000, 0.893517),(-0.292788, -0.000000, 0.645539),(-0.292788, -0.000000, 0.875728),(-0.292788, 0.100000, 0.875728),(-0.292788, -0.000000, 0.645539),(-0.292788, 0.100000, 0.875728),(-0.292788, 0.100000, 0.645539),(-0.057593, -0.000000, 2.048898),(-0.057593, -0.000000, 2.210031),(-0.057593, 0.100000, 2.210031),(-0.057593, -0.000000, 2.048898),(-0.057593, 0.100000, 2.210031),(-0.057593, 0.100000, 2.048898),(0.025917, -0.000000, 0.663329),(0.256106, -0.000000, 0.663329),(0.256106, 0.100000, 0.663329),(0.025917, -0.000000, 0.663329),(0.256106, 0.100000, 0.663329),(0.025917, 0.100000, 0.663329),(-1.000000, -1.000000, 0.000000),(1.000000, -1.000000, 0.000000),(1.000000, 1.000000, 0.000000),(-1.000000, -1.000000, 0.000000),(1.000000, 1.000000, 0.000000),(-1.000000, 1.000000, 0.000000),)
\ No newline at end of file
@@ -1 +0,0 @@
-SHAPE = ((-0.000000, 0.226909, 0.131224),(0.173669, 0.173669, 0.037235),(-0.000000, 0.245605, 0.037235),(-0.000000, 0.093989, 0.264144),(0.122802, 0.122803, 0.210904),(-0.000000, 0.173669, 0.210904),(-0.000000, 0.226909, -0.056754),(0.173669, 0.173669, 0.037235),(0.160449, 0.160449, -0.056754),(-0.000000, 0.226909, 0.131224),(0.122802, 0.122803, 0.210904),(0.160449, 0.160449, 0.131224),(-0.000000, 0.093989, 0.264144),(-0.000000, 0.000000, 0.282840),(0.066460, 0.066460, 0.264144),(0.173669, 0.173669, 0.037235),(0.226909, 0.000000, -0.056754),(0.160449, 0.160449, -0.056754),(0.160449, 0.160449, 0.131224),(0.173669, 0.000000, 0.210904),(0.226909, 0.000000, 0.131224),(0.066460, 0.066460, 0.264144),(-0.000000, 0.000000, 0.282840),(0.093989, 0.000000, 0.264144),(0.067179, 0.067178, -0.282677),(0.148421, -0.000000, -0.207369),(0.095005, -0.000000, -0.282677),(0.160449, 0.160449, 0.131224),(0.245605, 0.000000, 0.037235),(0.173669, 0.173669, 0.037235),(0.066460, 0.066460, 0.264144),(0.173669, 0.000000, 0.210904),(0.122802, 0.122803, 0.210904),(0.226909, 0.000000, -0.056754),(0.173669, -0.173669, 0.037235),(0.160449, -0.160449, -0.056754),(0.226909, 0.000000, 0.131224),(0.122802, -0.122802, 0.210904),(0.160449, -0.160449, 0.131224),(0.093989, 0.000000, 0.264144),(-0.000000, 0.000000, 0.282840),(0.066460, -0.066460, 0.264144),(0.000000, 0.148421, -0.207369),(-0.067178, 0.067178, -0.282677),(-0.104949, 0.104949, -0.207369),(0.226909, 0.000000, 0.131224),(0.173669, -0.173669, 0.037235),(0.245605, 0.000000, 0.037235),(0.093989, 0.000000, 0.264144),(0.122802, -0.122802, 0.210904),(0.173669, 0.000000, 0.210904),(0.138153, -0.138153, -0.132062),(0.226909, 0.000000, -0.056754),(0.160449, -0.160449, -0.056754),(0.160449, -0.160449, 0.131224),(-0.000000, -0.245605, 0.037235),(0.173669, -0.173669, 0.037235),(0.066460, -0.066460, 0.264144),(-0.000000, -0.173669, 0.210904),(0.122802, -0.122802, 0.210904),(0.160449, -0.160449, -0.056754),(-0.000000, -0.245605, 0.037235),(-0.000000, -0.226909, -0.056754),(0.122802, -0.122802, 0.210904),(-0.000000, -0.226909, 0.131224),(0.160449, -0.160449, 0.131224),(0.066460, -0.066460, 0.264144),(-0.000000, 0.000000, 0.282840),(-0.000000, -0.093989, 0.264144),(-0.000000, -0.245605, 0.037235),(-0.160449, -0.160449, 0.131224),(-0.173669, -0.173669, 0.037235),(-0.000000, -0.093989, 0.264144),(-0.122803, -0.122802, 0.210904),(-0.000000, -0.173669, 0.210904),(-0.000000, -0.245605, 0.037235),(-0.160449, -0.160449, -0.056754),(-0.000000, -0.226909, -0.056754),(-0.000000, -0.173669, 0.210904),(-0.160449, -0.160449, 0.131224),(-0.000000, -0.226909, 0.131224),(-0.000000, -0.093989, 0.264144),(-0.000000, 0.000000, 0.282840),(-0.066460, -0.066460, 0.264144),(0.104950, 0.104949, -0.207369),(0.000000, 0.095005, -0.282677),(0.000000, 0.148421, -0.207369),(-0.160449, -0.160449, -0.056754),(-0.245605, 0.000000, 0.037235),(-0.226910, 0.000000, -0.056754),(-0.122803, -0.122802, 0.210904),(-0.226910, 0.000000, 0.131224),(-0.160449, -0.160449, 0.131224),(-0.066460, -0.066460, 0.264144),(-0.000000, 0.000000, 0.282840),(-0.093989, 0.000000, 0.264144),(0.000000, -0.195378, -0.132062),(0.160449, -0.160449, -0.056754),(-0.000000, -0.226909, -0.056754),(-0.160449, -0.160449, 0.131224),(-0.245605, 0.000000, 0.037235),(-0.173669, -0.173669, 0.037235),(-0.066460, -0.066460, 0.264144),(-0.173669, 0.000000, 0.210904),(-0.122803, -0.122802, 0.210904),(-0.173669, 0.000000, 0.210904),(-0.160449, 0.160449, 0.131224),(-0.226910, 0.000000, 0.131224),(-0.093989, 0.000000, 0.264144),(-0.000000, 0.000000, 0.282840),(-0.066460, 0.066460, 0.264144),(-0.104949, 0.104949, -0.207369),(-0.095004, -0.000000, -0.282677),(-0.148421, -0.000000, -0.207369),(-0.245605, 0.000000, 0.037235),(-0.160449, 0.160449, 0.131224),(-0.173669, 0.173669, 0.037235),(-0.093989, 0.000000, 0.264144),(-0.122803, 0.122803, 0.210904),(-0.173669, 0.000000, 0.210904),(-0.245605, 0.000000, 0.037235),(-0.160449, 0.160449, -0.056754),(-0.226910, 0.000000, -0.056754),(-0.138153, -0.138153, -0.132062),(-0.000000, -0.226909, -0.056754),(-0.160449, -0.160449, -0.056754),(-0.160449, 0.160449, 0.131224),(-0.000000, 0.245605, 0.037235),(-0.173669, 0.173669, 0.037235),(-0.066460, 0.066460, 0.264144),(-0.000000, 0.173669, 0.210904),(-0.122803, 0.122803, 0.210904),(-0.160449, 0.160449, -0.056754),(-0.000000, 0.245605, 0.037235),(-0.000000, 0.226909, -0.056754),(-0.122803, 0.122803, 0.210904),(-0.000000, 0.226909, 0.131224),(-0.160449, 0.160449, 0.131224),(-0.066460, 0.066460, 0.264144),(-0.000000, 0.000000, 0.282840),(-0.000000, 0.093989, 0.264144),(0.000000, -0.000000, -0.445589),(0.000000, 0.070206, -0.444960),(0.049644, 0.049643, -0.444960),(0.000000, -0.000000, -0.445589),(0.049644, 0.049643, -0.444960),(0.070207, -0.000000, -0.444960),(0.000000, -0.000000, -0.445589),(0.070207, -0.000000, -0.444960),(0.049644, -0.049643, -0.444960),(0.000000, -0.000000, -0.445589),(0.049644, -0.049643, -0.444960),(0.000000, -0.070206, -0.444960),(0.000000, -0.000000, -0.445589),(0.000000, -0.070206, -0.444960),(-0.049643, -0.049643, -0.444960),(0.000000, -0.000000, -0.445589),(-0.049643, -0.049643, -0.444960),(-0.070206, -0.000000, -0.444960),(0.000000, -0.000000, -0.445589),(-0.070206, -0.000000, -0.444960),(-0.049643, 0.049643, -0.444960),(0.000000, -0.000000, -0.445589),(-0.049643, 0.049643, -0.444960),(0.000000, 0.070206, -0.444960),(-0.049643, 0.049643, -0.444960),(0.000000, 0.090119, -0.433296),(0.000000, 0.070206, -0.444960),(-0.070206, -0.000000, -0.444960),(-0.063723, 0.063724, -0.433296),(-0.049643, 0.049643, -0.444960),(-0.063723, -0.063724, -0.433296),(-0.070206, -0.000000, -0.444960),(-0.049643, -0.049643, -0.444960),(0.000000, -0.090119, -0.433296),(-0.049643, -0.049643, -0.444960),(0.000000, -0.070206, -0.444960),(0.063724, -0.063724, -0.433296),(0.000000, -0.070206, -0.444960),(0.049644, -0.049643, -0.444960),(0.090119, -0.000000, -0.433296),(0.049644, -0.049643, -0.444960),(0.070207, -0.000000, -0.444960),(0.049644, 0.049643, -0.444960),(0.090119, -0.000000, -0.433296),(0.070207, -0.000000, -0.444960),(0.000000, 0.070206, -0.444960),(0.063724, 0.063724, -0.433296),(0.049644, 0.049643, -0.444960),(0.000001, 0.099347, -0.412708),(0.068022, 0.068021, -0.399513),(0.070250, 0.070249, -0.412708),(0.070250, 0.070249, -0.412708),(0.096197, -0.000000, -0.399513),(0.099348, -0.000000, -0.412708),(0.096197, -0.000000, -0.399513),(0.070250, -0.070249, -0.412708),(0.099348, -0.000000, -0.412708),(0.068022, -0.068021, -0.399513),(0.000001, -0.099347, -0.412708),(0.070250, -0.070249, -0.412708),(0.000000, -0.096196, -0.399513),(-0.070249, -0.070249, -0.412708),(0.000001, -0.099347, -0.412708),(-0.068021, -0.068021, -0.399513),(-0.099347, -0.000000, -0.412708),(-0.070249, -0.070249, -0.412708),(-0.099347, -0.000000, -0.412708),(-0.068021, 0.068021, -0.399513),(-0.070249, 0.070249, -0.412708),(-0.070249, 0.070249, -0.412708),(0.000000, 0.096196, -0.399513),(0.000001, 0.099347, -0.412708),(-0.068435, -0.068435, -0.349237),(-0.099911, -0.000000, -0.365233),(-0.070647, -0.070648, -0.365233),(0.000001, -0.096782, -0.349237),(-0.070647, -0.070648, -0.365233),(0.000001, -0.099911, -0.365233),(-0.068435, 0.068435, -0.349237),(-0.099911, -0.000000, -0.365233),(-0.096782, -0.000000, -0.349237),(0.000001, 0.096782, -0.349237),(-0.070647, 0.070648, -0.365233),(-0.068435, 0.068435, -0.349237),(0.096783, -0.000000, -0.349237),(0.070649, -0.070648, -0.365233),(0.099912, -0.000000, -0.365233),(0.096783, -0.000000, -0.349237),(0.070649, 0.070648, -0.365233),(0.068436, 0.068435, -0.349237),(0.068436, 0.068435, -0.349237),(0.000001, 0.099911, -0.365233),(0.000001, 0.096782, -0.349237),(0.068436, -0.068435, -0.349237),(0.000001, -0.099911, -0.365233),(0.070649, -0.070648, -0.365233),(-0.070249, 0.070249, -0.412708),(0.000000, 0.090119, -0.433296),(-0.063723, 0.063724, -0.433296),(-0.099347, -0.000000, -0.412708),(-0.063723, 0.063724, -0.433296),(-0.090118, -0.000000, -0.433296),(-0.063723, -0.063724, -0.433296),(-0.099347, -0.000000, -0.412708),(-0.090118, -0.000000, -0.433296),(0.000000, -0.090119, -0.433296),(-0.070249, -0.070249, -0.412708),(-0.063723, -0.063724, -0.433296),(0.063724, -0.063724, -0.433296),(0.000001, -0.099347, -0.412708),(0.000000, -0.090119, -0.433296),(0.090119, -0.000000, -0.433296),(0.070250, -0.070249, -0.412708),(0.063724, -0.063724, -0.433296),(0.070250, 0.070249, -0.412708),(0.090119, -0.000000, -0.433296),(0.063724, 0.063724, -0.433296),(0.000001, 0.099347, -0.412708),(0.063724, 0.063724, -0.433296),(0.000000, 0.090119, -0.433296),(-0.068379, -0.068380, -0.307574),(-0.099958, -0.000000, -0.321721),(-0.070681, -0.070682, -0.321721),(0.000001, -0.096703, -0.307574),(-0.070681, -0.070682, -0.321721),(0.000001, -0.099959, -0.321721),(-0.068379, 0.068379, -0.307574),(-0.099958, -0.000000, -0.321721),(-0.096703, -0.000000, -0.307574),(0.000001, 0.096703, -0.307574),(-0.070681, 0.070682, -0.321721),(-0.068379, 0.068379, -0.307574),(0.096704, -0.000000, -0.307574),(0.070682, -0.070682, -0.321721),(0.099959, -0.000000, -0.321721),(0.096704, -0.000000, -0.307574),(0.070682, 0.070682, -0.321721),(0.068380, 0.068379, -0.307574),(0.068380, 0.068379, -0.307574),(0.000001, 0.099959, -0.321721),(0.000001, 0.096703, -0.307574),(0.068380, -0.068380, -0.307574),(0.000001, -0.099959, -0.321721),(0.070682, -0.070682, -0.321721),(0.440526, -0.023107, -0.493787),(0.231328, 0.000977, -0.274618),(0.434003, -0.000114, -0.500706),(0.440526, -0.023107, -0.493787),(0.455855, 0.032388, -0.476649),(0.456116, -0.032649, -0.476886),(0.471643, -0.023126, -0.459901),(0.231328, 0.000977, -0.274618),(0.456116, -0.032649, -0.476886),(0.477994, -0.000114, -0.452801),(0.231328, 0.000977, -0.274618),(0.471643, -0.023126, -0.459901),(0.471447, 0.022882, -0.459746),(0.231328, 0.000977, -0.274618),(0.477994, -0.000114, -0.452801),(0.455855, 0.032388, -0.476649),(0.231328, 0.000977, -0.274618),(0.471447, 0.022882, -0.459746),(0.456116, -0.032649, -0.476886),(0.231328, 0.000977, -0.274618),(0.440526, -0.023107, -0.493787),(0.434003, -0.000114, -0.500706),(0.231328, 0.000977, -0.274618),(0.440352, 0.022863, -0.493607),(-0.432046, 0.032388, 0.478010),(-0.415921, 0.022882, 0.494406),(-0.219336, 0.000977, 0.263572),(-0.415921, 0.022882, 0.494406),(-0.409303, -0.000114, 0.501282),(-0.219336, 0.000977, 0.263572),(-0.409303, -0.000114, 0.501282),(-0.416085, -0.023126, 0.494593),(-0.219336, 0.000977, 0.263572),(-0.416085, -0.023126, 0.494593),(-0.432295, -0.032649, 0.478259),(-0.219336, 0.000977, 0.263572),(-0.432295, -0.032649, 0.478259),(-0.448419, -0.023107, 0.461866),(-0.219336, 0.000977, 0.263572),(-0.448419, -0.023107, 0.461866),(-0.455012, -0.000114, 0.455014),(-0.219336, 0.000977, 0.263572),(-0.455012, -0.000114, 0.455014),(-0.448230, 0.022863, 0.461701),(-0.219336, 0.000977, 0.263572),(-0.448230, 0.022863, 0.461701),(-0.432046, 0.032388, 0.478010),(-0.219336, 0.000977, 0.263572),(0.432048, 0.032383, 0.477735),(0.448386, 0.022873, 0.461565),(0.219338, 0.000977, 0.265851),(0.448386, 0.022873, 0.461565),(0.455237, -0.000114, 0.454930),(0.219338, 0.000977, 0.265851),(0.455237, -0.000114, 0.454930),(0.448574, -0.023118, 0.461729),(0.219338, 0.000977, 0.265851),(0.448574, -0.023118, 0.461729),(0.432297, -0.032645, 0.477985),(0.219338, 0.000977, 0.265851),(0.432297, -0.032645, 0.477985),(0.415954, -0.023108, 0.494161),(0.219338, 0.000977, 0.265851),(0.415954, -0.023108, 0.494161),(0.409122, -0.000114, 0.500778),(0.219338, 0.000977, 0.265851),(0.409122, -0.000114, 0.500778),(0.415789, 0.022864, 0.493972),(0.219338, 0.000977, 0.265851),(0.415789, 0.022864, 0.493972),(0.432048, 0.032383, 0.477735),(0.219338, 0.000977, 0.265851),(-0.195378, 0.000000, -0.132062),(-0.160449, -0.160449, -0.056754),(-0.226910, 0.000000, -0.056754),(-0.099958, -0.000000, -0.321721),(-0.068376, -0.068377, -0.336351),(-0.070681, -0.070682, -0.321721),(-0.070681, -0.070682, -0.321721),(0.000001, -0.096700, -0.336351),(0.000001, -0.099959, -0.321721),(-0.099958, -0.000000, -0.321721),(-0.068376, 0.068377, -0.336351),(-0.096699, -0.000000, -0.336351),(-0.070681, 0.070682, -0.321721),(0.000001, 0.096700, -0.336351),(-0.068376, 0.068377, -0.336351),(0.070682, -0.070682, -0.321721),(0.096700, -0.000000, -0.336352),(0.099959, -0.000000, -0.321721),(0.070682, 0.070682, -0.321721),(0.096700, -0.000000, -0.336352),(0.068377, 0.068377, -0.336352),(0.000001, 0.099959, -0.321721),(0.068377, 0.068377, -0.336352),(0.000001, 0.096700, -0.336351),(0.000001, -0.099959, -0.321721),(0.068377, -0.068377, -0.336352),(0.070682, -0.070682, -0.321721),(-0.099911, -0.000000, -0.365233),(-0.068430, -0.068431, -0.381501),(-0.070647, -0.070648, -0.365233),(-0.070647, -0.070648, -0.365233),(0.000001, -0.096776, -0.381501),(0.000001, -0.099911, -0.365233),(-0.099911, -0.000000, -0.365233),(-0.068430, 0.068431, -0.381501),(-0.096775, -0.000000, -0.381501),(-0.070647, 0.070648, -0.365233),(0.000001, 0.096776, -0.381501),(-0.068430, 0.068431, -0.381501),(0.070649, -0.070648, -0.365233),(0.096776, -0.000000, -0.381501),(0.099912, -0.000000, -0.365233),(0.070649, 0.070648, -0.365233),(0.096776, -0.000000, -0.381501),(0.068431, 0.068431, -0.381501),(0.000001, 0.099911, -0.365233),(0.068431, 0.068431, -0.381501),(0.000001, 0.096776, -0.381501),(0.000001, -0.099911, -0.365233),(0.068431, -0.068431, -0.381501),(0.070649, -0.070648, -0.365233),(-0.049643, 0.049643, -0.444960),(-0.063723, 0.063724, -0.433296),(0.000000, 0.090119, -0.433296),(-0.070206, -0.000000, -0.444960),(-0.090118, -0.000000, -0.433296),(-0.063723, 0.063724, -0.433296),(-0.063723, -0.063724, -0.433296),(-0.090118, -0.000000, -0.433296),(-0.070206, -0.000000, -0.444960),(0.000000, -0.090119, -0.433296),(-0.063723, -0.063724, -0.433296),(-0.049643, -0.049643, -0.444960),(0.063724, -0.063724, -0.433296),(0.000000, -0.090119, -0.433296),(0.000000, -0.070206, -0.444960),(0.090119, -0.000000, -0.433296),(0.063724, -0.063724, -0.433296),(0.049644, -0.049643, -0.444960),(0.049644, 0.049643, -0.444960),(0.063724, 0.063724, -0.433296),(0.090119, -0.000000, -0.433296),(0.000000, 0.070206, -0.444960),(0.000000, 0.090119, -0.433296),(0.063724, 0.063724, -0.433296),(0.000001, 0.099347, -0.412708),(0.000000, 0.096196, -0.399513),(0.068022, 0.068021, -0.399513),(0.070250, 0.070249, -0.412708),(0.068022, 0.068021, -0.399513),(0.096197, -0.000000, -0.399513),(0.096197, -0.000000, -0.399513),(0.068022, -0.068021, -0.399513),(0.070250, -0.070249, -0.412708),(0.068022, -0.068021, -0.399513),(0.000000, -0.096196, -0.399513),(0.000001, -0.099347, -0.412708),(0.000000, -0.096196, -0.399513),(-0.068021, -0.068021, -0.399513),(-0.070249, -0.070249, -0.412708),(-0.068021, -0.068021, -0.399513),(-0.096196, -0.000000, -0.399513),(-0.099347, -0.000000, -0.412708),(-0.099347, -0.000000, -0.412708),(-0.096196, -0.000000, -0.399513),(-0.068021, 0.068021, -0.399513),(-0.070249, 0.070249, -0.412708),(-0.068021, 0.068021, -0.399513),(0.000000, 0.096196, -0.399513),(-0.068435, -0.068435, -0.349237),(-0.096782, -0.000000, -0.349237),(-0.099911, -0.000000, -0.365233),(0.000001, -0.096782, -0.349237),(-0.068435, -0.068435, -0.349237),(-0.070647, -0.070648, -0.365233),(-0.068435, 0.068435, -0.349237),(-0.070647, 0.070648, -0.365233),(-0.099911, -0.000000, -0.365233),(0.000001, 0.096782, -0.349237),(0.000001, 0.099911, -0.365233),(-0.070647, 0.070648, -0.365233),(0.096783, -0.000000, -0.349237),(0.068436, -0.068435, -0.349237),(0.070649, -0.070648, -0.365233),(0.096783, -0.000000, -0.349237),(0.099912, -0.000000, -0.365233),(0.070649, 0.070648, -0.365233),(0.068436, 0.068435, -0.349237),(0.070649, 0.070648, -0.365233),(0.000001, 0.099911, -0.365233),(0.068436, -0.068435, -0.349237),(0.000001, -0.096782, -0.349237),(0.000001, -0.099911, -0.365233),(-0.070249, 0.070249, -0.412708),(0.000001, 0.099347, -0.412708),(0.000000, 0.090119, -0.433296),(-0.099347, -0.000000, -0.412708),(-0.070249, 0.070249, -0.412708),(-0.063723, 0.063724, -0.433296),(-0.063723, -0.063724, -0.433296),(-0.070249, -0.070249, -0.412708),(-0.099347, -0.000000, -0.412708),(0.000000, -0.090119, -0.433296),(0.000001, -0.099347, -0.412708),(-0.070249, -0.070249, -0.412708),(0.063724, -0.063724, -0.433296),(0.070250, -0.070249, -0.412708),(0.000001, -0.099347, -0.412708),(0.090119, -0.000000, -0.433296),(0.099348, -0.000000, -0.412708),(0.070250, -0.070249, -0.412708),(0.070250, 0.070249, -0.412708),(0.099348, -0.000000, -0.412708),(0.090119, -0.000000, -0.433296),(0.000001, 0.099347, -0.412708),(0.070250, 0.070249, -0.412708),(0.063724, 0.063724, -0.433296),(-0.068379, -0.068380, -0.307574),(-0.096703, -0.000000, -0.307574),(-0.099958, -0.000000, -0.321721),(0.000001, -0.096703, -0.307574),(-0.068379, -0.068380, -0.307574),(-0.070681, -0.070682, -0.321721),(-0.068379, 0.068379, -0.307574),(-0.070681, 0.070682, -0.321721),(-0.099958, -0.000000, -0.321721),(0.000001, 0.096703, -0.307574),(0.000001, 0.099959, -0.321721),(-0.070681, 0.070682, -0.321721),(0.096704, -0.000000, -0.307574),(0.068380, -0.068380, -0.307574),(0.070682, -0.070682, -0.321721),(0.096704, -0.000000, -0.307574),(0.099959, -0.000000, -0.321721),(0.070682, 0.070682, -0.321721),(0.068380, 0.068379, -0.307574),(0.070682, 0.070682, -0.321721),(0.000001, 0.099959, -0.321721),(0.068380, -0.068380, -0.307574),(0.000001, -0.096703, -0.307574),(0.000001, -0.099959, -0.321721),(0.455855, 0.032388, -0.476649),(0.434003, -0.000114, -0.500706),(0.440352, 0.022863, -0.493607),(0.409122, -0.000114, 0.500778),(0.432297, -0.032645, 0.477985),(0.455237, -0.000114, 0.454930),(-0.415921, 0.022882, 0.494406),(-0.432046, 0.032388, 0.478010),(-0.432295, -0.032649, 0.478259),(-0.099958, -0.000000, -0.321721),(-0.096699, -0.000000, -0.336351),(-0.068376, -0.068377, -0.336351),(-0.070681, -0.070682, -0.321721),(-0.068376, -0.068377, -0.336351),(0.000001, -0.096700, -0.336351),(-0.099958, -0.000000, -0.321721),(-0.070681, 0.070682, -0.321721),(-0.068376, 0.068377, -0.336351),(-0.070681, 0.070682, -0.321721),(0.000001, 0.099959, -0.321721),(0.000001, 0.096700, -0.336351),(0.070682, -0.070682, -0.321721),(0.068377, -0.068377, -0.336352),(0.096700, -0.000000, -0.336352),(0.070682, 0.070682, -0.321721),(0.099959, -0.000000, -0.321721),(0.096700, -0.000000, -0.336352),(0.000001, 0.099959, -0.321721),(0.070682, 0.070682, -0.321721),(0.068377, 0.068377, -0.336352),(0.000001, -0.099959, -0.321721),(0.000001, -0.096700, -0.336351),(0.068377, -0.068377, -0.336352),(-0.099911, -0.000000, -0.365233),(-0.096775, -0.000000, -0.381501),(-0.068430, -0.068431, -0.381501),(-0.070647, -0.070648, -0.365233),(-0.068430, -0.068431, -0.381501),(0.000001, -0.096776, -0.381501),(-0.099911, -0.000000, -0.365233),(-0.070647, 0.070648, -0.365233),(-0.068430, 0.068431, -0.381501),(-0.070647, 0.070648, -0.365233),(0.000001, 0.099911, -0.365233),(0.000001, 0.096776, -0.381501),(0.070649, -0.070648, -0.365233),(0.068431, -0.068431, -0.381501),(0.096776, -0.000000, -0.381501),(0.070649, 0.070648, -0.365233),(0.099912, -0.000000, -0.365233),(0.096776, -0.000000, -0.381501),(0.000001, 0.099911, -0.365233),(0.070649, 0.070648, -0.365233),(0.068431, 0.068431, -0.381501),(0.000001, -0.099911, -0.365233),(0.000001, -0.096776, -0.381501),(0.068431, -0.068431, -0.381501),(-0.000000, 0.226909, 0.131224),(0.160449, 0.160449, 0.131224),(0.173669, 0.173669, 0.037235),(-0.000000, 0.093989, 0.264144),(0.066460, 0.066460, 0.264144),(0.122802, 0.122803, 0.210904),(-0.000000, 0.226909, -0.056754),(-0.000000, 0.245605, 0.037235),(0.173669, 0.173669, 0.037235),(-0.000000, 0.226909, 0.131224),(-0.000000, 0.173669, 0.210904),(0.122802, 0.122803, 0.210904),(0.173669, 0.173669, 0.037235),(0.245605, 0.000000, 0.037235),(0.226909, 0.000000, -0.056754),(0.160449, 0.160449, 0.131224),(0.122802, 0.122803, 0.210904),(0.173669, 0.000000, 0.210904),(-0.095004, -0.000000, -0.282677),(-0.104949, -0.104949, -0.207369),(-0.148421, -0.000000, -0.207369),(0.160449, 0.160449, 0.131224),(0.226909, 0.000000, 0.131224),(0.245605, 0.000000, 0.037235),(0.066460, 0.066460, 0.264144),(0.093989, 0.000000, 0.264144),(0.173669, 0.000000, 0.210904),(0.226909, 0.000000, -0.056754),(0.245605, 0.000000, 0.037235),(0.173669, -0.173669, 0.037235),(0.226909, 0.000000, 0.131224),(0.173669, 0.000000, 0.210904),(0.122802, -0.122802, 0.210904),(0.104950, 0.104949, -0.207369),(0.195378, 0.000000, -0.132062),(0.148421, -0.000000, -0.207369),(0.226909, 0.000000, 0.131224),(0.160449, -0.160449, 0.131224),(0.173669, -0.173669, 0.037235),(0.093989, 0.000000, 0.264144),(0.066460, -0.066460, 0.264144),(0.122802, -0.122802, 0.210904),(-0.067178, -0.067178, -0.282677),(0.000000, -0.148421, -0.207369),(-0.104949, -0.104949, -0.207369),(0.160449, -0.160449, 0.131224),(-0.000000, -0.226909, 0.131224),(-0.000000, -0.245605, 0.037235),(0.066460, -0.066460, 0.264144),(-0.000000, -0.093989, 0.264144),(-0.000000, -0.173669, 0.210904),(0.160449, -0.160449, -0.056754),(0.173669, -0.173669, 0.037235),(-0.000000, -0.245605, 0.037235),(0.122802, -0.122802, 0.210904),(-0.000000, -0.173669, 0.210904),(-0.000000, -0.226909, 0.131224),(-0.000000, -0.245605, 0.037235),(-0.000000, -0.226909, 0.131224),(-0.160449, -0.160449, 0.131224),(-0.000000, -0.093989, 0.264144),(-0.066460, -0.066460, 0.264144),(-0.122803, -0.122802, 0.210904),(-0.000000, -0.245605, 0.037235),(-0.173669, -0.173669, 0.037235),(-0.160449, -0.160449, -0.056754),(-0.000000, -0.173669, 0.210904),(-0.122803, -0.122802, 0.210904),(-0.160449, -0.160449, 0.131224),(-0.160449, 0.160449, -0.056754),(-0.195378, 0.000000, -0.132062),(-0.226910, 0.000000, -0.056754),(-0.160449, -0.160449, -0.056754),(-0.173669, -0.173669, 0.037235),(-0.245605, 0.000000, 0.037235),(-0.122803, -0.122802, 0.210904),(-0.173669, 0.000000, 0.210904),(-0.226910, 0.000000, 0.131224),(-0.138153, 0.138153, -0.132062),(-0.148421, -0.000000, -0.207369),(-0.195378, 0.000000, -0.132062),(-0.160449, -0.160449, 0.131224),(-0.226910, 0.000000, 0.131224),(-0.245605, 0.000000, 0.037235),(-0.066460, -0.066460, 0.264144),(-0.093989, 0.000000, 0.264144),(-0.173669, 0.000000, 0.210904),(-0.173669, 0.000000, 0.210904),(-0.122803, 0.122803, 0.210904),(-0.160449, 0.160449, 0.131224),(-0.148421, -0.000000, -0.207369),(-0.138153, -0.138153, -0.132062),(-0.195378, 0.000000, -0.132062),(-0.245605, 0.000000, 0.037235),(-0.226910, 0.000000, 0.131224),(-0.160449, 0.160449, 0.131224),(-0.093989, 0.000000, 0.264144),(-0.066460, 0.066460, 0.264144),(-0.122803, 0.122803, 0.210904),(-0.245605, 0.000000, 0.037235),(-0.173669, 0.173669, 0.037235),(-0.160449, 0.160449, -0.056754),(-0.104949, -0.104949, -0.207369),(0.000000, -0.195378, -0.132062),(-0.138153, -0.138153, -0.132062),(-0.160449, 0.160449, 0.131224),(-0.000000, 0.226909, 0.131224),(-0.000000, 0.245605, 0.037235),(-0.066460, 0.066460, 0.264144),(-0.000000, 0.093989, 0.264144),(-0.000000, 0.173669, 0.210904),(-0.160449, 0.160449, -0.056754),(-0.173669, 0.173669, 0.037235),(-0.000000, 0.245605, 0.037235),(-0.122803, 0.122803, 0.210904),(-0.000000, 0.173669, 0.210904),(-0.000000, 0.226909, 0.131224),(0.000000, -0.095005, -0.282677),(0.104950, -0.104949, -0.207369),(0.000000, -0.148421, -0.207369),(0.138153, 0.138153, -0.132062),(0.226909, 0.000000, -0.056754),(0.195378, 0.000000, -0.132062),(0.000000, -0.148421, -0.207369),(0.138153, -0.138153, -0.132062),(0.000000, -0.195378, -0.132062),(0.160449, 0.160449, -0.056754),(0.000000, 0.195378, -0.132062),(-0.000000, 0.226909, -0.056754),(0.138153, 0.138153, -0.132062),(0.000000, 0.148421, -0.207369),(0.000000, 0.195378, -0.132062),(0.067179, -0.067178, -0.282677),(0.148421, -0.000000, -0.207369),(0.104950, -0.104949, -0.207369),(0.104950, -0.104949, -0.207369),(0.195378, 0.000000, -0.132062),(0.138153, -0.138153, -0.132062),(-0.000000, 0.226909, -0.056754),(-0.138153, 0.138153, -0.132062),(-0.160449, 0.160449, -0.056754),(0.000000, 0.195378, -0.132062),(-0.104949, 0.104949, -0.207369),(-0.138153, 0.138153, -0.132062),(0.067179, 0.067178, -0.282677),(0.104950, 0.104949, -0.207369),(0.148421, -0.000000, -0.207369),(0.000000, 0.148421, -0.207369),(0.000000, 0.095005, -0.282677),(-0.067178, 0.067178, -0.282677),(0.138153, -0.138153, -0.132062),(0.195378, 0.000000, -0.132062),(0.226909, 0.000000, -0.056754),(0.104950, 0.104949, -0.207369),(0.067179, 0.067178, -0.282677),(0.000000, 0.095005, -0.282677),(0.000000, -0.195378, -0.132062),(0.138153, -0.138153, -0.132062),(0.160449, -0.160449, -0.056754),(-0.104949, 0.104949, -0.207369),(-0.067178, 0.067178, -0.282677),(-0.095004, -0.000000, -0.282677),(-0.138153, -0.138153, -0.132062),(0.000000, -0.195378, -0.132062),(-0.000000, -0.226909, -0.056754),(-0.195378, 0.000000, -0.132062),(-0.138153, -0.138153, -0.132062),(-0.160449, -0.160449, -0.056754),(0.434003, -0.000114, -0.500706),(0.455855, 0.032388, -0.476649),(0.440526, -0.023107, -0.493787),(0.440352, 0.022863, -0.493607),(0.231328, 0.000977, -0.274618),(0.455855, 0.032388, -0.476649),(0.456116, -0.032649, -0.476886),(0.477994, -0.000114, -0.452801),(0.471643, -0.023126, -0.459901),(0.477994, -0.000114, -0.452801),(0.456116, -0.032649, -0.476886),(0.471447, 0.022882, -0.459746),(0.471447, 0.022882, -0.459746),(0.456116, -0.032649, -0.476886),(0.455855, 0.032388, -0.476649),(0.432048, 0.032383, 0.477735),(0.415789, 0.022864, 0.493972),(0.409122, -0.000114, 0.500778),(0.409122, -0.000114, 0.500778),(0.415954, -0.023108, 0.494161),(0.432297, -0.032645, 0.477985),(0.432297, -0.032645, 0.477985),(0.448574, -0.023118, 0.461729),(0.455237, -0.000114, 0.454930),(0.455237, -0.000114, 0.454930),(0.448386, 0.022873, 0.461565),(0.432048, 0.032383, 0.477735),(0.432048, 0.032383, 0.477735),(0.409122, -0.000114, 0.500778),(0.455237, -0.000114, 0.454930),(-0.432046, 0.032388, 0.478010),(-0.448230, 0.022863, 0.461701),(-0.455012, -0.000114, 0.455014),(-0.455012, -0.000114, 0.455014),(-0.448419, -0.023107, 0.461866),(-0.432046, 0.032388, 0.478010),(-0.448419, -0.023107, 0.461866),(-0.432295, -0.032649, 0.478259),(-0.432046, 0.032388, 0.478010),(-0.432295, -0.032649, 0.478259),(-0.416085, -0.023126, 0.494593),(-0.409303, -0.000114, 0.501282),(-0.409303, -0.000114, 0.501282),(-0.415921, 0.022882, 0.494406),(-0.432295, -0.032649, 0.478259),(-0.095004, -0.000000, -0.282677),(-0.067178, -0.067178, -0.282677),(-0.104949, -0.104949, -0.207369),(0.104950, 0.104949, -0.207369),(0.138153, 0.138153, -0.132062),(0.195378, 0.000000, -0.132062),(-0.067178, -0.067178, -0.282677),(0.000000, -0.095005, -0.282677),(0.000000, -0.148421, -0.207369),(-0.160449, 0.160449, -0.056754),(-0.138153, 0.138153, -0.132062),(-0.195378, 0.000000, -0.132062),(-0.138153, 0.138153, -0.132062),(-0.104949, 0.104949, -0.207369),(-0.148421, -0.000000, -0.207369),(-0.148421, -0.000000, -0.207369),(-0.104949, -0.104949, -0.207369),(-0.138153, -0.138153, -0.132062),(-0.104949, -0.104949, -0.207369),(0.000000, -0.148421, -0.207369),(0.000000, -0.195378, -0.132062),(0.000000, -0.095005, -0.282677),(0.067179, -0.067178, -0.282677),(0.104950, -0.104949, -0.207369),(0.138153, 0.138153, -0.132062),(0.160449, 0.160449, -0.056754),(0.226909, 0.000000, -0.056754),(0.000000, -0.148421, -0.207369),(0.104950, -0.104949, -0.207369),(0.138153, -0.138153, -0.132062),(0.160449, 0.160449, -0.056754),(0.138153, 0.138153, -0.132062),(0.000000, 0.195378, -0.132062),(0.138153, 0.138153, -0.132062),(0.104950, 0.104949, -0.207369),(0.000000, 0.148421, -0.207369),(0.067179, -0.067178, -0.282677),(0.095005, -0.000000, -0.282677),(0.148421, -0.000000, -0.207369),(0.104950, -0.104949, -0.207369),(0.148421, -0.000000, -0.207369),(0.195378, 0.000000, -0.132062),(-0.000000, 0.226909, -0.056754),(0.000000, 0.195378, -0.132062),(-0.138153, 0.138153, -0.132062),(0.000000, 0.195378, -0.132062),(0.000000, 0.148421, -0.207369),(-0.104949, 0.104949, -0.207369),(-0.440526, -0.023107, -0.493787),(-0.434003, -0.000114, -0.500706),(-0.231329, 0.000977, -0.274618),(-0.440526, -0.023107, -0.493787),(-0.456116, -0.032649, -0.476886),(-0.455855, 0.032388, -0.476649),(-0.471643, -0.023126, -0.459901),(-0.456116, -0.032649, -0.476886),(-0.231329, 0.000977, -0.274618),(-0.477994, -0.000114, -0.452801),(-0.471643, -0.023126, -0.459901),(-0.231329, 0.000977, -0.274618),(-0.471448, 0.022882, -0.459746),(-0.477994, -0.000114, -0.452801),(-0.231329, 0.000977, -0.274618),(-0.455855, 0.032388, -0.476649),(-0.471448, 0.022882, -0.459746),(-0.231329, 0.000977, -0.274618),(-0.456116, -0.032649, -0.476886),(-0.440526, -0.023107, -0.493787),(-0.231329, 0.000977, -0.274618),(-0.434003, -0.000114, -0.500706),(-0.440352, 0.022863, -0.493607),(-0.231329, 0.000977, -0.274618),(-0.455855, 0.032388, -0.476649),(-0.440352, 0.022863, -0.493607),(-0.434003, -0.000114, -0.500706),(-0.434003, -0.000114, -0.500706),(-0.440526, -0.023107, -0.493787),(-0.455855, 0.032388, -0.476649),(-0.440352, 0.022863, -0.493607),(-0.455855, 0.032388, -0.476649),(-0.231329, 0.000977, -0.274618),(-0.456116, -0.032649, -0.476886),(-0.471643, -0.023126, -0.459901),(-0.477994, -0.000114, -0.452801),(-0.477994, -0.000114, -0.452801),(-0.471448, 0.022882, -0.459746),(-0.456116, -0.032649, -0.476886),(-0.471448, 0.022882, -0.459746),(-0.455855, 0.032388, -0.476649),(-0.456116, -0.032649, -0.476886),)
\ No newline at end of file
@@ -1 +0,0 @@
-SHAPE = ((0.100819, -0.134342, 1.378268),(-0.100819, -0.117241, 1.378268),(-0.100819, -0.134342, 1.378268),(-0.100819, -0.117241, 1.378268),(0.100819, -0.134342, 1.378268),(0.100819, -0.117241, 1.378268),(-0.100819, -0.134342, 1.378268),(0.100819, -0.134342, 1.176630),(0.100819, -0.134342, 1.378268),(-0.100819, -0.117241, 1.176630),(0.100819, -0.117241, 1.176630),(-0.100819, -0.134342, 1.176630),(0.100819, -0.134342, 1.176630),(-0.100819, -0.134342, 1.176630),(0.100819, -0.117241, 1.176630),(0.100819, -0.117241, 1.176630),(0.100819, -0.117241, 1.378268),(0.100819, -0.134342, 1.176630),(0.100819, -0.134342, 1.378268),(0.100819, -0.134342, 1.176630),(0.100819, -0.117241, 1.378268),(-0.100819, -0.134342, 1.378268),(-0.100819, -0.117241, 1.176630),(-0.100819, -0.134342, 1.176630),(-0.100819, -0.117241, 1.176630),(-0.100819, -0.134342, 1.378268),(-0.100819, -0.117241, 1.378268),(0.100819, -0.134342, 1.176630),(-0.100819, -0.134342, 1.378268),(-0.100819, -0.134342, 1.176630),(-0.000000, 0.053446, 1.710669),(-0.064521, 0.026720, 1.710669),(-0.091246, -0.037800, 1.710668),(-0.000000, 0.053446, 1.710669),(-0.091246, -0.037800, 1.710668),(-0.000000, -0.037800, 1.717347),(-0.000000, 0.053446, 1.710669),(-0.034890, 0.046399, 1.710426),(-0.064521, 0.026720, 1.710669),(-0.091246, -0.037800, 1.710668),(-0.084201, -0.072691, 1.710426),(-0.064521, -0.102321, 1.710669),(0.064520, 0.026720, 1.710669),(-0.000000, 0.053446, 1.710669),(0.091246, -0.037800, 1.710668),(0.091246, -0.037800, 1.710668),(-0.000000, -0.037800, 1.717347),(-0.000000, -0.129046, 1.710668),(0.091246, -0.037800, 1.710668),(-0.000000, 0.053446, 1.710669),(-0.000000, -0.037800, 1.717347),(0.091246, -0.037800, 1.710668),(0.084201, -0.002909, 1.710426),(0.064520, 0.026720, 1.710669),(0.091246, -0.037800, 1.710668),(-0.000000, -0.129046, 1.710668),(0.064520, -0.102321, 1.710669),(-0.000000, -0.037800, 1.717347),(-0.091246, -0.037800, 1.710668),(-0.000000, -0.129046, 1.710668),(-0.000000, -0.129046, 1.710668),(-0.091246, -0.037800, 1.710668),(-0.064521, -0.102321, 1.710669),(-0.000000, -0.129046, 1.710668),(0.034891, -0.122001, 1.710426),(0.064520, -0.102321, 1.710669),(-0.045969, -0.148779, 1.557691),(-0.084940, -0.122740, 1.557751),(-0.084940, -0.122740, 1.506513),(-0.045969, -0.148779, 1.557691),(-0.084940, -0.122740, 1.506513),(-0.045969, -0.148779, 1.506513),(-0.084940, -0.122740, 1.557751),(-0.110979, -0.083769, 1.669221),(-0.110979, -0.083769, 1.557693),(-0.084940, -0.122740, 1.557751),(-0.084940, -0.122740, 1.669338),(-0.110979, -0.083769, 1.669221),(-0.084940, -0.122740, 1.506513),(-0.110979, -0.083769, 1.557693),(-0.110979, -0.083769, 1.506513),(-0.084940, -0.122740, 1.506513),(-0.084940, -0.122740, 1.557751),(-0.110979, -0.083769, 1.557693),(-0.045969, -0.148779, 1.506513),(-0.000000, -0.157924, 1.557751),(-0.045969, -0.148779, 1.557691),(-0.084940, 0.047140, 1.506513),(-0.110979, 0.008169, 1.557693),(-0.084940, 0.047140, 1.557751),(-0.084940, 0.047140, 1.506513),(-0.045969, 0.073179, 1.557691),(-0.045969, 0.073179, 1.506513),(-0.045969, 0.073179, 1.557691),(-0.084940, 0.047140, 1.506513),(-0.084940, 0.047140, 1.557751),(-0.045969, 0.073179, 1.557691),(-0.000000, 0.082323, 1.506513),(-0.045969, 0.073179, 1.506513),(-0.045969, 0.073179, 1.557691),(-0.045969, 0.073179, 1.669218),(-0.000000, 0.082323, 1.557751),(-0.084940, 0.047140, 1.557751),(-0.045969, 0.073179, 1.669218),(-0.045969, 0.073179, 1.557691),(-0.084940, 0.047140, 1.557751),(-0.110979, 0.008169, 1.669221),(-0.084940, 0.047140, 1.669338),(0.110979, 0.008169, 1.506513),(0.084940, 0.047140, 1.506513),(0.110979, 0.008169, 1.557693),(0.084940, 0.047140, 1.506513),(0.045969, 0.073179, 1.557693),(0.084940, 0.047140, 1.557751),(0.110979, 0.008169, 1.557693),(0.120123, -0.037800, 1.506513),(0.110979, 0.008169, 1.506513),(0.110979, 0.008169, 1.557693),(0.084940, 0.047140, 1.506513),(0.084940, 0.047140, 1.557751),(0.084940, 0.047140, 1.557751),(0.045969, 0.073179, 1.669221),(0.084940, 0.047140, 1.669338),(-0.110979, 0.008169, 1.557693),(-0.084940, 0.047140, 1.506513),(-0.110979, 0.008169, 1.506513),(-0.000000, -0.157924, 1.557751),(0.045969, -0.148780, 1.506513),(0.045969, -0.148780, 1.557693),(-0.000000, -0.157924, 1.557751),(-0.045969, -0.148779, 1.506513),(-0.000000, -0.165867, 1.504920),(-0.000000, -0.157924, 1.557751),(0.045969, -0.148780, 1.669221),(-0.000000, -0.157924, 1.669337),(-0.000000, -0.157924, 1.557751),(-0.000000, -0.157924, 1.669337),(-0.045969, -0.148779, 1.669218),(-0.000000, 0.082323, 1.506513),(-0.000000, 0.082323, 1.557751),(0.045969, 0.073179, 1.557693),(-0.000000, 0.082323, 1.506513),(-0.045969, 0.073179, 1.557691),(-0.000000, 0.082323, 1.557751),(-0.000000, 0.082323, 1.557751),(-0.045969, 0.073179, 1.669218),(-0.000000, 0.082323, 1.669337),(-0.000000, 0.082323, 1.557751),(0.045969, 0.073179, 1.669221),(0.045969, 0.073179, 1.557693),(0.045969, -0.148780, 1.506513),(-0.000000, -0.157924, 1.557751),(-0.000000, -0.165867, 1.504920),(0.045969, -0.148780, 1.557693),(0.045969, -0.148780, 1.506513),(0.084940, -0.122740, 1.506513),(0.045969, 0.073179, 1.506513),(-0.000000, 0.082323, 1.506513),(0.045969, 0.073179, 1.557693),(0.045969, 0.073179, 1.557693),(0.084940, 0.047140, 1.506513),(0.045969, 0.073179, 1.506513),(0.045969, 0.073179, 1.557693),(0.045969, 0.073179, 1.669221),(0.084940, 0.047140, 1.557751),(0.084940, -0.122740, 1.557751),(0.084940, -0.122740, 1.669338),(0.045969, -0.148780, 1.669221),(0.084940, -0.122740, 1.557751),(0.045969, -0.148780, 1.557693),(0.084940, -0.122740, 1.506513),(0.084940, -0.122740, 1.557751),(0.084940, -0.122740, 1.506513),(0.110979, -0.083769, 1.557693),(0.084940, -0.122740, 1.506513),(0.110979, -0.083769, 1.506513),(0.110979, -0.083769, 1.557693),(-0.120123, -0.037800, 1.506513),(-0.120123, -0.037800, 1.557751),(-0.110979, 0.008169, 1.557693),(-0.120123, -0.037800, 1.506513),(-0.110979, 0.008169, 1.557693),(-0.110979, 0.008169, 1.506513),(-0.120123, -0.037800, 1.557751),(-0.120123, -0.037800, 1.669337),(-0.110979, 0.008169, 1.669221),(-0.120123, -0.037800, 1.557751),(-0.110979, 0.008169, 1.669221),(-0.110979, 0.008169, 1.557693),(0.120123, -0.037800, 1.506513),(0.110979, 0.008169, 1.557693),(0.120123, -0.037800, 1.557751),(0.120123, -0.037800, 1.557751),(0.110979, 0.008169, 1.669221),(0.120123, -0.037800, 1.669337),(-0.110979, -0.083769, 1.557693),(-0.120123, -0.037800, 1.506513),(-0.110979, -0.083769, 1.506513),(-0.120123, -0.037800, 1.506513),(-0.110979, -0.083769, 1.557693),(-0.120123, -0.037800, 1.557751),(-0.120123, -0.037800, 1.557751),(-0.110979, -0.083769, 1.669221),(-0.120123, -0.037800, 1.669337),(0.110979, -0.083769, 1.506513),(0.120123, -0.037800, 1.506513),(0.110979, -0.083769, 1.557693),(0.110979, -0.083769, 1.557693),(0.120123, -0.037800, 1.506513),(0.120123, -0.037800, 1.557751),(0.110979, -0.083769, 1.557693),(0.110979, -0.083769, 1.669221),(0.084940, -0.122740, 1.557751),(-0.034890, -0.121999, 1.710426),(-0.000000, -0.129046, 1.710668),(-0.064521, -0.102321, 1.710669),(0.034891, 0.046401, 1.710426),(-0.000000, 0.053446, 1.710669),(0.064520, 0.026720, 1.710669),(-0.084201, -0.002909, 1.710426),(-0.091246, -0.037800, 1.710668),(-0.064521, 0.026720, 1.710669),(0.084201, -0.072691, 1.710426),(0.091246, -0.037800, 1.710668),(0.064520, -0.102321, 1.710669),(-0.064521, -0.102321, 1.710669),(-0.110979, -0.083769, 1.669221),(-0.084940, -0.122740, 1.669338),(-0.064521, -0.102321, 1.710669),(-0.045969, -0.148779, 1.669218),(-0.034890, -0.121999, 1.710426),(-0.045969, -0.148779, 1.669218),(-0.064521, -0.102321, 1.710669),(-0.084940, -0.122740, 1.669338),(-0.034890, -0.121999, 1.710426),(-0.045969, -0.148779, 1.669218),(-0.000000, -0.157924, 1.669337),(-0.110979, -0.083769, 1.669221),(-0.064521, -0.102321, 1.710669),(-0.084201, -0.072691, 1.710426),(-0.084201, -0.072691, 1.710426),(-0.120123, -0.037800, 1.669337),(-0.110979, -0.083769, 1.669221),(-0.120123, -0.037800, 1.669337),(-0.084201, -0.072691, 1.710426),(-0.091246, -0.037800, 1.710668),(0.064520, -0.102321, 1.710669),(0.110979, -0.083769, 1.669221),(0.084201, -0.072691, 1.710426),(0.110979, -0.083769, 1.669221),(0.064520, -0.102321, 1.710669),(0.084940, -0.122740, 1.669338),(0.110979, -0.083769, 1.669221),(0.120123, -0.037800, 1.669337),(0.084201, -0.072691, 1.710426),(0.084201, -0.072691, 1.710426),(0.120123, -0.037800, 1.669337),(0.091246, -0.037800, 1.710668),(0.034891, -0.122001, 1.710426),(-0.000000, -0.157924, 1.669337),(0.045969, -0.148780, 1.669221),(0.034891, -0.122001, 1.710426),(0.045969, -0.148780, 1.669221),(0.064520, -0.102321, 1.710669),(0.045969, -0.148780, 1.669221),(0.084940, -0.122740, 1.669338),(0.064520, -0.102321, 1.710669),(-0.000000, -0.157924, 1.669337),(0.034891, -0.122001, 1.710426),(-0.000000, -0.129046, 1.710668),(-0.000000, -0.129046, 1.710668),(-0.034890, -0.121999, 1.710426),(-0.000000, -0.157924, 1.669337),(0.045969, 0.073179, 1.669221),(0.064520, 0.026720, 1.710669),(0.084940, 0.047140, 1.669338),(0.064520, 0.026720, 1.710669),(0.045969, 0.073179, 1.669221),(0.034891, 0.046401, 1.710426),(0.084940, 0.047140, 1.669338),(0.064520, 0.026720, 1.710669),(0.110979, 0.008169, 1.669221),(0.034891, 0.046401, 1.710426),(-0.000000, 0.082323, 1.669337),(-0.000000, 0.053446, 1.710669),(0.084201, -0.002909, 1.710426),(0.110979, 0.008169, 1.669221),(0.064520, 0.026720, 1.710669),(0.084201, -0.002909, 1.710426),(0.120123, -0.037800, 1.669337),(0.110979, 0.008169, 1.669221),(0.120123, -0.037800, 1.669337),(0.084201, -0.002909, 1.710426),(0.091246, -0.037800, 1.710668),(-0.120123, -0.037800, 1.669337),(-0.084201, -0.002909, 1.710426),(-0.110979, 0.008169, 1.669221),(-0.120123, -0.037800, 1.669337),(-0.091246, -0.037800, 1.710668),(-0.084201, -0.002909, 1.710426),(-0.110979, 0.008169, 1.669221),(-0.084201, -0.002909, 1.710426),(-0.064521, 0.026720, 1.710669),(-0.110979, 0.008169, 1.669221),(-0.064521, 0.026720, 1.710669),(-0.084940, 0.047140, 1.669338),(-0.084940, 0.047140, 1.669338),(-0.064521, 0.026720, 1.710669),(-0.045969, 0.073179, 1.669218),(-0.045969, 0.073179, 1.669218),(-0.034890, 0.046399, 1.710426),(-0.000000, 0.082323, 1.669337),(-0.045969, 0.073179, 1.669218),(-0.064521, 0.026720, 1.710669),(-0.034890, 0.046399, 1.710426),(-0.000000, 0.082323, 1.669337),(0.034891, 0.046401, 1.710426),(0.045969, 0.073179, 1.669221),(-0.000000, 0.082323, 1.669337),(-0.034890, 0.046399, 1.710426),(-0.000000, 0.053446, 1.710669),(-0.076214, -0.114014, 1.492280),(-0.041247, -0.137378, 1.492280),(-0.045969, -0.148779, 1.506513),(-0.076214, -0.114014, 1.492280),(-0.110979, -0.083769, 1.506513),(-0.099578, -0.079047, 1.492280),(-0.110979, -0.083769, 1.506513),(-0.076214, -0.114014, 1.492280),(-0.084940, -0.122740, 1.506513),(-0.099578, -0.079047, 1.492280),(-0.120123, -0.037800, 1.506513),(-0.107783, -0.037800, 1.492280),(-0.045969, -0.148779, 1.506513),(-0.084940, -0.122740, 1.506513),(-0.076214, -0.114014, 1.492280),(-0.041247, -0.137378, 1.492280),(-0.000000, -0.145583, 1.492280),(-0.045969, -0.148779, 1.506513),(-0.000000, -0.165867, 1.504920),(-0.045969, -0.148779, 1.506513),(-0.000000, -0.145583, 1.492280),(-0.084940, 0.047140, 1.506513),(-0.099578, 0.003446, 1.492280),(-0.110979, 0.008169, 1.506513),(-0.099578, 0.003446, 1.492280),(-0.084940, 0.047140, 1.506513),(-0.076214, 0.038414, 1.492280),(-0.076214, 0.038414, 1.492280),(-0.045969, 0.073179, 1.506513),(-0.041247, 0.061778, 1.492280),(-0.045969, 0.073179, 1.506513),(-0.076214, 0.038414, 1.492280),(-0.084940, 0.047140, 1.506513),(-0.041247, 0.061778, 1.492280),(-0.000000, 0.082323, 1.506513),(-0.000000, 0.069982, 1.492280),(-0.000000, 0.082323, 1.506513),(-0.041247, 0.061778, 1.492280),(-0.045969, 0.073179, 1.506513),(-0.120123, -0.037800, 1.506513),(-0.099578, 0.003446, 1.492280),(-0.107783, -0.037800, 1.492280),(-0.120123, -0.037800, 1.506513),(-0.110979, 0.008169, 1.506513),(-0.099578, 0.003446, 1.492280),(0.084940, 0.047140, 1.506513),(0.041246, 0.061778, 1.492280),(0.045969, 0.073179, 1.506513),(0.041246, 0.061778, 1.492280),(-0.000000, 0.069982, 1.492280),(-0.000000, 0.082323, 1.506513),(0.041246, 0.061778, 1.492280),(-0.000000, 0.082323, 1.506513),(0.045969, 0.073179, 1.506513),(0.041246, 0.061778, 1.492280),(0.084940, 0.047140, 1.506513),(0.076214, 0.038414, 1.492280),(0.076214, 0.038414, 1.492280),(0.110979, 0.008169, 1.506513),(0.099578, 0.003446, 1.492280),(0.110979, 0.008169, 1.506513),(0.076214, 0.038414, 1.492280),(0.084940, 0.047140, 1.506513),(0.099578, 0.003446, 1.492280),(0.120123, -0.037800, 1.506513),(0.107783, -0.037800, 1.492280),(0.120123, -0.037800, 1.506513),(0.099578, 0.003446, 1.492280),(0.110979, 0.008169, 1.506513),(0.045969, -0.148780, 1.506513),(-0.000000, -0.165867, 1.504920),(-0.000000, -0.145583, 1.492280),(0.045969, -0.148780, 1.506513),(-0.000000, -0.145583, 1.492280),(0.041247, -0.137378, 1.492280),(0.045969, -0.148780, 1.506513),(0.076214, -0.114014, 1.492280),(0.084940, -0.122740, 1.506513),(0.076214, -0.114014, 1.492280),(0.045969, -0.148780, 1.506513),(0.041247, -0.137378, 1.492280),(0.084940, -0.122740, 1.506513),(0.099578, -0.079047, 1.492280),(0.110979, -0.083769, 1.506513),(0.099578, -0.079047, 1.492280),(0.084940, -0.122740, 1.506513),(0.076214, -0.114014, 1.492280),(0.099578, -0.079047, 1.492280),(0.107783, -0.037800, 1.492280),(0.120123, -0.037800, 1.506513),(-0.120123, -0.037800, 1.506513),(-0.099578, -0.079047, 1.492280),(-0.110979, -0.083769, 1.506513),(0.120123, -0.037800, 1.506513),(0.110979, -0.083769, 1.506513),(0.099578, -0.079047, 1.492280),(-0.099578, 0.003446, 1.492280),(0.099578, 0.003446, 1.492280),(-0.000000, -0.145583, 1.492280),(-0.099578, 0.003446, 1.492280),(0.041246, 0.061778, 1.492280),(0.099578, 0.003446, 1.492280),(-0.099578, 0.003446, 1.492280),(-0.099578, -0.079047, 1.492280),(-0.107783, -0.037800, 1.492280),(0.099578, 0.003446, 1.492280),(0.041246, 0.061778, 1.492280),(0.076214, 0.038414, 1.492280),(-0.000000, -0.145583, 1.492280),(0.099578, 0.003446, 1.492280),(0.041247, -0.137378, 1.492280),(-0.041247, 0.061778, 1.492280),(-0.099578, 0.003446, 1.492280),(-0.076214, 0.038414, 1.492280),(0.041246, 0.061778, 1.492280),(-0.099578, 0.003446, 1.492280),(-0.041247, 0.061778, 1.492280),(0.041246, 0.061778, 1.492280),(-0.041247, 0.061778, 1.492280),(-0.000000, 0.069982, 1.492280),(0.041247, -0.137378, 1.492280),(0.099578, -0.079047, 1.492280),(0.076214, -0.114014, 1.492280),(0.041247, -0.137378, 1.492280),(0.099578, 0.003446, 1.492280),(0.099578, -0.079047, 1.492280),(0.099578, -0.079047, 1.492280),(0.099578, 0.003446, 1.492280),(0.107783, -0.037800, 1.492280),(-0.041247, -0.137378, 1.492280),(-0.099578, -0.079047, 1.492280),(-0.099578, 0.003446, 1.492280),(-0.041247, -0.137378, 1.492280),(-0.099578, 0.003446, 1.492280),(-0.000000, -0.145583, 1.492280),(-0.041247, -0.137378, 1.492280),(-0.076214, -0.114014, 1.492280),(-0.099578, -0.079047, 1.492280),(-0.045969, -0.148779, 1.669218),(-0.045969, -0.148779, 1.557691),(-0.000000, -0.157924, 1.557751),(-0.045969, -0.148779, 1.669218),(-0.084940, -0.122740, 1.557751),(-0.045969, -0.148779, 1.557691),(-0.084940, -0.122740, 1.669338),(-0.084940, -0.122740, 1.557751),(-0.045969, -0.148779, 1.669218),(-0.110979, -0.083769, 1.669221),(-0.120123, -0.037800, 1.557751),(-0.110979, -0.083769, 1.557693),(-0.110979, 0.008169, 1.669221),(-0.084940, 0.047140, 1.557751),(-0.110979, 0.008169, 1.557693),(-0.045969, 0.073179, 1.669218),(-0.084940, 0.047140, 1.557751),(-0.084940, 0.047140, 1.669338),(0.045969, 0.073179, 1.669221),(-0.000000, 0.082323, 1.557751),(-0.000000, 0.082323, 1.669337),(0.110979, 0.008169, 1.669221),(0.110979, 0.008169, 1.557693),(0.084940, 0.047140, 1.557751),(0.110979, 0.008169, 1.669221),(0.120123, -0.037800, 1.557751),(0.110979, 0.008169, 1.557693),(0.110979, 0.008169, 1.669221),(0.084940, 0.047140, 1.557751),(0.084940, 0.047140, 1.669338),(0.110979, -0.083769, 1.669221),(0.110979, -0.083769, 1.557693),(0.120123, -0.037800, 1.557751),(0.110979, -0.083769, 1.669221),(0.120123, -0.037800, 1.557751),(0.120123, -0.037800, 1.669337),(0.084940, -0.122740, 1.669338),(0.084940, -0.122740, 1.557751),(0.110979, -0.083769, 1.669221),(0.045969, -0.148780, 1.669221),(0.045969, -0.148780, 1.557693),(0.084940, -0.122740, 1.557751),(0.045969, -0.148780, 1.669221),(-0.000000, -0.157924, 1.557751),(0.045969, -0.148780, 1.557693),(-0.061427, -0.087414, 1.570988),(-0.061427, -0.158580, 1.570988),(-0.081631, -0.158580, 1.579796),(-0.061427, -0.158580, 1.570988),(-0.061427, -0.087414, 1.570988),(-0.041224, -0.158580, 1.579796),(-0.081631, -0.158580, 1.579796),(-0.081631, -0.087414, 1.579796),(-0.061427, -0.087414, 1.570988),(-0.081631, -0.158580, 1.579796),(-0.090439, -0.087414, 1.600000),(-0.081631, -0.087414, 1.579796),(-0.041224, -0.158580, 1.579796),(-0.061427, -0.087414, 1.570988),(-0.041224, -0.087414, 1.579796),(-0.041224, -0.158580, 1.579796),(-0.041224, -0.087414, 1.579796),(-0.032416, -0.087414, 1.600000),(-0.061427, -0.144377, 1.600000),(-0.041224, -0.158580, 1.579796),(-0.032416, -0.158580, 1.600000),(-0.061427, -0.144377, 1.600000),(-0.041224, -0.158580, 1.620204),(-0.061427, -0.158580, 1.629012),(-0.061427, -0.144377, 1.600000),(-0.081631, -0.158580, 1.579796),(-0.061427, -0.158580, 1.570988),(-0.061427, -0.144377, 1.600000),(-0.032416, -0.158580, 1.600000),(-0.041224, -0.158580, 1.620204),(-0.081631, -0.158580, 1.620204),(-0.061427, -0.144377, 1.600000),(-0.061427, -0.158580, 1.629012),(-0.061427, -0.158580, 1.629012),(-0.081631, -0.087414, 1.620204),(-0.081631, -0.158580, 1.620204),(-0.061427, -0.158580, 1.629012),(-0.041224, -0.087414, 1.620204),(-0.061427, -0.087414, 1.629012),(-0.081631, -0.087414, 1.620204),(-0.061427, -0.158580, 1.629012),(-0.061427, -0.087414, 1.629012),(-0.081631, -0.158580, 1.620204),(-0.081631, -0.087414, 1.620204),(-0.090439, -0.087414, 1.600000),(-0.041224, -0.158580, 1.620204),(-0.041224, -0.087414, 1.620204),(-0.061427, -0.158580, 1.629012),(-0.041224, -0.158580, 1.620204),(-0.032416, -0.087414, 1.600000),(-0.041224, -0.087414, 1.620204),(-0.032416, -0.158580, 1.600000),(-0.032416, -0.087414, 1.600000),(-0.041224, -0.158580, 1.620204),(-0.032416, -0.087414, 1.600000),(-0.032416, -0.158580, 1.600000),(-0.041224, -0.158580, 1.579796),(-0.090439, -0.087414, 1.600000),(-0.090439, -0.158580, 1.600000),(-0.081631, -0.158580, 1.620204),(-0.090439, -0.158580, 1.600000),(-0.090439, -0.087414, 1.600000),(-0.081631, -0.158580, 1.579796),(-0.090439, -0.158580, 1.600000),(-0.061427, -0.144377, 1.600000),(-0.081631, -0.158580, 1.620204),(-0.061427, -0.158580, 1.570988),(-0.041224, -0.158580, 1.579796),(-0.061427, -0.144377, 1.600000),(-0.081631, -0.158580, 1.579796),(-0.061427, -0.144377, 1.600000),(-0.090439, -0.158580, 1.600000),(0.061427, -0.087414, 1.570988),(0.061427, -0.158580, 1.570988),(0.041224, -0.158580, 1.579796),(0.061427, -0.158580, 1.570988),(0.061427, -0.087414, 1.570988),(0.081631, -0.158580, 1.579796),(0.041224, -0.158580, 1.579796),(0.041224, -0.087414, 1.579796),(0.061427, -0.087414, 1.570988),(0.041224, -0.158580, 1.579796),(0.032416, -0.087414, 1.600000),(0.041224, -0.087414, 1.579796),(0.081631, -0.158580, 1.579796),(0.061427, -0.087414, 1.570988),(0.081631, -0.087414, 1.579796),(0.081631, -0.158580, 1.579796),(0.081631, -0.087414, 1.579796),(0.090439, -0.087414, 1.600000),(0.061427, -0.144377, 1.600000),(0.081631, -0.158580, 1.579796),(0.090439, -0.158580, 1.600000),(0.061427, -0.144377, 1.600000),(0.081631, -0.158580, 1.620204),(0.061427, -0.158580, 1.629012),(0.061427, -0.144377, 1.600000),(0.090439, -0.158580, 1.600000),(0.081631, -0.158580, 1.620204),(0.061427, -0.144377, 1.600000),(0.041224, -0.158580, 1.579796),(0.061427, -0.158580, 1.570988),(0.041224, -0.158580, 1.620204),(0.061427, -0.144377, 1.600000),(0.061427, -0.158580, 1.629012),(0.061427, -0.158580, 1.629012),(0.041224, -0.087414, 1.620204),(0.041224, -0.158580, 1.620204),(0.041224, -0.087414, 1.620204),(0.061427, -0.158580, 1.629012),(0.061427, -0.087414, 1.629012),(0.041224, -0.158580, 1.620204),(0.041224, -0.087414, 1.620204),(0.032416, -0.087414, 1.600000),(0.061427, -0.087414, 1.629012),(0.081631, -0.158580, 1.620204),(0.081631, -0.087414, 1.620204),(0.081631, -0.158580, 1.620204),(0.061427, -0.087414, 1.629012),(0.061427, -0.158580, 1.629012),(0.081631, -0.158580, 1.620204),(0.090439, -0.087414, 1.600000),(0.081631, -0.087414, 1.620204),(0.090439, -0.158580, 1.600000),(0.090439, -0.087414, 1.600000),(0.081631, -0.158580, 1.620204),(0.090439, -0.087414, 1.600000),(0.090439, -0.158580, 1.600000),(0.081631, -0.158580, 1.579796),(0.032416, -0.087414, 1.600000),(0.032416, -0.158580, 1.600000),(0.041224, -0.158580, 1.620204),(0.032416, -0.158580, 1.600000),(0.032416, -0.087414, 1.600000),(0.041224, -0.158580, 1.579796),(0.041224, -0.158580, 1.579796),(0.061427, -0.144377, 1.600000),(0.032416, -0.158580, 1.600000),(0.032416, -0.158580, 1.600000),(0.061427, -0.144377, 1.600000),(0.041224, -0.158580, 1.620204),(0.061427, -0.158580, 1.570988),(0.081631, -0.158580, 1.579796),(0.061427, -0.144377, 1.600000),(-0.066998, -0.049239, 0.901656),(-0.118497, -0.117241, 1.170262),(-0.135000, -0.100738, 1.170262),(0.066687, -0.049319, 0.902031),(0.135000, -0.100738, 1.170262),(0.118497, -0.117241, 1.170262),(0.135000, -0.100738, 1.170262),(0.118497, -0.117241, 1.399744),(0.118497, -0.117241, 1.170262),(-0.135000, -0.100738, 1.399744),(-0.135000, -0.100738, 1.170262),(-0.118497, -0.117241, 1.399744),(-0.118497, -0.117241, 1.399744),(-0.135000, -0.100738, 1.170262),(-0.118497, -0.117241, 1.170262),(-0.118497, -0.117241, 1.399744),(0.118497, -0.117241, 1.399744),(-0.118497, -0.100738, 1.416247),(0.118497, -0.100738, 1.416247),(-0.118497, -0.100738, 1.416247),(0.118497, -0.117241, 1.399744),(-0.118497, -0.100738, 1.416247),(-0.135000, 0.115312, 1.399744),(-0.135000, -0.100738, 1.399744),(-0.135000, 0.115312, 1.399744),(-0.118497, -0.100738, 1.416247),(-0.118497, 0.118497, 1.416247),(0.118497, -0.117241, 1.399744),(0.135000, -0.100738, 1.170262),(0.135000, -0.100738, 1.399744),(0.135000, -0.100738, 1.399744),(0.135000, 0.115312, 1.399744),(0.118497, -0.100738, 1.416247),(0.118497, -0.100738, 1.416247),(0.135000, 0.115312, 1.399744),(0.116835, 0.116835, 1.416247),(-0.118497, 0.132118, 1.399998),(-0.118398, 0.091370, 1.170262),(-0.135000, 0.115312, 1.399744),(-0.135000, 0.074741, 1.170262),(-0.135000, 0.115312, 1.399744),(-0.118398, 0.091370, 1.170262),(-0.118497, 0.118497, 1.416247),(0.116835, 0.116835, 1.416247),(-0.118497, 0.132118, 1.399998),(0.118497, 0.132118, 1.399998),(-0.118497, 0.132118, 1.399998),(0.116835, 0.116835, 1.416247),(0.135000, 0.115312, 1.399744),(0.118398, 0.091370, 1.170262),(0.118497, 0.132118, 1.399998),(0.118398, 0.091370, 1.170262),(0.135000, 0.115312, 1.399744),(0.135000, 0.074741, 1.170262),(-0.066389, 0.064813, 0.902684),(-0.135000, 0.074741, 1.170262),(-0.118398, 0.091370, 1.170262),(0.066736, 0.065159, 0.902684),(0.118398, 0.091370, 1.170262),(0.135000, 0.074741, 1.170262),(-0.118497, -0.117241, 1.170262),(0.066687, -0.049319, 0.902031),(0.118497, -0.117241, 1.170262),(0.066687, -0.049319, 0.902031),(-0.118497, -0.117241, 1.170262),(-0.066998, -0.049239, 0.901656),(0.116835, 0.116835, 1.416247),(-0.118497, -0.100738, 1.416247),(0.118497, -0.100738, 1.416247),(-0.118497, -0.100738, 1.416247),(0.116835, 0.116835, 1.416247),(-0.118497, 0.118497, 1.416247),(0.118398, 0.091370, 1.170262),(-0.066389, 0.064813, 0.902684),(-0.118398, 0.091370, 1.170262),(0.118398, 0.091370, 1.170262),(-0.118398, 0.091370, 1.170262),(-0.118497, 0.132118, 1.399998),(0.118398, 0.091370, 1.170262),(-0.118497, 0.132118, 1.399998),(0.118497, 0.132118, 1.399998),(-0.066389, 0.064813, 0.902684),(0.118398, 0.091370, 1.170262),(0.066736, 0.065159, 0.902684),(0.066687, -0.049319, 0.902031),(-0.066998, -0.049239, 0.901656),(-0.066389, 0.064813, 0.902684),(0.066687, -0.049319, 0.902031),(-0.066389, 0.064813, 0.902684),(0.066736, 0.065159, 0.902684),(0.066736, 0.065159, 0.902684),(0.135000, 0.074741, 1.170262),(0.066687, -0.049319, 0.902031),(0.135000, 0.074741, 1.170262),(0.135000, -0.100738, 1.399744),(0.135000, -0.100738, 1.170262),(0.135000, -0.100738, 1.170262),(0.066687, -0.049319, 0.902031),(0.135000, 0.074741, 1.170262),(-0.066998, -0.049239, 0.901656),(-0.135000, 0.074741, 1.170262),(-0.066389, 0.064813, 0.902684),(-0.135000, 0.074741, 1.170262),(-0.135000, -0.100738, 1.399744),(-0.135000, 0.115312, 1.399744),(-0.135000, 0.074741, 1.170262),(-0.066998, -0.049239, 0.901656),(-0.135000, -0.100738, 1.170262),(-0.135000, -0.100738, 1.399744),(-0.135000, 0.074741, 1.170262),(-0.135000, -0.100738, 1.170262),(0.135000, -0.100738, 1.399744),(0.135000, 0.074741, 1.170262),(0.135000, 0.115312, 1.399744),(0.118497, -0.117241, 1.399744),(-0.118497, -0.117241, 1.399744),(-0.118497, -0.117241, 1.170262),(0.118497, -0.117241, 1.399744),(-0.118497, -0.117241, 1.170262),(0.118497, -0.117241, 1.170262),(-0.118497, -0.117241, 1.399744),(-0.118497, -0.100738, 1.416247),(-0.135000, -0.100738, 1.399744),(0.135000, -0.100738, 1.399744),(0.118497, -0.100738, 1.416247),(0.118497, -0.117241, 1.399744),(-0.135000, 0.115312, 1.399744),(-0.118497, 0.118497, 1.416247),(-0.118497, 0.132118, 1.399998),(0.118497, 0.132118, 1.399998),(0.116835, 0.116835, 1.416247),(0.135000, 0.115312, 1.399744),(0.069207, -0.069207, 0.698620),(-0.069206, 0.069206, 0.698620),(-0.069206, -0.069207, 0.698620),(-0.069206, 0.069206, 0.698620),(0.069207, -0.069207, 0.698620),(0.069207, 0.069206, 0.698620),(-0.069206, 0.069206, 0.698620),(0.069207, 0.069206, 0.698620),(0.000000, -0.000000, 0.000000),(0.069207, 0.069206, 0.698620),(0.069207, -0.069207, 0.698620),(0.000000, -0.000000, 0.000000),(0.069207, -0.069207, 0.698620),(-0.069206, -0.069207, 0.698620),(0.000000, -0.000000, 0.000000),(-0.069206, -0.069207, 0.698620),(-0.069206, 0.069206, 0.698620),(0.000000, -0.000000, 0.000000),(0.036000, -0.273481, 1.600000),(-0.036000, -0.225744, 1.600000),(-0.036000, -0.273481, 1.600000),(0.036000, -0.273481, 1.600000),(-0.036000, -0.315162, 1.600000),(0.036000, -0.315162, 1.600000),(-0.036000, -0.225744, 1.600000),(0.036000, -0.273481, 1.600000),(0.036000, -0.225744, 1.600000),(-0.036000, -0.225744, 1.600000),(0.036000, -0.168273, 1.600000),(-0.036000, -0.168273, 1.600000),(0.036000, -0.225744, 1.600000),(0.036000, -0.168273, 1.600000),(-0.036000, -0.225744, 1.600000),(-0.036000, -0.315162, 1.600000),(0.036000, -0.273481, 1.600000),(-0.036000, -0.273481, 1.600000),(0.100800, -0.315162, 1.600000),(0.000000, -0.447718, 1.600000),(-0.100800, -0.315162, 1.600000),)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Reflection probe bake worker.
+
+This module is run by background Blender processes to bake a subset of the reflection probes of a copy of the
+current file, so the interactive session can keep being used while the probes bake:
+
+    blender -b <file.blend> --python probe_bake_worker.py -- <json config>
+
+It only depends on bpy so that it can run without the add-on being enabled, the add-on imports the camera setup
+from here so both bake paths stay in sync.
+"""
+
+import json
+import math
+import sys
+
+import bpy
+
+
+def setup_probe_camera(camera_object, camera_data, probe):
+    camera_data.type = "PANO"
+    camera_data.cycles.panorama_type = "EQUIRECTANGULAR"
+
+    camera_data.cycles.longitude_min = -math.pi
+    camera_data.cycles.longitude_max = math.pi
+    camera_data.cycles.latitude_min = -math.pi / 2
+    camera_data.cycles.latitude_max = math.pi / 2
+
+    camera_data.clip_start = probe.data.clip_start
+    camera_data.clip_end = probe.data.clip_end
+
+    camera_object.matrix_world = probe.matrix_world.copy()
+    camera_object.rotation_euler.x += math.pi / 2
+    camera_object.rotation_euler.z += -math.pi / 2
+
+
+def bake_probes(config):
+    scene = bpy.data.scenes[config["scene"]]
+    if bpy.context.window:
+        bpy.context.window.scene = scene
+
+    camera_data = bpy.data.cameras.new(name='Temp EnvMap Camera')
+    camera_object = bpy.data.objects.new('Temp EnvMap Camera', camera_data)
+    scene.collection.objects.link(camera_object)
+
+    scene.camera = camera_object
+    scene.render.engine = "CYCLES"
+    scene.cycles.device = "CPU"
+    if config.get("threads"):
+        scene.render.threads_mode = 'FIXED'
+        scene.render.threads = config["threads"]
+    scene.render.resolution_x = config["resolution_x"]
+    scene.render.resolution_y = config["resolution_y"]
+    scene.render.resolution_percentage = 100
+    scene.render.image_settings.file_format = "HDR"
+    scene.render.use_compositing = config["use_compositor"]
+    scene.use_nodes = config["use_compositor"]
+
+    for probe_name, output_path in config["probes"]:
+        probe = bpy.data.objects[probe_name]
+        setup_probe_camera(camera_object, camera_data, probe)
+        scene.render.filepath = output_path
+        bpy.ops.render.render(write_still=True, scene=scene.name)
+        print(f"Baked probe {probe_name} to {output_path}", flush=True)
+
+
+if __name__ == "__main__":
+    bake_probes(json.loads(sys.argv[sys.argv.index("--") + 1]))
@@ -1,7 +1,7 @@
 import tempfile
 import bpy
 from .components_registry import get_component_by_name, get_components_registry
-from .gizmos import update_gizmos
+from .gizmos import update_gizmos_for_host
 from .types import PanelType
 from mathutils import Vector
 from contextlib import contextmanager
@@ -21,7 +21,7 @@ def add_component(obj, component_name):
     component_class = get_component_by_name(component_name)
     if component_class:
         if 'create_gizmo' in component_class.__dict__:
-            update_gizmos()
+            update_gizmos_for_host(obj)
         component_class.init_instance_version(obj)
         for dep_name in component_class.get_deps():
             dep_class = get_component_by_name(dep_name)
@@ -44,7 +44,7 @@ def remove_component(obj, component_name):
     if component_class:
         del obj[component_class.get_id()]
         if 'create_gizmo' in component_class.__dict__:
-            update_gizmos()
+            update_gizmos_for_host(obj)
         for dep_name in component_class.get_deps():
             dep_class = get_component_by_name(dep_name)
             dep_name = dep_class.get_name()
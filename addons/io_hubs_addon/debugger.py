@@ -1,11 +1,12 @@
 from bpy.app.handlers import persistent
+from contextlib import contextmanager
 import bpy
 from bpy.types import Context
 
-from .preferences import EXPORT_TMP_FILE_NAME, EXPORT_TMP_SCREENSHOT_FILE_NAME
+from .preferences import EXPORT_TMP_FILE_NAME, EXPORT_TMP_PUBLISH_FILE_NAME, EXPORT_TMP_SCREENSHOT_FILE_NAME
 from .utils import is_module_available, save_prefs, find_area, image_type_to_file_ext
 from .icons import get_hubs_icons
-from .hubs_session import HubsSession, PARAMS_TO_STRING
+from .hubs_session import HubsSession, HubsSessionBusyError, PARAMS_TO_STRING
 from . import api
 from bpy.types import AnyType
 
@@ -13,7 +14,179 @@ DEMO_SERVER_URL = ""
 ROOM_FLAGS_DOC_URL = "https://github.com/Hubs-Foundation/hubs-docs/blob/master/docs/hubs-query-string-parameters.md"
 
 
-def export_scene(context):
+# Tracks whether the scene has changed since the last debugger export, so unchanged scenes are not exported again.
+export_scene_state = {
+    "dirty": True,
+    "ignore_updates": False,
+    "signature": None,
+    # The export arguments the cached mesh primitives were extracted with
+    "primitives_args": None,
+}
+# Incremented for a datablock every time the depsgraph updates it, keyed by datablock type and name
+export_revisions = {}
+# Mesh primitives extracted by the last debugger export, keyed by their source datablocks and their revisions
+export_primitives_cache = {}
+# The glTF exporter module whose extract_primitives is wrapped during debugger exports and its original function,
+# so it can be restored if the add-on is unregistered mid export
+patched_extract_primitives = {}
+
+
+def get_export_scene_signature(context, args):
+    export_prefs = context.scene.hubs_scene_debugger_room_export_prefs
+    signature = {
+        "args": repr(sorted(args.items())),
+        "scene": context.scene.name_full,
+        "view_layer": context.view_layer.name,
+        "frame": context.scene.frame_current,
+        # Image changes (ie. painting) don't always trigger depsgraph updates.
+        "images": [(image.name_full, image.is_dirty) for image in bpy.data.images],
+    }
+    if export_prefs.use_selection:
+        signature["selection"] = [ob.name_full for ob in context.selected_objects]
+    if export_prefs.use_active_collection:
+        signature["active_collection"] = context.view_layer.active_layer_collection.name
+    return signature
+
+
+def stop_ignoring_export_updates():
+    export_scene_state["ignore_updates"] = False
+
+
+def get_revision_key(datablock):
+    return (type(datablock).__name__, datablock.name_full)
+
+
+@persistent
+def export_scene_depsgraph_update_post(scene, depsgraph):
+    if not export_scene_state["ignore_updates"]:
+        export_scene_state["dirty"] = True
+        for update in depsgraph.updates:
+            key = get_revision_key(update.id.original)
+            export_revisions[key] = export_revisions.get(key, 0) + 1
+
+
+@persistent
+def export_scene_undo_post(dummy):
+    export_scene_state["dirty"] = True
+    # Undo restores datablocks without reporting them as updated.
+    export_primitives_cache.clear()
+
+
+def get_primitives_cache_key(params):
+    """Returns the key the primitives extracted from a mesh are cached on between exports or None if they can't be
+    reused.  The key changes when any of the datablocks the primitives come from is updated."""
+    if params.get("uuid_for_skined_data") is not None:
+        # Skinned primitives reference the nodes of the export they were extracted for.
+        return None
+
+    blender_mesh = params["blender_mesh"]
+    # The object is passed directly in older glTF exporter versions, the modifiers when it has any in newer ones.
+    blender_object = params.get("blender_object")
+    modifiers = params.get("modifiers")
+    if modifiers is not None:
+        blender_object = modifiers.id_data
+
+    if blender_object is not None:
+        if blender_object.find_armature() is not None:
+            return None
+        sources = [blender_object, blender_object.data]
+    elif bpy.data.meshes.get(blender_mesh.name) == blender_mesh:
+        sources = [blender_mesh]
+    else:
+        # Temporary meshes (ie. converted curves or geometry nodes instances) don't outlive the export.
+        return None
+    sources.extend(material for material in params.get("materials", ()) if material is not None)
+
+    return tuple((key, export_revisions.get(key, 0)) for key in map(get_revision_key, sources))
+
+
+def is_plain_data(value):
+    import numpy as np
+    if isinstance(value, (list, tuple)):
+        return all(is_plain_data(item) for item in value)
+    if isinstance(value, dict):
+        return all(is_plain_data(item) for item in value.values())
+    return value is None or isinstance(value, (np.ndarray, np.generic, str, int, float))
+
+
+def get_extract_primitives_module():
+    """Returns the glTF exporter module with the extract_primitives function the primitives are cached around, or None
+    if this version of the exporter doesn't have one with the parameters the cache key is built from."""
+    import importlib
+    import inspect
+    # The module was renamed in Blender 3.6
+    for name in ("gltf2_blender_gather_primitives_extract", "gltf2_blender_extract"):
+        try:
+            module = importlib.import_module(f"io_scene_gltf2.blender.exp.{name}")
+        except ImportError:
+            continue
+
+        extract_primitives = getattr(module, "extract_primitives", None)
+        if not callable(extract_primitives):
+            return None
+        try:
+            parameters = inspect.signature(extract_primitives).parameters
+        except (TypeError, ValueError):
+            return None
+        if "blender_mesh" not in parameters or not ({"blender_object", "modifiers"} & parameters.keys()):
+            return None
+        return module
+
+    return None
+
+
+def restore_extract_primitives():
+    module = patched_extract_primitives.pop("module", None)
+    if module is not None:
+        module.extract_primitives = patched_extract_primitives.pop("extract_primitives")
+
+
+@contextmanager
+def reuse_mesh_primitives(args_key):
+    """Reuses the mesh primitives extracted by the previous export for the meshes that haven't been updated since.
+    The primitive extraction is the bulk of the glTF export time so this makes re-exports of big scenes with small
+    changes much faster.  Everything else is gathered again as the gathered glTF objects are modified in place by
+    the exporter when it serializes them.  Exports aren't cached with unsupported glTF exporter versions."""
+    import copy
+    import inspect
+    module = get_extract_primitives_module()
+    if module is None or patched_extract_primitives:
+        yield
+        return
+
+    extract_primitives = module.extract_primitives
+    signature = inspect.signature(extract_primitives)
+
+    if export_scene_state["primitives_args"] != args_key:
+        export_primitives_cache.clear()
+        export_scene_state["primitives_args"] = args_key
+    # Only keep the primitives used by this export so the cache doesn't grow with the deleted meshes.
+    previous_cache = dict(export_primitives_cache)
+    export_primitives_cache.clear()
+
+    def extract_cached_primitives(*args, **kwargs):
+        key = get_primitives_cache_key(signature.bind(*args, **kwargs).arguments)
+        if key is not None:
+            primitives = previous_cache.get(key, export_primitives_cache.get(key))
+            if primitives is not None:
+                export_primitives_cache[key] = primitives
+                return copy.deepcopy(primitives)
+
+        primitives = extract_primitives(*args, **kwargs)
+        if key is not None and is_plain_data(primitives):
+            export_primitives_cache[key] = copy.deepcopy(primitives)
+        return primitives
+
+    patched_extract_primitives["module"] = module
+    patched_extract_primitives["extract_primitives"] = extract_primitives
+    module.extract_primitives = extract_cached_primitives
+    try:
+        yield
+    finally:
+        restore_extract_primitives()
+
+
+def export_scene(context, reuse_unchanged=False):
     export_prefs = context.scene.hubs_scene_debugger_room_export_prefs
     import os
     extension = '.glb'
@@ -35,7 +208,22 @@ def export_scene(context):
     if bpy.app.version >= (3, 2, 0):
         args['use_active_scene'] = True
 
-    bpy.ops.export_scene.gltf(**args)
+    signature = get_export_scene_signature(context, args)
+    if reuse_unchanged and not export_scene_state["dirty"] and signature == export_scene_state["signature"] \
+            and os.path.isfile(args['filepath']):
+        return False
+
+    # The export itself (and anything else done by the operator in this event loop iteration) can trigger depsgraph updates that don't change the exported scene.
+    export_scene_state["ignore_updates"] = True
+    if not bpy.app.timers.is_registered(stop_ignoring_export_updates):
+        bpy.app.timers.register(stop_ignoring_export_updates)
+
+    export_scene_state["signature"] = None
+    with reuse_mesh_primitives(signature["args"]):
+        bpy.ops.export_scene.gltf(**args)
+    export_scene_state["dirty"] = False
+    export_scene_state["signature"] = signature
+    return True
 
 
 hubs_session = None
@@ -59,7 +247,7 @@ class HubsUpdateRoomOperator(bpy.types.Operator):
     @classmethod
     def description(cls, context, properties):
         is_scene_update = context.scene.hubs_scene_debugger_room_create_prefs.debugLocalScene
-        if hubs_session.is_alive():
+        if hubs_session.alive:
             room_params = hubs_session.room_params
             is_scene_update = "debugLocalScene" in room_params
 
@@ -103,7 +291,11 @@ class HubsUpdateRoomOperator(bpy.types.Operator):
                         ob.select_set(True)
                     context.view_layer.objects.active = active_ob
 
-            export_scene(context)
+            # Adding the viewpoint changes the scene, so only reuse the previous export when it's not needed.
+            export_scene(context, reuse_unchanged=viewpoint is None)
+            if viewpoint:
+                # The exported file has the temporary viewpoint, don't let the next export reuse it.
+                export_scene_state["dirty"] = True
 
             hubs_session.update()
             hubs_session.bring_to_front(context)
@@ -121,8 +313,11 @@ class HubsUpdateRoomOperator(bpy.types.Operator):
             return {'FINISHED'}
         except Exception as err:
             print(err)
-            bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report", report_string='\n\n'.join(
-                ["The scene export has failed", "Check the export logs or quit the browser instance and try again", f'{err}']))
+            if isinstance(err, HubsSessionBusyError):
+                self.report({'WARNING'}, str(err))
+            else:
+                bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report", report_string='\n\n'.join(
+                    ["The scene export has failed", "Check the export logs or quit the browser instance and try again", f'{err}']))
 
             if viewpoint:
                 ob = bpy.context.scene.objects["__scene_debugger_viewpoint"]
@@ -156,6 +351,10 @@ class HubsCreateRoomOperator(bpy.types.Operator):
 
             return {'FINISHED'}
 
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
+
         except Exception as err:
             hubs_session.close()
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
@@ -194,6 +393,10 @@ class HubsOpenRoomOperator(bpy.types.Operator):
 
             return {'FINISHED'}
 
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
+
         except Exception as err:
             hubs_session.close()
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
@@ -209,13 +412,17 @@ class HubsCloseRoomOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: Context):
-        return hubs_session.is_alive()
+        return hubs_session.alive
 
     def execute(self, context):
         try:
             hubs_session.close()
             return {'FINISHED'}
 
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
+
         except Exception as err:
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
                                           report_string=f'An error happened while closing the browser window: {err}')
@@ -230,7 +437,7 @@ class HubsOpenAddonPrefsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: Context):
-        return not hubs_session.is_alive()
+        return not hubs_session.alive
 
     def execute(self, context):
         bpy.ops.screen.userpref_show('INVOKE_DEFAULT')
@@ -358,14 +565,14 @@ class HUBS_PT_ToolsSceneDebuggerUpdatePanel(bpy.types.Panel):
                      "export_force_sampling")
 
         row = box.row()
-        if not hubs_session.is_alive() or not hubs_session.user_logged_in:
+        if not hubs_session.alive or not hubs_session.user_logged_in:
             row = box.row()
             row.alert = True
             row.label(
                 text="You need to be signed in to Hubs to update the room scene")
 
         update_mode = "Update current scene" if context.scene.hubs_scene_debugger_room_create_prefs.debugLocalScene else "Spawn as object"
-        if hubs_session.is_alive():
+        if hubs_session.alive:
             room_params = hubs_session.room_params
             update_mode = "Update current scene" if "debugLocalScene" in room_params else "Spawn as object"
         row = box.row()
@@ -396,7 +603,7 @@ class HUBS_PT_ToolsSceneSessionPanel(bpy.types.Panel):
             col.alignment = "LEFT"
             col.label(text="Connection Status:")
             hubs_icons = get_hubs_icons()
-            if hubs_session.is_alive():
+            if hubs_session.alive:
                 if hubs_session.user_logged_in:
                     if hubs_session.user_in_room:
                         col = row.column()
@@ -468,7 +675,7 @@ class HUBS_PT_ToolsSceneDebuggerPanel(bpy.types.Panel):
 
     def draw(self, context):
         params_icons = {}
-        if hubs_session.is_alive():
+        if hubs_session.alive:
             for key in PARAMS_TO_STRING.keys():
                 params_icons[key] = 'PANEL_CLOSE'
 
@@ -548,8 +755,8 @@ class HubsSceneDebuggerRoomAdd(bpy.types.Operator):
         prefs = context.window_manager.hubs_scene_debugger_prefs
         new_room = prefs.hubs_rooms.add()
         url = self.url
-        if hubs_session.is_alive():
-            current_url = hubs_session.get_url()
+        if hubs_session.alive:
+            current_url = hubs_session.url
             if current_url:
                 url = current_url
                 if "hub_id=" in url:
@@ -558,7 +765,7 @@ class HubsSceneDebuggerRoomAdd(bpy.types.Operator):
                     url = url.split("?")[0]
 
         new_room.name = "Room Name"
-        if hubs_session.is_alive():
+        if hubs_session.alive:
             room_name = hubs_session.room_name
             if room_name:
                 new_room.name = room_name
@@ -613,35 +820,100 @@ class HUBS_UL_ToolsSceneDebuggerRooms(bpy.types.UIList):
         split.prop(item, "url", text="", emboss=False)
 
 
-class HubsPublishSceneOperator(bpy.types.Operator):
+publish_job = None
+
+
+class HubsPublishJobOperator:
+    """Runs an api.PublishJob in the background and reports its progress until it's done."""
+
+    job_description = ""
+
+    def start_publish_job(self, context, job):
+        global publish_job
+        publish_job = job
+        publish_job.start()
+
+        self._timer = context.window_manager.event_timer_add(0.25, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        global publish_job
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if not publish_job.done:
+            context.workspace.status_text_set(f'{self.job_description}: {publish_job.progress * 100:.0f}%')
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        job = publish_job
+        publish_job = None
+
+        import os
+        try:
+            os.remove(job.uploads["model"])
+        except OSError:
+            pass
+
+        if job.error:
+            bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
+                                          report_string=f'{self.get_error_message()}: {job.error}')
+            return {'CANCELLED'}
+
+        bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
+                                      report_string=self.get_success_message())
+        self.on_job_finished(context, job)
+        return {'FINISHED'}
+
+    def copy_export(self):
+        """View Scene can export the scene again while the job is uploading it, so the job uploads its own copy."""
+        import os
+        import shutil
+        glb_path = os.path.join(bpy.app.tempdir, EXPORT_TMP_PUBLISH_FILE_NAME)
+        shutil.copyfile(os.path.join(bpy.app.tempdir, EXPORT_TMP_FILE_NAME), glb_path)
+        return glb_path
+
+    def get_success_message(self):
+        return ""
+
+    def get_error_message(self):
+        return ""
+
+    def on_job_finished(self, context, job):
+        pass
+
+
+def is_publishing():
+    return publish_job is not None
+
+
+class HubsPublishSceneOperator(HubsPublishJobOperator, bpy.types.Operator):
     bl_idname = "hubs_scene.publish_scene"
     bl_label = "Publish"
     bl_description = "Publish current Blender scene"
     bl_options = {'REGISTER', 'UNDO'}
 
+    job_description = "Publishing scene"
+
     @classmethod
     def poll(cls, context: Context):
         props = context.scene.hubs_scene_debugger_scene_publish_props
-        return hubs_session.is_alive() and hubs_session.user_logged_in and props.screenshot and props.scene_name
+        return not is_publishing() and hubs_session.alive and hubs_session.user_logged_in and props.screenshot and props.scene_name
 
     def execute(self, context):
         try:
-            export_scene(context)
+            export_scene(context, reuse_unchanged=True)
             import os
             url = hubs_session.reticulum_url
 
             scene_data = {}
 
-            name = context.scene.hubs_scene_debugger_scene_publish_props.scene_name
-            scene_data.update({"name": name})
+            self.scene_name = context.scene.hubs_scene_debugger_scene_publish_props.scene_name
+            scene_data.update({"name": self.scene_name})
 
-            glb_path = os.path.join(bpy.app.tempdir, EXPORT_TMP_FILE_NAME)
-            glb = open(glb_path, "rb")
-            glb_data = api.upload_media(url, glb)
-            scene_data.update({
-                "model_file_id": glb_data["file_id"],
-                "model_file_token": glb_data["access_token"]
-            })
+            glb_path = self.copy_export()
 
             screenshot = context.scene.hubs_scene_debugger_scene_publish_props.screenshot
             if screenshot.type in ['RENDER_RESULT', 'COMPOSITING'] or screenshot.packed_file:
@@ -652,12 +924,6 @@ class HubsPublishSceneOperator(bpy.types.Operator):
             else:
                 screenshot_full = bpy.path.abspath(screenshot.filepath, library=screenshot.library)
             screenshot_norm = os.path.normpath(screenshot_full)
-            screenshot_data = api.upload_media(
-                url, open(screenshot_norm, "rb"))
-            scene_data.update({
-                "screenshot_file_id": screenshot_data["file_id"],
-                "screenshot_file_token": screenshot_data["access_token"]
-            })
 
             scene_data.update({
                 "allow_remixing": False,
@@ -667,62 +933,71 @@ class HubsPublishSceneOperator(bpy.types.Operator):
                     "content": []
                 }
             })
-            api.publish_scene(url, hubs_session.get_token(), scene_data)
-
-            bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
-                                          report_string=f'Scene {name} successfully published')
 
-            bpy.ops.hubs_scene.get_scenes()
+            # The uploads and publishing happen in the background, the file ids and tokens are added to the scene data once uploaded.
+            job = api.PublishJob(url, hubs_session.get_token(), scene_data, glb_path, screenshot_path=screenshot_norm)
+            return self.start_publish_job(context, job)
 
-            return {'FINISHED'}
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
 
         except Exception as err:
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
                                           report_string=f'An error happened while publishing the scene: {err}')
             return {"CANCELLED"}
 
+    def get_success_message(self):
+        return f'Scene {self.scene_name} successfully published'
 
-class HubsUpdateSceneOperator(bpy.types.Operator):
+    def get_error_message(self):
+        return 'An error happened while publishing the scene'
+
+    def on_job_finished(self, context, job):
+        bpy.ops.hubs_scene.get_scenes()
+
+
+class HubsUpdateSceneOperator(HubsPublishJobOperator, bpy.types.Operator):
     bl_idname = "hubs_scene.update_scene"
     bl_label = "Update"
     bl_description = "Updates the selected scene with the Blender scene"
     bl_options = {'REGISTER', 'UNDO'}
 
+    job_description = "Updating scene"
+
     @classmethod
     def poll(cls, context: Context):
-        return hubs_session.is_alive() and hubs_session.user_logged_in and context.window_manager.hubs_scene_debugger_scenes_props.scene_idx > -1
+        return not is_publishing() and hubs_session.alive and hubs_session.user_logged_in and context.window_manager.hubs_scene_debugger_scenes_props.scene_idx > -1
 
     def execute(self, context):
         try:
-            export_scene(context)
+            export_scene(context, reuse_unchanged=True)
             import os
             url = hubs_session.reticulum_url
 
             scenes = context.window_manager.hubs_scene_debugger_scenes_props
             scene = scenes.scenes[scenes.scene_idx]
+            self.scene_name = scene.name
 
-            scene_data = {}
-
-            glb_path = os.path.join(bpy.app.tempdir, EXPORT_TMP_FILE_NAME)
-            glb = open(glb_path, "rb")
-            glb_data = api.upload_media(url, glb)
-            scene_data.update({
-                "model_file_id": glb_data["file_id"],
-                "model_file_token": glb_data["access_token"]
-            })
-            api.publish_scene(url, hubs_session.get_token(),
-                              scene_data, scene.scene_id)
-
-            bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
-                                          report_string=f'Scene {scene.name} successfully updated')
+            glb_path = self.copy_export()
+            job = api.PublishJob(url, hubs_session.get_token(), {}, glb_path, scene_id=scene.scene_id)
+            return self.start_publish_job(context, job)
 
-            return {'FINISHED'}
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
 
         except Exception as err:
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
                                           report_string=f'An error happened while updated the scene: {err}')
             return {"CANCELLED"}
 
+    def get_success_message(self):
+        return f'Scene {self.scene_name} successfully updated'
+
+    def get_error_message(self):
+        return 'An error happened while updated the scene'
+
     def invoke(self, context, event):
         def draw(self, context):
             row = self.layout.row()
@@ -744,7 +1019,7 @@ class HubsCreateRoomWithSceneOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: Context):
-        return hubs_session.is_alive() and hubs_session.user_logged_in and context.window_manager.hubs_scene_debugger_scenes_props.scene_idx > -1
+        return hubs_session.alive and hubs_session.user_logged_in and context.window_manager.hubs_scene_debugger_scenes_props.scene_idx > -1
 
     def execute(self, context):
         try:
@@ -791,6 +1066,10 @@ class HubsCreateRoomWithSceneOperator(bpy.types.Operator):
 
             return {'FINISHED'}
 
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
+
         except Exception as err:
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
                                           report_string=f'An error happened while opening the scene: {err}')
@@ -805,7 +1084,7 @@ class HubsGetScenesOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: Context):
-        return hubs_session.is_alive() and hubs_session.user_logged_in
+        return hubs_session.alive and hubs_session.user_logged_in
 
     def execute(self, context):
         scenes_props = context.window_manager.hubs_scene_debugger_scenes_props
@@ -831,6 +1110,10 @@ class HubsGetScenesOperator(bpy.types.Operator):
 
             return {'FINISHED'}
 
+        except HubsSessionBusyError as err:
+            self.report({'WARNING'}, str(err))
+            return {"CANCELLED"}
+
         except Exception as err:
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs scene debugger report",
                                           report_string=f'An error happened while getting the scenes: {err}')
@@ -846,7 +1129,7 @@ class HUBS_UL_ToolsSceneDebuggerProjects(bpy.types.UIList):
         items = getattr(data, property)
         filtered = [self.bitflag_filter_item] * len(items)
         ordered = [i for i, item in enumerate(items)]
-        ret_instance = hubs_session.reticulum_url if hubs_session.is_alive() else None
+        ret_instance = hubs_session.reticulum_url if hubs_session.alive else None
         filter = not scene_props.instance or ret_instance != scene_props.instance
         if filter:
             for i, item in enumerate(items):
@@ -873,7 +1156,7 @@ class HUBS_PT_ToolsSceneDebuggerPublishScenePanel(bpy.types.Panel):
         return is_module_available("selenium")
 
     def draw(self, context: Context):
-        if not hubs_session.is_alive() or not hubs_session.user_logged_in:
+        if not hubs_session.alive or not hubs_session.user_logged_in:
             box = self.layout.box()
             row = box.row()
             row.alert = True
@@ -1096,13 +1379,21 @@ def init():
 
 @persistent
 def load_post(dummy):
+    export_scene_state["dirty"] = True
+    export_primitives_cache.clear()
+    export_revisions.clear()
     init()
 
 
 @persistent
 def update_session():
-    hubs_session.update_session_state()
-    return 2.0
+    # The session state is polled in the background, only redraw the panels when it changes.
+    if hubs_session.consume_state_changed():
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return 0.5
 
 
 classes = (
@@ -1141,6 +1432,7 @@ classes = (
 def register():
     global hubs_session
     hubs_session = HubsSession()
+    hubs_session.start_polling()
 
     for cls in (classes):
         bpy.utils.register_class(cls)
@@ -1158,11 +1450,19 @@ def register():
 
     if load_post not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(load_post)
+    if export_scene_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(export_scene_depsgraph_update_post)
+    if export_scene_undo_post not in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.append(export_scene_undo_post)
+    if export_scene_undo_post not in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.append(export_scene_undo_post)
 
     init()
 
 
 def unregister():
+    restore_extract_primitives()
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -1177,5 +1477,15 @@ def unregister():
 
     if load_post in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(load_post)
-
+    if export_scene_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(export_scene_depsgraph_update_post)
+    if export_scene_undo_post in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(export_scene_undo_post)
+    if export_scene_undo_post in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(export_scene_undo_post)
+    if bpy.app.timers.is_registered(stop_ignoring_export_updates):
+        bpy.app.timers.unregister(stop_ignoring_export_updates)
+
+    hubs_session.stop_polling()
     hubs_session.close()
+    api.close_session()
@@ -1,4 +1,7 @@
 import bpy
+import functools
+import threading
+import time
 from .preferences import get_addon_pref, EXPORT_TMP_FILE_NAME
 from .utils import is_module_available, get_browser_profile_directory
 
@@ -22,6 +25,51 @@ PARAMS_TO_STRING = {
     },
 }
 
+# The session state is polled from a background thread so the WebDriver round-trips don't block the UI.
+# The poll interval is backed off up to SESSION_POLL_MAX_INTERVAL while the browser is unresponsive.
+SESSION_POLL_INTERVAL = 2.0
+SESSION_POLL_MAX_INTERVAL = 30.0
+SESSION_POLL_SLOW_TIME = 1.0
+# How long the main thread waits for the poller to release the driver before giving up, so the UI doesn't freeze.
+SESSION_DRIVER_LOCK_TIMEOUT = 0.5
+
+
+class HubsSessionBusyError(Exception):
+    pass
+
+
+def with_driver_lock(func):
+    """WebDriver isn't thread safe and it's used both from the main thread and from the poller thread,
+    so every method that touches it holds the session driver lock.  Only the poller waits for it, other
+    threads raise HubsSessionBusyError if the poller is still in a round-trip after SESSION_DRIVER_LOCK_TIMEOUT."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if threading.current_thread() is self._poll_thread:
+            acquired = self._driver_lock.acquire()
+        else:
+            acquired = self._driver_lock.acquire(timeout=SESSION_DRIVER_LOCK_TIMEOUT)
+        if not acquired:
+            raise HubsSessionBusyError("The browser is busy, try again in a moment")
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._driver_lock.release()
+    return wrapper
+
+
+def get_default_session_state():
+    return {
+        "alive": False,
+        "user_logged_in": False,
+        "user_in_room": False,
+        "room_name": "",
+        "room_params": {},
+        "reticulum_url": "",
+        "client_url": "",
+        "url": "",
+    }
+
+
 JS_DROP_FILE = """
     var target = arguments[0],
         offsetX = arguments[1],
@@ -79,13 +127,19 @@ JS_WAYPOINT_UPDATE = """
 
 class HubsSession:
     _web_driver = None
-    _user_logged_in = False
-    _user_in_room = False
-    _room_name = ""
-    _room_params = {}
-    _reticulum_url = ""
-    _client_url = ""
 
+    def __init__(self):
+        # Snapshot of the session state, it's replaced as a whole so readers always see a consistent state.
+        self._state = get_default_session_state()
+        self._state_changed = False
+        self._poll_thread = None
+        self._poll_stop = threading.Event()
+        self._poll_wake = threading.Event()
+        self._poll_interval = SESSION_POLL_INTERVAL
+        # Reentrant as the driver methods call each other (ie. get_token -> is_alive).
+        self._driver_lock = threading.RLock()
+
+    @with_driver_lock
     def init(self, context):
         browser = get_addon_pref(context).browser
         if self.is_alive():
@@ -98,6 +152,7 @@ class HubsSession:
             self.__create_instance(context)
             return False
 
+    @with_driver_lock
     def close(self):
         if self._web_driver:
             # Hack, without this the browser instances don't close the session correctly and
@@ -113,6 +168,9 @@ class HubsSession:
             self._web_driver.quit()
             self._web_driver = None
 
+        self._publish_state(get_default_session_state())
+
+    @with_driver_lock
     def __create_instance(self, context):
         if not self._web_driver or not self.is_alive():
             self.close()
@@ -153,23 +211,78 @@ class HubsSession:
                     options.binary_location = chrome_path
                 self._web_driver = selenium.Chrome(options=options)
 
+    def start_polling(self):
+        if self._poll_thread and self._poll_thread.is_alive():
+            return
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(target=self._poll_session_state, name="HubsSessionPoller", daemon=True)
+        self._poll_thread.start()
+
+    def stop_polling(self):
+        self._poll_stop.set()
+        self._poll_wake.set()
+        if self._poll_thread:
+            # Wait for the current poll to finish so the driver isn't closed while it's being used.
+            self._poll_thread.join()
+            self._poll_thread = None
+
+    def request_update(self):
+        """Wake the poller up so the state is updated as soon as possible."""
+        self._poll_interval = SESSION_POLL_INTERVAL
+        self._poll_wake.set()
+
+    def consume_state_changed(self):
+        changed = self._state_changed
+        self._state_changed = False
+        return changed
+
+    def _publish_state(self, state):
+        if state != self._state:
+            self._state = state
+            self._state_changed = True
+
+    def _poll_session_state(self):
+        while not self._poll_stop.is_set():
+            start = time.monotonic()
+            try:
+                self._publish_state(self._read_session_state())
+                responsive = time.monotonic() - start < SESSION_POLL_SLOW_TIME
+            except Exception:
+                # The browser is busy (ie. loading a big scene), keep the last state and try again later.
+                responsive = False
+
+            if responsive:
+                self._poll_interval = SESSION_POLL_INTERVAL
+            else:
+                self._poll_interval = min(self._poll_interval * 2, SESSION_POLL_MAX_INTERVAL)
+
+            self._poll_wake.wait(self._poll_interval)
+            self._poll_wake.clear()
+
     def update_session_state(self):
+        self._publish_state(self._read_session_state())
+
+    @with_driver_lock
+    def _read_session_state(self):
+        state = get_default_session_state()
         if self.is_alive():
+            state["alive"] = True
             url = self._web_driver.current_url
+            state["url"] = url
             from urllib.parse import urlparse
             from urllib.parse import parse_qs
             parsed = urlparse(url)
             params = parse_qs(parsed.query, keep_blank_values=True)
-            self._room_params = {k: v for k, v in params.items() if k != "hub_id"}
+            state["room_params"] = {k: v for k, v in params.items() if k != "hub_id"}
 
-            self._client_url = f'{parsed.scheme}://{parsed.hostname}:{parsed.port}'
+            state["client_url"] = f'{parsed.scheme}://{parsed.hostname}:{parsed.port}'
 
             params = self._web_driver.execute_script(JS_STATE_UPDATE)
-            self._user_logged_in = params["signedIn"] or "debugLocalScene" not in self._room_params
-            self._user_in_room = params["entered"]
-            self._room_name = params["roomName"]
-            self._reticulum_url = params["reticulumUrl"]
-            if not self._reticulum_url:
+            state["user_logged_in"] = params["signedIn"] or "debugLocalScene" not in state["room_params"]
+            state["user_in_room"] = params["entered"]
+            state["room_name"] = params["roomName"]
+            state["reticulum_url"] = params["reticulumUrl"]
+            if not state["reticulum_url"]:
                 import urllib
                 base_assets_path = self._get_env_meta("base_assets_path")
                 isUsingCloudflare = base_assets_path and "workers.dev" in base_assets_path
@@ -181,14 +294,11 @@ class HubsSession:
                         ret_host = self._get_env_meta("reticulum_server")
                 if ret_host:
                     ret_port = urllib.parse.urlparse(ret_host).port
-                    self._reticulum_url = f'https://{ret_host}{":"+ret_port if ret_port else ""}'
+                    state["reticulum_url"] = f'https://{ret_host}{":"+ret_port if ret_port else ""}'
 
-        else:
-            self._user_logged_in = False
-            self._user_in_room = False
-            self._room_name = ""
-            self.reticulumUrl = ""
+        return state
 
+    @with_driver_lock
     def bring_to_front(self, context):
         # In some systems switch_to doesn't work, the code below is a hack to make it work
         # for the affected platforms/browsers that we have detected so far.
@@ -200,6 +310,7 @@ class HubsSession:
             self._web_driver.set_window_size(ws['width'], ws['height'])
         self._web_driver.switch_to.window(self._web_driver.current_window_handle)
 
+    @with_driver_lock
     def is_alive(self):
         try:
             if not self._web_driver or not is_module_available("selenium"):
@@ -209,12 +320,14 @@ class HubsSession:
         except Exception:
             return False
 
+    @with_driver_lock
     def update(self):
         import os
         document = self._web_driver.find_element("tag name", "html")
         file_input = self._web_driver.execute_script(JS_DROP_FILE, document, 0, 0)
         file_input.send_keys(os.path.join(bpy.app.tempdir, EXPORT_TMP_FILE_NAME))
 
+    @with_driver_lock
     def get_local_storage(self, item):
         store = None
         if self.is_alive():
@@ -222,10 +335,12 @@ class HubsSession:
 
         return store
 
+    @with_driver_lock
     def set_local_storage(self, data):
         if self.is_alive():
             self._web_driver.execute_script(f'window.localStorage.setItem("___hubs_store", {data});')
 
+    @with_driver_lock
     def get_url(self):
         return self._web_driver.current_url
 
@@ -240,9 +355,11 @@ class HubsSession:
 
         return params
 
+    @with_driver_lock
     def _get_env_meta(self, name):
         return self._web_driver.execute_script(f'return document.querySelector(\'meta[name="env:{name}"]\')?.content')
 
+    @with_driver_lock
     def get_token(self):
         if self.is_alive():
             hubs_store = self.get_local_storage("___hubs_store")
@@ -257,6 +374,7 @@ class HubsSession:
 
         return None
 
+    @with_driver_lock
     def set_credentials(self, email, token):
         if self.is_alive():
             hubs_store = self.get_local_storage("___hubs_store")
@@ -270,6 +388,7 @@ class HubsSession:
                     credentials["token"] = token
                     self.set_local_storage(hubs_store)
 
+    @with_driver_lock
     def set_creator_assignment_token(self, hub_id, creator_token, embed_token):
         if self.is_alive():
             hubs_store = self.get_local_storage("___hubs_store")
@@ -307,35 +426,47 @@ class HubsSession:
                         }]
                 self.set_local_storage(hubs_store)
 
+    @with_driver_lock
     def load(self, url):
         self._web_driver.get(url)
+        self.request_update()
 
+    @with_driver_lock
     def is_local_instance(self):
         return "hub_id" in self._web_driver.current_url
 
+    @with_driver_lock
     def move_to_waypoint(self, name):
         self._web_driver.execute_script(JS_WAYPOINT_UPDATE, name)
 
+    @property
+    def alive(self):
+        return self._state["alive"]
+
     @property
     def user_logged_in(self):
-        return self._user_logged_in
+        return self._state["user_logged_in"]
 
     @property
     def user_in_room(self):
-        return self._user_in_room
+        return self._state["user_in_room"]
 
     @property
     def room_name(self):
-        return self._room_name
+        return self._state["room_name"]
 
     @property
     def room_params(self):
-        return self._room_params
+        return self._state["room_params"]
 
     @property
     def reticulum_url(self):
-        return self._reticulum_url
+        return self._state["reticulum_url"]
 
     @property
     def client_url(self):
-        return self._client_url
+        return self._state["client_url"]
+
+    @property
+    def url(self):
+        return self._state["url"]
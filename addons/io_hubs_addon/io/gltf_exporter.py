@@ -1,5 +1,5 @@
 import bpy
-from .utils import HUBS_CONFIG
+from .utils import HUBS_CONFIG, build_vtree_index, invalidate_vtree_index, evict_written_image_caches
 from bpy.props import PointerProperty
 from ..components.components_registry import get_components_registry
 from ..components.utils import get_host_components
@@ -75,11 +75,14 @@ def export_callback(callback_method, export_settings):
 def glTF2_pre_export_callback(export_settings):
     from io_scene_gltf2.blender.com.gltf2_blender_extras import BLACK_LIST
     BLACK_LIST.extend(glTF2ExportUserExtension.EXCLUDED_PROPERTIES)
+    invalidate_vtree_index()
     export_callback("pre_export", export_settings)
 
 
 def glTF2_post_export_callback(export_settings):
     export_callback("post_export", export_settings)
+    invalidate_vtree_index()
+    evict_written_image_caches()
 
     from io_scene_gltf2.blender.com.gltf2_blender_extras import BLACK_LIST
     for excluded_prop in glTF2ExportUserExtension.EXCLUDED_PROPERTIES:
@@ -190,6 +193,9 @@ class glTF2ExportUserExtension:
         registered_hubs_components = get_components_registry()
 
         if component_list.items:
+            if bpy.app.version >= (3, 2, 0):
+                build_vtree_index(export_settings)
+
             extension_name = EXTENSION_NAME
             component_data = {}
 
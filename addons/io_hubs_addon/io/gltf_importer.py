@@ -4,20 +4,25 @@ from io_scene_gltf2.blender.imp.gltf2_blender_node import BlenderNode
 from io_scene_gltf2.blender.imp.gltf2_blender_material import BlenderMaterial
 from io_scene_gltf2.blender.imp.gltf2_blender_scene import BlenderScene
 from io_scene_gltf2.blender.imp.gltf2_blender_image import BlenderImage
-from .utils import HUBS_CONFIG, import_image, import_all_textures
+from .utils import (HUBS_CONFIG, imported_textures, reset_imported_textures, prefetch_images, import_timings,
+                    add_import_timing, print_import_timings)
 from ..components.components_registry import get_component_by_name
 import traceback
+import time
 
 EXTENSION_NAME = HUBS_CONFIG["gltfExtensionName"]
 
 armatures = {}
 delayed_gathers = []
 import_report = []
+# glTF node name to node index, built once per import for the vnode name fallbacks
+node_indices = {}
 
 
 def call_delayed_gathers():
     global delayed_gathers
     global import_report
+    start_time = time.perf_counter()
     for gather_import in delayed_gathers:
         gather_import_args = gather_import.__closure__[0].cell_contents
         blender_host = gather_import_args[2]
@@ -30,11 +35,13 @@ def call_delayed_gathers():
             import_report.append(
                 f"Failed to import {component_name} component on {blender_host.name}.  See the console for details.")
     delayed_gathers.clear()
+    add_import_timing("delayed gathers", start_time)
 
 
 def import_hubs_components(gltf_node, blender_host, gltf, blender_ob=None):
     global import_report
     if gltf_node and gltf_node.extensions and EXTENSION_NAME in gltf_node.extensions:
+        start_time = time.perf_counter()
         components_data = gltf_node.extensions[EXTENSION_NAME]
         for component_name in components_data.keys():
             component_class = get_component_by_name(component_name)
@@ -57,6 +64,7 @@ def import_hubs_components(gltf_node, blender_host, gltf, blender_ob=None):
                     print(f'Could not import unsupported component "{component_name}"')
                     import_report.append(
                         f"Could not import unsupported component {component_name} component on {blender_host.name}.")
+        add_import_timing("components", start_time)
 
 
 def add_lightmap(gltf_material, blender_mat, gltf):
@@ -65,9 +73,7 @@ def add_lightmap(gltf_material, blender_mat, gltf):
 
         texture_index = extension['index']
 
-        gltf_texture = gltf.data.textures[texture_index]
-        blender_image_name, _ = import_image(gltf, gltf_texture)
-        blender_image = bpy.data.images[blender_image_name]
+        blender_image = bpy.data.images[imported_textures[texture_index]]
 
         blender_mat.use_nodes = True
         nodes = blender_mat.node_tree.nodes
@@ -107,13 +113,46 @@ def store_bones_for_import(gltf, vnode):
         child_index = children.pop()
         child_vnode = gltf.vnodes[child_index]
         if child_vnode.type == vnode.Bone:
-            gltf_bones[child_vnode.name] = gltf.data.nodes[child_index]
+            gltf_bones[child_vnode.name] = get_gltf_node(gltf, child_index)
             children.extend(child_vnode.children)
 
     armatures[vnode.blender_object.name] = {
         'armature': vnode.blender_object, 'gltf_bones': gltf_bones}
 
 
+def start_prefetch(gltf):
+    import_timings.clear()
+    start_time = time.perf_counter()
+    try:
+        num_images = prefetch_images(gltf)
+    except Exception:
+        # The images will be read on the main thread when they are imported
+        traceback.print_exc()
+        num_images = 0
+    add_import_timing(f"image prefetch ({num_images} images)", start_time)
+
+
+def build_node_indices(gltf):
+    global node_indices
+    node_indices.clear()
+    for index, node in enumerate(gltf.data.nodes or []):
+        # Keep the first node with a given name, like the previous linear search did
+        node_indices.setdefault(node.name, index)
+
+
+def get_gltf_node(gltf, vnode_id):
+    vnode = gltf.vnodes[vnode_id]
+    node = gltf.data.nodes[vnode_id]
+    if node.name != vnode.name:
+        if vnode.name in node_indices:
+            print("Falling back to getting the node from the vnode name.")
+            node = gltf.data.nodes[node_indices[vnode.name]]
+        else:
+            print("Couldn't find the equivalent node for the vnode.")
+
+    return node
+
+
 def show_import_report():
     global import_report
     if not import_report:
@@ -146,13 +185,15 @@ class glTF2ImportUserExtension:
         delayed_gathers.clear()
         global import_report
         import_report.clear()
+        build_node_indices(gltf)
 
         if gltf.data.asset and gltf.data.asset.extras:
             if 'gltf_yup' in gltf.data.asset.extras:
                 gltf.import_settings['gltf_yup'] = gltf.data.asset.extras[
                     'gltf_yup']
 
-        import_all_textures(gltf)
+        reset_imported_textures(gltf)
+        start_prefetch(gltf)
 
     def gather_import_scene_after_nodes_hook(self, gltf_scene, blender_scene, gltf):
         if not self.properties.enabled:
@@ -162,6 +203,7 @@ class glTF2ImportUserExtension:
 
         add_bones(gltf)
         armatures.clear()
+        node_indices.clear()
 
     def gather_import_node_after_hook(self, vnode, gltf_node, blender_object, gltf):
         if not self.properties.enabled:
@@ -197,6 +239,8 @@ class glTF2ImportUserExtension:
 
     def gather_import_scene_after_animation_hook(self, gltf_scene, blender_scene, gltf):
         call_delayed_gathers()
+        reset_imported_textures()
+        print_import_timings()
         show_import_report()
 
 
@@ -211,26 +255,11 @@ def patched_BlenderNode_create_object(gltf, vnode_id):
     blender_object = orig_BlenderNode_create_object(gltf, vnode_id)
 
     vnode = gltf.vnodes[vnode_id]
-    node = None
 
     if vnode.camera_node_idx is not None:
-        parent_vnode = gltf.vnodes[vnode.parent]
-        node = gltf.data.nodes[vnode.parent]
-        if node.name != parent_vnode.name:
-            if parent_vnode.name:
-                print("Falling back to getting the node from the vnode name.")
-                node = [n for n in gltf.data.nodes if n.name == parent_vnode.name][0]
-            else:
-                print("Couldn't find the equivalent node for the vnode.")
-
+        node = get_gltf_node(gltf, vnode.parent)
     else:
-        node = gltf.data.nodes[vnode_id]
-        if node.name != vnode.name:
-            if vnode.name:
-                print("Falling back to getting the node from the vnode name.")
-                node = [n for n in gltf.data.nodes if n.name == vnode.name][0]
-            else:
-                print("Couldn't find the equivalent node for the vnode.")
+        node = get_gltf_node(gltf, vnode_id)
 
     import_hubs_components(node, vnode.blender_object, gltf, blender_ob=vnode.blender_object)
 
@@ -262,8 +291,10 @@ def patched_BlenderScene_create(gltf):
     armatures.clear()
     delayed_gathers.clear()
     import_report.clear()
+    build_node_indices(gltf)
 
-    import_all_textures(gltf)
+    reset_imported_textures(gltf)
+    start_prefetch(gltf)
     orig_BlenderScene_create(gltf)
     gltf_scene = gltf.data.scenes[gltf.data.scene]
     blender_object = bpy.data.scenes[gltf.blender_scene]
@@ -272,8 +303,11 @@ def patched_BlenderScene_create(gltf):
     # Bones are created after the armatures so we need to wait until all nodes have been processed to be able to access the bones objects
     add_bones(gltf)
     armatures.clear()
+    node_indices.clear()
 
     call_delayed_gathers()
+    reset_imported_textures()
+    print_import_timings()
     show_import_report()
 
 
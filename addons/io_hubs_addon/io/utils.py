@@ -1,4 +1,9 @@
 import os
+import time
+import base64
+import hashlib
+import tempfile
+import numpy as np
 import bpy
 from io_scene_gltf2.blender.com import gltf2_blender_extras
 if bpy.app.version >= (3, 6, 0):
@@ -17,8 +22,11 @@ from io_scene_gltf2.io.com import gltf2_io
 from io_scene_gltf2.io.exp import gltf2_io_binary_data
 from io_scene_gltf2.io.exp import gltf2_io_image_data
 from io_scene_gltf2.blender.imp.gltf2_blender_image import BlenderImage
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Union
 from ..nodes.lightmap import MozLightmapNode
+from ..utils import get_prefs_dir_path
+from ..preferences import get_addon_pref
 import re
 
 HUBS_CONFIG = {
@@ -26,7 +34,53 @@ HUBS_CONFIG = {
     "gltfExtensionVersion": 4,
 }
 
-imported_textures = {}
+
+class ImportedTextures(dict):
+    """Maps glTF texture indices to Blender image names, importing each texture the first time it's looked up"""
+
+    def __init__(self):
+        super().__init__()
+        self.gltf = None
+
+    def __missing__(self, index):
+        if self.gltf is None:
+            raise KeyError(index)
+        blender_image_name, _ = import_image(self.gltf, self.gltf.data.textures[index])
+        self[index] = blender_image_name
+        return blender_image_name
+
+
+imported_textures = ImportedTextures()
+
+# Property setters per registered component class, built from the RNA definitions so importing doesn't have to
+# inspect every value.
+import_plans = {}
+
+# Property gatherers per registered component class, built from the RNA definitions so exporting doesn't have to
+# inspect the property definitions of every component instance.
+export_plans = {}
+
+# Encoded data of the data URI images decoded ahead of time on worker threads, keyed by glTF image index
+prefetched_images = {}
+IMAGE_PREFETCH_MAX_WORKERS = 8
+DATA_URI_BASE64_SEPARATOR = ';base64,'
+
+# Per import timings of the Hubs import stages, printed once the import finishes
+import_timings = {}
+
+# Per export lookup tables from Blender objects/pose bones to vtree uuids
+vtree_index = {
+    "vtree": None,
+    "objects": {},
+    "bones": {},
+}
+
+# Encoded images are cached on disk across exports so unchanged images don't need to be re-encoded
+IMAGE_CACHE_DIR = "image_cache"
+IMAGE_CACHE_MAX_SIZE = 512 * 1024 * 1024
+
+# Cache directories written to during the current export, evicted once the export has finished
+image_cache_dirs_written = set()
 
 # gather_texture/image with HDR support via MOZ_texture_rgbe
 
@@ -74,6 +128,136 @@ class HubsExportImage(gltf2_blender_image.ExportImage):
             "HDR images must be saved as a .hdr file before exporting")
 
 
+def get_image_cache_dir_path():
+    return os.path.join(get_prefs_dir_path(), IMAGE_CACHE_DIR)
+
+
+def get_image_content_hash(blender_image):
+    hasher = hashlib.sha256()
+    hasher.update(repr((
+        blender_image.size[:],
+        blender_image.channels,
+        blender_image.file_format,
+        blender_image.alpha_mode,
+        blender_image.colorspace_settings.name,
+    )).encode())
+
+    if blender_image.source == 'FILE' and not blender_image.is_dirty:
+        if blender_image.packed_file is not None:
+            hasher.update(blender_image.packed_file.data)
+            return hasher.hexdigest()
+
+        src_path = bpy.path.abspath(blender_image.filepath_raw)
+        if os.path.isfile(src_path):
+            stat = os.stat(src_path)
+            hasher.update(repr((os.path.normpath(src_path), stat.st_size, stat.st_mtime_ns)).encode())
+            return hasher.hexdigest()
+
+    pixels = np.empty(len(blender_image.pixels), dtype=np.float32)
+    blender_image.pixels.foreach_get(pixels)
+    hasher.update(pixels.tobytes())
+    return hasher.hexdigest()
+
+
+def get_image_cache_path(blender_image, mime_type, export_settings):
+    key = repr((
+        get_image_content_hash(blender_image),
+        mime_type,
+        export_settings["gltf_image_format"],
+        export_settings.get("gltf_image_quality"),
+    ))
+    return os.path.join(get_image_cache_dir_path(), hashlib.sha256(key.encode()).hexdigest())
+
+
+def read_cached_image(cache_path):
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        # Touch the entry so eviction drops the least recently used images first.
+        os.utime(cache_path)
+        return data
+    except OSError:
+        return None
+
+
+def write_cached_image(cache_path, data):
+    cache_dir = os.path.dirname(cache_path)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        print(f"Unable to write the image cache entry {cache_path}: {err}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return
+
+    image_cache_dirs_written.add(cache_dir)
+
+
+def evict_written_image_caches():
+    """Evict the cache directories written to since the last call, so the cache is only scanned once per export."""
+    for cache_dir in image_cache_dirs_written:
+        try:
+            evict_image_cache(cache_dir)
+        except OSError as err:
+            print(f"Unable to evict the image cache {cache_dir}: {err}")
+    image_cache_dirs_written.clear()
+
+
+def evict_image_cache(cache_dir, max_size=IMAGE_CACHE_MAX_SIZE):
+    entries = []
+    total_size = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+
+def encode_image(blender_image, mime_type, export_settings):
+    # HDR images are copied from their .hdr file as is, so caching them would only duplicate the file.
+    cache_path = None
+    if mime_type != "image/vnd.radiance":
+        try:
+            cache_path = get_image_cache_path(blender_image, mime_type, export_settings)
+        except Exception as err:
+            print(f"Unable to hash image {blender_image.name}, skipping the image cache: {err}")
+
+    if cache_path:
+        data = read_cached_image(cache_path)
+        if data is not None:
+            return data
+
+    data = HubsExportImage.from_blender_image(blender_image).encode(mime_type, export_settings)
+
+    if type(data) is tuple:
+        data = data[0]
+
+    if cache_path:
+        write_cached_image(cache_path, data)
+
+    return data
+
+
 @cached
 def gather_image(blender_image, export_settings):
     if not blender_image:
@@ -90,10 +274,7 @@ def gather_image(blender_image, export_settings):
     else:
         mime_type = "image/jpeg"
 
-    data = HubsExportImage.from_blender_image(blender_image).encode(mime_type, export_settings)
-
-    if type(data) is tuple:
-        data = data[0]
+    data = encode_image(blender_image, mime_type, export_settings)
 
     if export_settings['gltf_format'] == 'GLTF_SEPARATE':
         uri = HubsImageData(data=data, mime_type=mime_type, name=name)
@@ -150,8 +331,8 @@ def gather_texture(blender_image, export_settings):
 def gather_properties(export_settings, object, component):
     value = {}
 
-    for key in component.get_properties():
-        value[key] = gather_property(
+    for key, gather in get_export_plan(type(component))["properties"]:
+        value[key] = gather(
             export_settings, object, component, key)
 
     if value:
@@ -161,6 +342,14 @@ def gather_properties(export_settings, object, component):
 
 
 def gather_property(export_settings, blender_object, target, property_name):
+    export_plan = export_plans.get(type(target))
+    gather = export_plan["gatherers"].get(property_name) if export_plan else None
+    if gather is None:
+        gather = gather_unplanned_property
+    return gather(export_settings, blender_object, target, property_name)
+
+
+def gather_unplanned_property(export_settings, blender_object, target, property_name):
     property_definition = target.bl_rna.properties[property_name]
     property_value = getattr(target, property_name)
     isArray = getattr(property_definition, 'is_array', None)
@@ -197,6 +386,41 @@ def gather_array_property(export_settings, blender_object, target, property_name
     return value
 
 
+def build_vtree_index(export_settings):
+    vtree = export_settings.get('vtree')
+    if vtree is None or vtree_index["vtree"] is vtree:
+        return
+
+    objects = {}
+    bones = {}
+    for uuid, vnode in vtree.nodes.items():
+        # Keep the first match for each key, like a linear search would.
+        if vnode.blender_object is not None:
+            objects.setdefault(vnode.blender_object, uuid)
+        if vnode.blender_bone is not None:
+            bones.setdefault(vnode.blender_bone, uuid)
+
+    vtree_index["vtree"] = vtree
+    vtree_index["objects"] = objects
+    vtree_index["bones"] = bones
+
+
+def invalidate_vtree_index():
+    vtree_index["vtree"] = None
+    vtree_index["objects"] = {}
+    vtree_index["bones"] = {}
+
+
+def get_vtree_object_uuid(export_settings, blender_object):
+    build_vtree_index(export_settings)
+    return vtree_index["objects"].get(blender_object)
+
+
+def get_vtree_bone_uuid(export_settings, blender_pose_bone):
+    build_vtree_index(export_settings)
+    return vtree_index["bones"].get(blender_pose_bone)
+
+
 def gather_node_property(export_settings, blender_object, target, property_name):
     blender_object = getattr(target, property_name)
 
@@ -211,8 +435,7 @@ def gather_node_property(export_settings, blender_object, target, property_name)
             )
         else:
             vtree = export_settings['vtree']
-            vnode = vtree.nodes[next((uuid for uuid in vtree.nodes if (
-                vtree.nodes[uuid].blender_object == blender_object)), None)]
+            vnode = vtree.nodes[get_vtree_object_uuid(export_settings, blender_object)]
             node = vnode.node or gltf2_blender_gather_nodes.gather_node(
                 vnode,
                 export_settings
@@ -241,8 +464,7 @@ def gather_joint_property(export_settings, blender_object, target, property_name
             )
         else:
             vtree = export_settings['vtree']
-            vnode = vtree.nodes[next((uuid for uuid in vtree.nodes if (
-                vtree.nodes[uuid].blender_bone == joint)), None)]
+            vnode = vtree.nodes[get_vtree_bone_uuid(export_settings, joint)]
             node = vnode.node or gltf2_blender_gather_joints.gather_joint_vnode(
                 vnode,
                 export_settings
@@ -268,8 +490,6 @@ def gather_material_property(export_settings, blender_object, target, property_n
 
 
 def gather_vec_property(export_settings, blender_object, target, property_name):
-    vec = getattr(target, property_name)
-
     property_definition = target.bl_rna.properties[property_name]
     unit = getattr(property_definition, 'unit', None)
     subtype = getattr(property_definition, 'subtype', None)
@@ -277,19 +497,26 @@ def gather_vec_property(export_settings, blender_object, target, property_name):
     # We export vectors with no unit and no subtype as arrays. This is not ideal, we should find a way
     # to tag properties as Array/Object to decouple the Blender type from the export type.
     if unit == 'NONE' and subtype == 'NONE':
-        out = []
-        for value in vec:
-            out.append(value)
+        return gather_vec_array_property(export_settings, blender_object, target, property_name)
     else:
-        out = {
-            "x": vec[0],
-            "y": vec[1],
-        }
+        return gather_vec_dict_property(export_settings, blender_object, target, property_name)
 
-        if len(vec) > 2:
-            out["z"] = vec[2]
-        if len(vec) > 3:
-            out["w"] = vec[3]
+
+def gather_vec_array_property(export_settings, blender_object, target, property_name):
+    return list(getattr(target, property_name))
+
+
+def gather_vec_dict_property(export_settings, blender_object, target, property_name):
+    vec = getattr(target, property_name)
+    out = {
+        "x": vec[0],
+        "y": vec[1],
+    }
+
+    if len(vec) > 2:
+        out["z"] = vec[2]
+    if len(vec) > 3:
+        out["w"] = vec[3]
 
     return out
 
@@ -351,6 +578,88 @@ def gather_color_property(export_settings, object, component, property_name, col
     return "#{0:02x}{1:02x}{2:02x}".format(c[0], c[1], c[2], 255)
 
 
+# Property gatherers used by the export plans
+
+
+def gather_linear_color_property(export_settings, blender_object, target, property_name):
+    return gather_color_property(export_settings, blender_object, target, property_name, 'COLOR')
+
+
+def gather_srgb_color_property(export_settings, blender_object, target, property_name):
+    return gather_color_property(export_settings, blender_object, target, property_name, 'COLOR_GAMMA')
+
+
+def gather_value_property(export_settings, blender_object, target, property_name):
+    return getattr(target, property_name)
+
+
+def gather_json_compatible_property(export_settings, blender_object, target, property_name):
+    return gltf2_blender_extras.__to_json_compatible(getattr(target, property_name))
+
+
+def gather_pointer_property(export_settings, blender_object, target, property_name):
+    property_value = getattr(target, property_name)
+    gather = pointer_gatherers.get(type(property_value))
+    if gather:
+        return gather(export_settings, blender_object, target, property_name)
+    return gltf2_blender_extras.__to_json_compatible(property_value)
+
+
+pointer_gatherers = {
+    bpy.types.Object: gather_node_property,
+    bpy.types.Material: gather_material_property,
+    bpy.types.Image: gather_image_property,
+    bpy.types.Texture: gather_texture_property,
+}
+
+
+def get_property_gatherer(property_definition):
+    if getattr(property_definition, 'is_array', None) and property_definition.is_array:
+        if property_definition.subtype == 'COLOR':
+            return gather_linear_color_property
+        elif property_definition.subtype.startswith('COLOR'):
+            return gather_srgb_color_property
+        # We export vectors with no unit and no subtype as arrays, see gather_vec_property.
+        elif getattr(property_definition, 'unit', None) == 'NONE' and property_definition.subtype == 'NONE':
+            return gather_vec_array_property
+        else:
+            return gather_vec_dict_property
+
+    elif property_definition.type == 'POINTER':
+        return gather_pointer_property
+
+    elif property_definition.type in {'BOOLEAN', 'INT', 'FLOAT', 'STRING'} or (
+            property_definition.type == 'ENUM' and not property_definition.is_enum_flag):
+        # These are already json compatible
+        return gather_value_property
+
+    return gather_json_compatible_property
+
+
+def build_export_plan(component_class):
+    """Resolves the gatherer of each RNA property of the component class, in the order they are exported."""
+    gatherers = {}
+    for property_definition in component_class.bl_rna.properties:
+        if property_definition.identifier != 'rna_type':
+            gatherers[property_definition.identifier] = get_property_gatherer(property_definition)
+
+    properties = []
+    if hasattr(component_class, 'get_properties'):
+        properties = [(key, gatherers.get(key, gather_unplanned_property)) for key in component_class.get_properties()]
+
+    return {
+        "properties": properties,
+        "gatherers": gatherers,
+    }
+
+
+def get_export_plan(component_class):
+    export_plan = export_plans.get(component_class)
+    if export_plan is None:
+        export_plan = export_plans[component_class] = build_export_plan(component_class)
+    return export_plan
+
+
 # MOZ_lightmap extension data
 
 
@@ -393,16 +702,36 @@ def gather_lightmap_texture_info(blender_material, export_settings):
     }
 
 
-def import_image(gltf, gltf_texture):
+def get_texture_source(gltf_texture):
     texture_extensions = gltf_texture.extensions
     if texture_extensions and texture_extensions.get('MOZ_texture_rgbe'):
-        source = gltf_texture.extensions['MOZ_texture_rgbe']['source']
-    else:
-        source = gltf_texture.source
+        return gltf_texture.extensions['MOZ_texture_rgbe']['source']
+    return gltf_texture.source
+
+
+def create_image_from_data(gltf, source, img_data):
+    # Same as the glTF importer does for embedded images, Blender decodes the packed data on first use.
+    pyimg = gltf.data.images[source]
+    blender_image = bpy.data.images.new(pyimg.name or 'Image_%d' % source, 8, 8)
+    blender_image.pack(data=img_data, data_len=len(img_data))
+    blender_image.source = 'FILE'
+    pyimg.blender_image_name = blender_image.name
+
+
+def import_image(gltf, gltf_texture):
+    source = get_texture_source(gltf_texture)
 
-    BlenderImage.create(
-        gltf, source)
+    # Share the importer's image cache so images already created for a material aren't decoded again
     pyimg = gltf.data.images[source]
+    if pyimg.blender_image_name is None:
+        start_time = time.perf_counter()
+        img_data = prefetched_images.pop(source, None)
+        if img_data is not None:
+            create_image_from_data(gltf, source, img_data)
+        else:
+            BlenderImage.create(
+                gltf, source)
+        add_import_timing("image creation", start_time)
     blender_image_name = pyimg.blender_image_name
     blender_image = bpy.data.images[blender_image_name]
     if pyimg.mime_type == "image/vnd.radiance":
@@ -414,16 +743,63 @@ def import_image(gltf, gltf_texture):
     return blender_image_name, source
 
 
-def import_all_textures(gltf):
-    global imported_textures
+def get_prefetch_image_sources(gltf):
+    """Base64 data URI images of the HDR and lightmap textures, these are imported by us rather than by the materials."""
+    textures = gltf.data.textures or []
+    texture_indices = set()
+    for index, gltf_texture in enumerate(textures):
+        if gltf_texture.extensions and gltf_texture.extensions.get('MOZ_texture_rgbe'):
+            texture_indices.add(index)
+    for gltf_material in gltf.data.materials or []:
+        if gltf_material.extensions and 'MOZ_lightmap' in gltf_material.extensions:
+            texture_indices.add(gltf_material.extensions['MOZ_lightmap']['index'])
+
+    sources = set()
+    for index in texture_indices:
+        source = get_texture_source(textures[index])
+        pyimg = gltf.data.images[source]
+        if pyimg.uri is not None and pyimg.uri.startswith('data:') and DATA_URI_BASE64_SEPARATOR in pyimg.uri:
+            sources.add(source)
+    return sorted(sources)
+
+
+def prefetch_images(gltf):
+    # Base64 decode the data URI images on a thread pool so the main thread only has to create the Blender images.
+    # Images in buffer views are already in memory and external image files are only read by Blender when they are
+    # used, so both are left to the glTF importer.
+    prefetched_images.clear()
+    sources = get_prefetch_image_sources(gltf)
+    if not sources:
+        return 0
+
+    def read_image_data(source):
+        uri = gltf.data.images[source].uri
+        return source, base64.b64decode(uri[uri.find(DATA_URI_BASE64_SEPARATOR) + len(DATA_URI_BASE64_SEPARATOR):])
+
+    with ThreadPoolExecutor(max_workers=min(IMAGE_PREFETCH_MAX_WORKERS, len(sources))) as executor:
+        for source, img_data in executor.map(read_image_data, sources):
+            prefetched_images[source] = img_data
+
+    return len(prefetched_images)
+
+
+def reset_imported_textures(gltf=None):
+    # Textures are imported lazily when a component or lightmap references them, images already imported
+    # by the glTF importer for a material are reused through pyimg.blender_image_name.
     imported_textures.clear()
+    imported_textures.gltf = gltf
+    prefetched_images.clear()
+
+
+def add_import_timing(stage, start_time):
+    import_timings[stage] = import_timings.get(stage, 0.0) + time.perf_counter() - start_time
 
-    if not gltf.data.textures:
-        return
 
-    for index, gltf_texture in enumerate(gltf.data.textures):
-        blender_image_name, source = import_image(gltf, gltf_texture)
-        imported_textures[index] = blender_image_name
+def print_import_timings():
+    if import_timings and get_addon_pref(bpy.context).debug_mode:
+        print("Hubs import timings: " + ", ".join(
+            f"{stage} {stage_time:.3f}s" for stage, stage_time in import_timings.items()))
+    import_timings.clear()
 
 
 def import_component(component_name, blender_object):
@@ -437,45 +813,116 @@ def import_component(component_name, blender_object):
     return getattr(blender_object, component_class.get_id())
 
 
-def set_color_from_hex(blender_component, property_name, hexcolor):
+def assign_hex_color(blender_component, property_name, hexcolor, linear):
     hexcolor = hexcolor.lstrip('#')
-    rgb_int = [int(hexcolor[i:i + 2], 16) for i in (0, 2, 4)]
-
-    for x, value in enumerate(rgb_int):
-        rgb_float = value / 255 if value > 0 else 0
-        if blender_component.bl_rna.properties[property_name].subtype == 'COLOR':
-            # Blender stores colors in linear space for subtype COLOR and sRGB for COLOR_GAMMA
-            # Colors in the glTF components are in sRGB so we convert them here if needed.
+    blender_color = getattr(blender_component, property_name)
+    for x in range(3):
+        rgb_float = int(hexcolor[x * 2:x * 2 + 2], 16) / 255
+        if linear:
             rgb_float = srgb2lin(rgb_float)
-        getattr(blender_component, property_name)[x] = rgb_float
+        blender_color[x] = rgb_float
 
 
-def assign_property(vnodes, blender_component, property_name, property_value):
+def set_color_from_hex(blender_component, property_name, hexcolor):
+    # Blender stores colors in linear space for subtype COLOR and sRGB for COLOR_GAMMA
+    # Colors in the glTF components are in sRGB so we convert them here if needed.
+    linear = blender_component.bl_rna.properties[property_name].subtype == 'COLOR'
+    assign_hex_color(blender_component, property_name, hexcolor, linear)
+
+
+def assign_link_property(vnodes, blender_component, property_name, property_value):
+    if len(property_value) == 2:
+        if property_value['__mhc_link_type'] == "node":
+            try:
+                setattr(blender_component, property_name,
+                        vnodes[property_value['index']].blender_object)
+            except AttributeError:
+                # Assume that the target is a bone
+                bone_vnode = vnodes[property_value['index']]
+                armature_vnode = vnodes[bone_vnode.bone_arma]
+                setattr(blender_component, property_name,
+                        armature_vnode.blender_object)
+                setattr(blender_component, "bone",
+                        bone_vnode.blender_bone_name)
+        elif property_value['__mhc_link_type'] == "texture":
+            blender_image_name = imported_textures[property_value['index']]
+            blender_image = bpy.data.images[blender_image_name]
+            setattr(blender_component, property_name, blender_image)
+
+
+def assign_subproperties(blender_component, property_name, property_value):
+    blender_subcomponent = getattr(blender_component, property_name)
+    for x, subproperty_value in enumerate(property_value.values()):
+        blender_subcomponent[x] = subproperty_value
+
+
+# Property setters used by the import plans, they only check the shape of the imported value where the glTF
+# representation of the property type can vary.
+
+
+def assign_value(vnodes, blender_component, property_name, property_value):
+    setattr(blender_component, property_name, property_value)
+
+
+def assign_pointer(vnodes, blender_component, property_name, property_value):
     if isinstance(property_value, dict):
         if property_value.get('__mhc_link_type'):
-            if len(property_value) == 2:
-                if property_value['__mhc_link_type'] == "node":
-                    try:
-                        setattr(blender_component, property_name,
-                                vnodes[property_value['index']].blender_object)
-                    except AttributeError:
-                        # Assume that the target is a bone
-                        bone_vnode = vnodes[property_value['index']]
-                        armature_vnode = vnodes[bone_vnode.bone_arma]
-                        setattr(blender_component, property_name,
-                                armature_vnode.blender_object)
-                        setattr(blender_component, "bone",
-                                bone_vnode.blender_bone_name)
-                elif property_value['__mhc_link_type'] == "texture":
-                    global imported_textures
-                    blender_image_name = imported_textures[property_value['index']]
-                    blender_image = bpy.data.images[blender_image_name]
-                    setattr(blender_component, property_name, blender_image)
+            assign_link_property(vnodes, blender_component, property_name, property_value)
+    else:
+        setattr(blender_component, property_name, property_value)
+
+
+def assign_array(vnodes, blender_component, property_name, property_value):
+    if isinstance(property_value, dict):
+        assign_subproperties(blender_component, property_name, property_value)
+    elif isinstance(property_value, str):
+        assign_hex_color(blender_component, property_name, property_value, False)
+    else:
+        setattr(blender_component, property_name, property_value)
+
+
+def assign_linear_color(vnodes, blender_component, property_name, property_value):
+    if isinstance(property_value, str):
+        assign_hex_color(blender_component, property_name, property_value, True)
+    else:
+        assign_array(vnodes, blender_component, property_name, property_value)
+
+
+def build_import_plan(component_class):
+    """Maps each RNA property of the component class to the setter for its type, subtype and array length."""
+    import_plan = {}
+    for property_definition in component_class.bl_rna.properties:
+        property_name = property_definition.identifier
+        if property_name == 'rna_type' or property_definition.type == 'COLLECTION':
+            continue
+
+        if property_definition.type == 'POINTER':
+            import_plan[property_name] = assign_pointer
+        elif getattr(property_definition, 'is_array', False) and property_definition.array_length > 0:
+            if property_definition.subtype == 'COLOR':
+                import_plan[property_name] = assign_linear_color
+            else:
+                import_plan[property_name] = assign_array
+        else:
+            import_plan[property_name] = assign_value
+
+    return import_plan
+
+
+def get_import_plan(component_class):
+    import_plan = import_plans.get(component_class)
+    if import_plan is None:
+        import_plan = import_plans[component_class] = build_import_plan(component_class)
+    return import_plan
+
+
+def assign_unplanned_property(vnodes, blender_component, property_name, property_value):
+    if isinstance(property_value, dict):
+        if property_value.get('__mhc_link_type'):
+            assign_link_property(vnodes, blender_component, property_name, property_value)
 
         else:
-            blender_subcomponent = getattr(blender_component, property_name)
-            for x, subproperty_value in enumerate(property_value.values()):
-                blender_subcomponent[x] = subproperty_value
+            assign_subproperties(blender_component, property_name, property_value)
 
     elif re.fullmatch("#[0-9a-fA-F]*", str(property_value)):
         set_color_from_hex(blender_component, property_name, property_value)
@@ -484,3 +931,11 @@ def assign_property(vnodes, blender_component, property_name, property_value):
         if not hasattr(blender_component, property_name):
             return
         setattr(blender_component, property_name, property_value)
+
+
+def assign_property(vnodes, blender_component, property_name, property_value):
+    import_plan = import_plans.get(type(blender_component))
+    assign = import_plan.get(property_name) if import_plan else None
+    if assign is None:
+        assign = assign_unplanned_property
+    assign(vnodes, blender_component, property_name, property_value)
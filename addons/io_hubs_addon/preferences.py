@@ -1,11 +1,12 @@
 import bpy
 from bpy.types import AddonPreferences, Context
-from bpy.props import IntProperty, StringProperty, EnumProperty, BoolProperty, PointerProperty, CollectionProperty
-from .utils import get_addon_package, is_module_available, get_browser_profile_directory
+from bpy.props import IntProperty, StringProperty, EnumProperty, BoolProperty, PointerProperty, CollectionProperty, FloatProperty
+from .utils import get_addon_package, is_module_available, invalidate_module_availability, get_browser_profile_directory
 import platform
 from os.path import join, dirname, realpath
 
 EXPORT_TMP_FILE_NAME = "__hubs_tmp_scene_.glb"
+EXPORT_TMP_PUBLISH_FILE_NAME = "__hubs_tmp_publish_scene_.glb"
 EXPORT_TMP_SCREENSHOT_FILE_NAME = "__hubs_tmp_screenshot_"
 
 
@@ -73,6 +74,7 @@ class InstallDepsOperator(bpy.types.Operator):
              '-t', get_or_create_deps_path(self.dep_config.name)],
             capture_output=True, text=True, input="y")
         failed = False
+        invalidate_module_availability(self.dep_config.name)
         if not is_module_available(self.dep_config.name):
             failed = True
         if result.returncode != 0 or failed:
@@ -98,6 +100,7 @@ class UninstallDepsOperator(bpy.types.Operator):
         from .utils import get_or_create_deps_path
         import shutil
         shutil.rmtree(get_or_create_deps_path(self.dep_config.name))
+        invalidate_module_availability(self.dep_config.name)
 
         return {'FINISHED'}
 
@@ -235,12 +238,27 @@ class HubsPreferences(AddonPreferences):
         min=0,
     )
 
+    gizmo_cull_distance: FloatProperty(
+        name="Gizmo Cull Distance",
+        description="Hide Hubs gizmos that are further than this distance from the viewport camera. Set to 0 to always show them",
+        default=0.0,
+        min=0.0,
+        subtype='DISTANCE',
+        unit='LENGTH',
+    )
+
     recast_lib_path: StringProperty(
         name='Recast library path',
         subtype='FILE_PATH',
         default=get_recast_lib_path()
     )
 
+    debug_mode: BoolProperty(
+        name="Debug Mode",
+        description="Print debug information, like the time spent in each stage of the Hubs import, to the console",
+        default=False,
+    )
+
     viewer_available: BoolProperty()
 
     browser: EnumProperty(
@@ -265,7 +283,9 @@ class HubsPreferences(AddonPreferences):
         box = layout.box()
 
         box.row().prop(self, "row_length")
+        box.row().prop(self, "gizmo_cull_distance")
         box.row().prop(self, "recast_lib_path")
+        box.row().prop(self, "debug_mode")
 
         draw_user_modules_path_panel(context, layout, self)
         box = layout.box()
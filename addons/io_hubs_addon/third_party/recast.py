@@ -20,19 +20,23 @@
 import os
 import traceback
 import bpy
+from bpy.app.handlers import persistent
 
 from bpy.props import IntProperty, FloatProperty, EnumProperty, PointerProperty, FloatVectorProperty, BoolProperty
 from bpy.types import Panel, PropertyGroup
 from mathutils import Matrix, Vector
-from math import radians
+from math import ceil, radians
 from ..preferences import get_addon_pref
 from ..components.utils import add_component, get_objects_with_component, has_component, is_linked
 
 import ctypes
 import ctypes.util
 from ctypes import c_int, c_float
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import bmesh
+import numpy as np
 
 
 CELL_SIZE_DEFAULT = 0.166
@@ -51,6 +55,12 @@ SAMPLE_MAX_ERROR_DEFAULT = 1.0
 PARTITIONING_DEFAULT = 'WATERSHED'
 COLOR_DEFAULT = (0.0, 1.0, 0.0, 1.0)
 AUTO_CELL_DEFAULT = True
+TILED_DEFAULT = False
+TILE_SIZE_DEFAULT = 32.0
+TILE_THREADS_DEFAULT = 0
+INCREMENTAL_DEFAULT = True
+
+navmesh_building = False
 
 # x -> x'
 # y -> -z'
@@ -65,6 +75,13 @@ def reswap(vec):
     return Vector([vec.x, -vec.z, vec.y])
 
 
+# Matrix form of swap, so it can be combined with an object's world matrix.
+SWAP_MATRIX = Matrix(((1.0, 0.0, 0.0, 0.0),
+                      (0.0, 0.0, 1.0, 0.0),
+                      (0.0, -1.0, 0.0, 0.0),
+                      (0.0, 0.0, 0.0, 1.0)))
+
+
 class RecastData(ctypes.Structure):
     _fields_ = [("cellsize", c_float),
                 ("cellheight", c_float),
@@ -164,55 +181,466 @@ def objects_from_collection(allObjects, collectionName):
 # take care of applying modiffiers and triangulation
 
 
-def extractTriangulatedInputMeshList(objects, matrix, verts_offset, verts, tris, depsgraph):
+def extractTriangulatedObjectMesh(ob, matrix, depsgraph):
+    """Returns the evaluated triangles of a mesh object as numpy arrays, the vertices are already transformed
+    to recast coordinates and the triangle indices are local to the object."""
+    ob_eval = ob.evaluated_get(depsgraph)
+    mesh = ob_eval.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+
+        nverts = len(mesh.vertices)
+        co = np.empty(nverts * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+
+        ntris = len(mesh.loop_triangles)
+        tris = np.empty(ntris * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+    finally:
+        ob_eval.to_mesh_clear()
+
+    # Apply the world matrix and the swap to recast coordinates in one go.
+    transform = np.array(SWAP_MATRIX @ matrix @ ob.matrix_world, dtype=np.float64)
+    verts = co.reshape(-1, 3) @ transform[:3, :3].T + transform[:3, 3]
+
+    return verts.astype(np.float32), tris.reshape(-1, 3)
+
+
+class NavMeshBuildCache:
+    """Keeps the triangulated input of the objects and the built tiles of a scene between navmesh builds,
+    so a rebuild only re-extracts the changed objects and only rebuilds the tiles they touch."""
+
+    def __init__(self):
+        # (object name, world matrix) -> (geometry revision, verts, tris)
+        self.objects = {}
+        # tile key -> recast space (verts, faces), clipped to the tile
+        self.tiles = {}
+        self.settings = None
+        self.current_objects = None
+        # Old and new geometry of the objects that changed since the previous build.
+        self.dirty_meshes = []
+
+    def begin_extraction(self):
+        self.current_objects = {}
+        self.dirty_meshes = []
+
+    def get_object_mesh(self, ob, matrix, depsgraph):
+        world_matrix = matrix @ ob.matrix_world
+        key = (ob.name_full, tuple(value for row in world_matrix for value in row))
+        revision = get_geometry_revision(ob)
+        entry = self.current_objects.get(key) or self.objects.get(key)
+        if entry is None or entry[0] != revision:
+            ob_verts, ob_tris = extractTriangulatedObjectMesh(ob, matrix, depsgraph)
+            if entry is None or not (np.array_equal(entry[1], ob_verts) and np.array_equal(entry[2], ob_tris)):
+                if entry is not None:
+                    self.dirty_meshes.append((entry[1], entry[2]))
+                self.dirty_meshes.append((ob_verts, ob_tris))
+            entry = (revision, ob_verts, ob_tris)
+
+        self.current_objects[key] = entry
+        return entry[1], entry[2]
+
+    def end_extraction(self):
+        for key, entry in self.objects.items():
+            if key not in self.current_objects:
+                self.dirty_meshes.append((entry[1], entry[2]))
+        self.objects = self.current_objects
+        self.current_objects = None
+
+    def get_dirty_tile_keys(self, tile_size):
+        """Returns the tiles overlapped by the changed objects, the tiles that only have them in their border are
+        kept as they are."""
+        dirty_tile_keys = set()
+        for verts, tris in self.dirty_meshes:
+            dirty_tile_keys |= getTileKeys(verts.ravel(), tris.ravel(), tile_size, 0.0)
+        return dirty_tile_keys
+
+
+# Per scene navmesh build caches
+navmesh_build_caches = {}
+# Incremented for an object every time its evaluated geometry is updated
+geometry_revisions = {}
+geometry_epoch = 0
+
+
+def get_navmesh_build_cache(scene):
+    cache = navmesh_build_caches.get(scene.name_full)
+    if cache is None:
+        cache = navmesh_build_caches[scene.name_full] = NavMeshBuildCache()
+    return cache
+
+
+def get_geometry_revision(ob):
+    return (geometry_epoch, geometry_revisions.get(ob.name_full, 0))
+
+
+@persistent
+def navmesh_depsgraph_update_post(scene, depsgraph):
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            name = update.id.original.name_full
+            geometry_revisions[name] = geometry_revisions.get(name, 0) + 1
+
+
+@persistent
+def navmesh_undo_post(*args):
+    # Undo doesn't reliably report the geometry it restores, so make every object be re-extracted.  The extracted
+    # geometry is compared with the cached one so only objects that actually changed will mark tiles as dirty.
+    global geometry_epoch
+    geometry_epoch += 1
+
+
+@persistent
+def navmesh_load_post(*args):
+    navmesh_build_caches.clear()
+    geometry_revisions.clear()
+
+
+def extractTriangulatedInputMeshList(objects, matrix, verts_offset, verts, tris, depsgraph, cache=None):
     for ob in objects:
         if ob.instance_type == 'COLLECTION':
             subobjects = objects_from_collection(bpy.data.objects, ob.name)
             parent_matrix = matrix @ ob.matrix_world
             verts_offset = extractTriangulatedInputMeshList(
-                subobjects, parent_matrix, verts_offset, verts, tris, depsgraph)
+                subobjects, parent_matrix, verts_offset, verts, tris, depsgraph, cache=cache)
 
         if ob.type != 'MESH':
             continue
 
-        bm = bmesh.new()
-        bm.from_object(ob, depsgraph)
-        real_matrix_world = matrix @ ob.matrix_world
-        bmesh.ops.transform(bm, matrix=real_matrix_world, verts=bm.verts)
-
-        tm = bmesh.ops.triangulate(bm, faces=bm.faces[:])
-        # tm['faces']   # but it seems that it modify bmesh anyway
-
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-
-        for v in bm.verts:
-            vp = swap(v.co)  # swap from blender coordinates to recast coordinates
-            verts.append(vp.x)
-            verts.append(vp.y)
-            verts.append(vp.z)
-
-        for f in bm.faces:
-            for i in f.verts:  # After triangulation it will always be 3 vertexes
-                tris.append(i.index + verts_offset)
+        if cache is not None:
+            ob_verts, ob_tris = cache.get_object_mesh(ob, matrix, depsgraph)
+        else:
+            ob_verts, ob_tris = extractTriangulatedObjectMesh(ob, matrix, depsgraph)
+        verts.append(ob_verts)
+        tris.append(ob_tris + verts_offset)
 
-        verts_offset += len(bm.verts)
-        bm.free()
+        verts_offset += len(ob_verts)
     return verts_offset
 
 # take care of applying modiffiers and triangulation
 
 
-def extractTriangulatedInputMesh(context):
+def extractTriangulatedInputMesh(context, cache=None):
+    """Returns the triangulated selection as contiguous flat float32 vertex and int32 index arrays"""
     depsgraph = context.evaluated_depsgraph_get()
     verts = []
     tris = []
     list = context.selected_objects
-    extractTriangulatedInputMeshList(list, Matrix(), 0, verts, tris, depsgraph)
-    return (verts, tris)
+    if cache is not None:
+        cache.begin_extraction()
+    extractTriangulatedInputMeshList(list, Matrix(), 0, verts, tris, depsgraph, cache=cache)
+    if cache is not None:
+        cache.end_extraction()
+    if not verts:
+        return (np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int32))
+
+    return (np.ascontiguousarray(np.concatenate(verts), dtype=np.float32).ravel(),
+            np.ascontiguousarray(np.concatenate(tris), dtype=np.int32).ravel())
+
+
+def readDetailMesh(dmesh_holder):
+    """Copies the recast detail mesh into numpy arrays of recast space vertices and global triangle indices"""
+    dmesh = dmesh_holder.dmesh.contents
+    nverts = (int)(dmesh.nverts)
+    nmeshes = (int)(dmesh.nmeshes)
+    ntris = (int)(dmesh.ntris)
+    if nverts == 0 or nmeshes == 0 or ntris == 0:
+        return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int64)
+
+    # Wrap the C arrays, these are views so nothing is copied until they are used.
+    verts = np.ctypeslib.as_array(dmesh.verts, shape=(nverts * 3,)).reshape(-1, 3)
+    meshes = np.ctypeslib.as_array(dmesh.meshes, shape=(nmeshes * 4,)).reshape(-1, 4).astype(np.int64)
+    tris = np.ctypeslib.as_array(dmesh.tris, shape=(ntris * 4,)).reshape(-1, 4)
+
+    # Recast: The vertex indices in the triangle array are local to the sub-mesh, not global. To translate into an global index in the vertices array, the values must be offset by the sub-mesh's base vertex index.
+    base_verts, base_tris, mesh_ntris = meshes[:, 0], meshes[:, 2], meshes[:, 3]
+    tri_starts = np.cumsum(mesh_ntris) - mesh_ntris
+    local_tri = np.arange(mesh_ntris.sum()) - np.repeat(tri_starts, mesh_ntris)
+    tri_rows = np.repeat(base_tris, mesh_ntris) + local_tri
+    faces = tris[tri_rows, :3].astype(np.int64) + np.repeat(base_verts, mesh_ntris)[:, None]
+
+    return verts.astype(np.float64), faces
+
+
+def weldDetailMesh(verts, faces, weld_distance=0.00001):
+    """Converts recast space detail mesh data to Blender space and welds the duplicate vertices"""
+    # reswap from recast coordinates to blender coordinates
+    co = np.column_stack((verts[:, 0], -verts[:, 2], verts[:, 1]))
+    if len(co) == 0:
+        return co.astype(np.float32), faces
+
+    # Weld vertices that fall in the same cell of a weld_distance sized grid, the equivalent of remove_doubles.
+    cells = np.round(co / weld_distance).astype(np.int64)
+    _, unique_index, inverse = np.unique(cells, axis=0, return_index=True, return_inverse=True)
+    co = co[unique_index]
+    faces = inverse.reshape(-1)[faces]
+
+    # Drop the triangles that collapsed while welding.
+    degenerate = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])
+    faces = faces[~degenerate]
+
+    return co.astype(np.float32), faces
+
+
+def loadRecastLibrary(libpath):
+    """Loads the recast shared library and declares the signatures of the functions we use"""
+    prevWorkingDir = os.getcwd()
+    os.chdir(os.path.dirname(libpath))
+    try:
+        recast = ctypes.CDLL(libpath)
+    finally:
+        os.chdir(prevWorkingDir)
+
+    recast.buildNavMesh.argtypes = [
+        ctypes.POINTER(RecastData),
+        c_int, ctypes.POINTER(c_float), c_int, ctypes.POINTER(c_int), ctypes.POINTER(recast_polyMesh_holder),
+        ctypes.POINTER(recast_polyMeshDetail_holder),
+        ctypes.c_char_p, c_int]
+    recast.buildNavMesh.restype = c_int
+    if hasattr(recast, 'buildNavMeshTile'):
+        # Libraries built before tiled builds were supported don't have it.
+        recast.buildNavMeshTile.argtypes = [
+            ctypes.POINTER(RecastData),
+            c_int, ctypes.POINTER(c_float), c_int, ctypes.POINTER(c_int), ctypes.POINTER(c_float),
+            ctypes.POINTER(c_float), c_int, ctypes.POINTER(recast_polyMesh_holder),
+            ctypes.POINTER(recast_polyMeshDetail_holder),
+            ctypes.c_char_p, c_int]
+        recast.buildNavMeshTile.restype = c_int
+    recast.freeNavMesh.argtypes = [
+        ctypes.POINTER(recast_polyMesh_holder),
+        ctypes.POINTER(recast_polyMeshDetail_holder),
+        ctypes.c_char_p, c_int]
+    recast.freeNavMesh.restype = c_int
+
+    return recast
+
+
+def getRecastLibPath(context):
+    return os.path.abspath(get_addon_pref(context).recast_lib_path).replace("\\", "/")
+
+
+# Whether the recast library at a path supports tiled builds, so the panel doesn't have to load it on every redraw.
+tiled_build_support = {}
+
+
+def isTiledBuildSupported(libpath):
+    supported = tiled_build_support.get(libpath)
+    if supported is None:
+        if not os.path.exists(libpath):
+            return False
+        try:
+            supported = hasattr(loadRecastLibrary(libpath), 'buildNavMeshTile')
+        except OSError:
+            supported = False
+        tiled_build_support[libpath] = supported
+    return supported
+
+
+def buildDetailMesh(recast, recastData, verts, tris, tile_bounds=None, border_size=0):
+    """Runs recast on flat contiguous float32 vertex and int32 index arrays.
+    When tile_bounds (bmin, bmax) are given only that box is built, rasterizing border_size extra cells around it.
+    Returns whether the build succeeded, the report message and the recast space detail mesh data (or None)."""
+    nverts = (int)(len(verts) / 3)
+    ntris = (int)(len(tris) / 3)
+
+    pmesh = recast_polyMesh_holder()
+    dmesh = recast_polyMeshDetail_holder()
+    nreportMsg = 128
+    reportMsg = ctypes.create_string_buffer(b'\000' * nreportMsg)     # 128 chars mutable text
+
+    # The arrays are contiguous so they can be handed to recast without copying.
+    if tile_bounds is None:
+        ok = recast.buildNavMesh(recastData, nverts, verts.ctypes.data_as(ctypes.POINTER(c_float)), ntris,
+                                 tris.ctypes.data_as(ctypes.POINTER(c_int)), pmesh, dmesh, reportMsg, nreportMsg)
+    else:
+        bmin, bmax = tile_bounds
+        ok = recast.buildNavMeshTile(recastData, nverts, verts.ctypes.data_as(ctypes.POINTER(c_float)), ntris,
+                                     tris.ctypes.data_as(ctypes.POINTER(c_int)), (c_float * 3)(*bmin),
+                                     (c_float * 3)(*bmax), border_size, pmesh, dmesh, reportMsg, nreportMsg)
+    print("Report msg: %s" % reportMsg.raw)
+    message = reportMsg.value
+
+    data = readDetailMesh(dmesh) if dmesh.dmesh else None
+
+    # what was allocated in C/C++ should be also deallocated there
+    recast.freeNavMesh(pmesh, dmesh, reportMsg, nreportMsg)
+
+    return ok, message, data
+
+
+def getTileGrid(recastData, tile_size):
+    """Returns the tile size rounded to whole cells and the tile border in cells.  All the tiles share the same cell
+    grid, so the voxels of neighbouring tiles line up and their edges meet."""
+    cellsize = recastData.cellsize
+    tile_cells = max(1, int(round(tile_size / cellsize)))
+    # Recast erodes the walkable area by the agent radius at the edges of the input, so the tiles need some extra
+    # geometry around them for their own area to be correct.
+    border_cells = int(ceil(recastData.agentradius / cellsize)) + 3
+    return tile_cells * cellsize, border_cells
+
+
+def getTileKeys(verts, tris, tile_size, border):
+    """Returns the grid coordinates of the tiles (in the recast XZ plane) touched by the given triangles"""
+    tri_verts = verts.reshape(-1, 3)[tris.reshape(-1, 3)]
+    if len(tri_verts) == 0:
+        return set()
+    x_min, z_min = tri_verts[:, :, 0].min() - border, tri_verts[:, :, 2].min() - border
+    x_max, z_max = tri_verts[:, :, 0].max() + border, tri_verts[:, :, 2].max() + border
+    return {(i, j)
+            for i in range(int(np.floor(x_min / tile_size)), int(np.floor(x_max / tile_size)) + 1)
+            for j in range(int(np.floor(z_min / tile_size)), int(np.floor(z_max / tile_size)) + 1)}
+
+
+def splitIntoTiles(verts, tris, tile_size, border, tile_keys=None):
+    """Splits the input triangles into tiles of tile_size in the recast XZ plane.  Every tile gets the triangles that
+    overlap its bounds expanded by border, with their vertices compacted so recast only rasterizes the tile's area.
+    Returns a dict of tile grid coordinates to (verts, tris) arrays ready to be passed to buildDetailMesh."""
+    v = verts.reshape(-1, 3)
+    t = tris.reshape(-1, 3)
+    tri_x = v[t][:, :, 0]
+    tri_z = v[t][:, :, 2]
+    tri_x_min, tri_x_max = tri_x.min(axis=1), tri_x.max(axis=1)
+    tri_z_min, tri_z_max = tri_z.min(axis=1), tri_z.max(axis=1)
+
+    if tile_keys is None:
+        # Tiles that only contain border geometry would be clipped away anyway, so don't build them.
+        tile_keys = getTileKeys(verts, tris, tile_size, 0.0)
+
+    tiles = {}
+    for (i, j) in sorted(tile_keys):
+        x0, x1 = i * tile_size - border, (i + 1) * tile_size + border
+        z0, z1 = j * tile_size - border, (j + 1) * tile_size + border
+        mask = (tri_x_max >= x0) & (tri_x_min <= x1) & (tri_z_max >= z0) & (tri_z_min <= z1)
+        if not mask.any():
+            continue
+
+        used, inverse = np.unique(t[mask], return_inverse=True)
+        tiles[(i, j)] = (np.ascontiguousarray(v[used], dtype=np.float32).ravel(),
+                         np.ascontiguousarray(inverse.reshape(-1), dtype=np.int32))
+
+    return tiles
+
+
+def getTileBounds(tile_key, tile_size, y_range):
+    """Returns the recast space (bmin, bmax) box of a tile"""
+    i, j = tile_key
+    return ((i * tile_size, y_range[0], j * tile_size),
+            ((i + 1) * tile_size, y_range[1], (j + 1) * tile_size))
+
+
+def snapToTileEdges(verts, tile_key, tile_size, tolerance):
+    """Moves the detail vertices that are within tolerance of the tile edges exactly onto them, so the vertices
+    shared by neighbouring tiles end up in the same place even though recast computed them in float precision."""
+    verts = verts.copy()
+    for axis, index in ((0, tile_key[0]), (2, tile_key[1])):
+        for edge in (index * tile_size, (index + 1) * tile_size):
+            on_edge = np.abs(verts[:, axis] - edge) < tolerance
+            verts[on_edge, axis] = edge
+    return verts
+
+
+def buildTile(recast, recastData, tile_key, tile_verts, tile_tris, tile_size, border_size, y_range, cancel_event):
+    """Builds a single tile, this is meant to be run from a worker thread (the ctypes call releases the GIL)."""
+    if cancel_event.is_set():
+        return tile_key, True, "Cancelled", None
+
+    ok, message, data = buildDetailMesh(recast, recastData, tile_verts, tile_tris,
+                                        tile_bounds=getTileBounds(tile_key, tile_size, y_range),
+                                        border_size=border_size)
+    if data is not None:
+        verts, faces = data
+        data = (snapToTileEdges(verts, tile_key, tile_size, recastData.cellsize * 0.01), faces)
+
+    return tile_key, ok, message, data
+
+
+def splitTileEdges(verts, faces, tile_size, tolerance):
+    """Neighbouring tiles don't always place the same detail vertices along their shared edge, which leaves
+    T-junctions that welding alone can't connect.  Splits every triangle edge lying on a tile edge at the vertices
+    of the other tiles that lie on it."""
+    if len(faces) == 0:
+        return faces
+
+    # Find the tile edge line (if any) every vertex lies on, along x and along z.
+    lines = []
+    for axis in (0, 2):
+        line_index = np.round(verts[:, axis] / tile_size)
+        on_line = np.abs(verts[:, axis] - line_index * tile_size) < tolerance
+        lines.append((axis, line_index.astype(np.int64), on_line))
+
+    # Triangles with an edge on a tile edge line are the only ones that may need splitting.
+    candidates = np.zeros(len(faces), dtype=bool)
+    for axis, line_index, on_line in lines:
+        for a, b in ((0, 1), (1, 2), (2, 0)):
+            fa, fb = faces[:, a], faces[:, b]
+            candidates |= on_line[fa] & on_line[fb] & (line_index[fa] == line_index[fb])
+    if not candidates.any():
+        return faces
+
+    # The vertices on every line, sorted along it.
+    line_verts = {}
+    for axis, line_index, on_line in lines:
+        other_axis = 2 - axis
+        for index in np.unique(line_index[on_line]):
+            vert_indices = np.nonzero(on_line & (line_index == index))[0]
+            vert_indices = vert_indices[np.argsort(verts[vert_indices, other_axis], kind='stable')]
+            line_verts[(axis, index)] = (verts[vert_indices, other_axis], vert_indices)
+
+    def find_split(face):
+        for k in range(3):
+            a, b = face[k], face[(k + 1) % 3]
+            for axis, line_index, on_line in lines:
+                if not (on_line[a] and on_line[b] and line_index[a] == line_index[b]):
+                    continue
+                coords, vert_indices = line_verts[(axis, line_index[a])]
+                other_axis = 2 - axis
+                ca, cb = verts[a, other_axis], verts[b, other_axis]
+                lo, hi = min(ca, cb) + tolerance, max(ca, cb) - tolerance
+                inside = vert_indices[np.searchsorted(coords, lo, side='right'):np.searchsorted(coords, hi)]
+                if len(inside) == 0:
+                    continue
+                # Order the split points from a to b and skip the ones sharing a position.
+                split = []
+                for v in (inside if cb > ca else inside[::-1]):
+                    if not split or abs(verts[v, other_axis] - verts[split[-1], other_axis]) >= tolerance:
+                        split.append(v)
+                return k, split
+        return None
+
+    split_faces = []
+    pending = [tuple(face) for face in faces[candidates]]
+    while pending:
+        face = pending.pop()
+        found = find_split(face)
+        if found is None:
+            split_faces.append(face)
+            continue
+        # Fan the triangle from the vertex opposite to the split edge, keeping its winding.
+        k, split = found
+        a, b, c = face[k], face[(k + 1) % 3], face[(k + 2) % 3]
+        points = [a] + split + [b]
+        pending.extend((points[n], points[n + 1], c) for n in range(len(points) - 1))
+
+    return np.concatenate((faces[~candidates], np.array(split_faces, dtype=faces.dtype).reshape(-1, 3)))
+
+
+def mergeTiles(tile_data):
+    """Concatenates the recast space data of several tiles into a single mesh"""
+    verts = []
+    faces = []
+    verts_offset = 0
+    for tile_verts, tile_faces in tile_data:
+        verts.append(tile_verts)
+        faces.append(tile_faces + verts_offset)
+        verts_offset += len(tile_verts)
+
+    if not verts:
+        return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int64)
 
+    return np.concatenate(verts), np.concatenate(faces)
 
-def createMesh(context, dmesh_holder, obj=None):
+
+def createMesh(context, verts, faces, obj=None):
     scene = context.scene
     if not obj:
         mesh = bpy.data.meshes.new("navmesh")  # add a new mesh
@@ -228,48 +656,19 @@ def createMesh(context, dmesh_holder, obj=None):
     obj.select_set(True)  # select object
     bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
 
-    bm = bmesh.new()
-    nverts = (int)(dmesh_holder.dmesh.contents.nverts)
-    for i in range(nverts):
-        x = dmesh_holder.dmesh.contents.verts[i * 3 + 0]
-        y = dmesh_holder.dmesh.contents.verts[i * 3 + 1]
-        z = dmesh_holder.dmesh.contents.verts[i * 3 + 2]
-        v = reswap(Vector([x, y, z]))
-        bm.verts.new(v)  # add a new vert
-    bm.verts.ensure_lookup_table()
-
-    nmeshes = (int)(dmesh_holder.dmesh.contents.nmeshes)
-    for j in range(nmeshes):
-        baseVerts = dmesh_holder.dmesh.contents.meshes[j * 4 + 0]
-        meshNVerts = dmesh_holder.dmesh.contents.meshes[j * 4 + 1]
-        baseTri = dmesh_holder.dmesh.contents.meshes[j * 4 + 2]
-        meshNTris = dmesh_holder.dmesh.contents.meshes[j * 4 + 3]
-        meshVertsList = []
-        # if len(meshVertsList) >= 3:
-        #    bm.faces.new(meshVertsList)
-
-        for i in range(meshNTris):
-            i1 = dmesh_holder.dmesh.contents.tris[(baseTri + i) * 4 + 0] + baseVerts
-            i2 = dmesh_holder.dmesh.contents.tris[(baseTri + i) * 4 + 1] + baseVerts
-            i3 = dmesh_holder.dmesh.contents.tris[(baseTri + i) * 4 + 2] + baseVerts
-            flags = dmesh_holder.dmesh.contents.tris[(baseTri + i) * 4 + 3]
-            # print("face = (%i, %i, %i)" % (i1, i2, i3))
-            bm.faces.new((bm.verts[i1], bm.verts[i2], bm.verts[i3]))  # add a new vert
-
-    # Recast: The vertex indices in the triangle array are local to the sub-mesh, not global. To translate into an global index in the vertices array, the values must be offset by the sub-mesh's base vertex index.
-    # ntris = (int)(dmesh_holder.dmesh.contents.ntris)
-    # for i in range(ntris):
-    #    i1 = dmesh_holder.dmesh.contents.tris[i*3+0]
-    #    i2 = dmesh_holder.dmesh.contents.tris[i*3+1]
-    #    i3 = dmesh_holder.dmesh.contents.tris[i*3+2]
-    #    print("face[%i] = (%i, %i, %i)" % (i, i1, i2, i3))
-    #    bm.faces.new((bm.verts[i1], bm.verts[i2], bm.verts[i3]))  # add a new vert
-
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.00001)
+    verts, faces = weldDetailMesh(verts, faces)
 
-    # make the bmesh the object's mesh
-    bm.to_mesh(mesh)
-    bm.free()  # always do this when finished
+    # make the welded geometry the object's mesh, filling the mesh arrays straight from numpy
+    mesh.clear_geometry()
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(faces) * 3)
+    mesh.polygons.add(len(faces))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(faces) * 3, 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.full(len(faces), 3, dtype=np.int32))
+    mesh.polygons.foreach_set("vertices", np.ascontiguousarray(faces, dtype=np.int32).ravel())
+    mesh.update(calc_edges=True)
 
     # Assign nav mesh color
     mat = bpy.data.materials.get("Navmesh Material")
@@ -337,6 +736,10 @@ class RecastNavMeshResetOperator(bpy.types.Operator):
         scene.recast_navmesh.partitioning = PARTITIONING_DEFAULT
         scene.recast_navmesh.color = COLOR_DEFAULT
         scene.recast_navmesh.auto_cell = AUTO_CELL_DEFAULT
+        scene.recast_navmesh.tiled = TILED_DEFAULT
+        scene.recast_navmesh.tile_size = TILE_SIZE_DEFAULT
+        scene.recast_navmesh.tile_threads = TILE_THREADS_DEFAULT
+        scene.recast_navmesh.incremental = INCREMENTAL_DEFAULT
 
         return {'FINISHED'}
 
@@ -347,6 +750,11 @@ class RecastNavMeshGenerateOperator(bpy.types.Operator):
     bl_description = "Build navigation mesh from the selected objects using recast."
     bl_options = {'REGISTER', 'UNDO'}
 
+    _timer = None
+    executor = None
+    futures = []
+    cancel_event = None
+
     @classmethod
     def poll(cls, context):
         if is_linked(context.scene):
@@ -354,14 +762,14 @@ class RecastNavMeshGenerateOperator(bpy.types.Operator):
                 cls.poll_message_set("Cannot build a navigation mesh when in a linked scene")
             return False
 
-        return True
+        return not navmesh_building
 
     def execute(self, context):
         # bpy.ops.wm.call_menu(name="ADDITIVE_ANIMATION_insert_keyframe_menu")
 
-        active_object = context.active_object
-        selected_objects = context.selected_objects
-        if len([obj for obj in selected_objects if obj.type == 'MESH']) == 0:
+        self.active_object = context.active_object
+        self.selected_objects = context.selected_objects
+        if len([obj for obj in self.selected_objects if obj.type == 'MESH']) == 0:
             self.report({'WARNING'}, 'No meshes selected')
             return {"CANCELLED"}
 
@@ -372,32 +780,20 @@ class RecastNavMeshGenerateOperator(bpy.types.Operator):
                 self.report({'ERROR'}, 'A Navmesh cannot be part of the selection')
                 return {'CANCELLED'}
 
-        navMesh = None
-        navMeshes = get_objects_with_component(nav_mesh_id)
-        if navMeshes:
-            navMesh = navMeshes[0]
-
-        addon_prefs = get_addon_pref(context)
-        libpath = os.path.abspath(addon_prefs.recast_lib_path)
-        libpathr = libpath.replace("\\", "/")
+        libpathr = getRecastLibPath(context)
         if not os.path.exists(libpathr):
             self.report({'ERROR'}, 'File not exists: %s\n' % libpathr)
             return {'CANCELLED'}
 
-        verts, tris = extractTriangulatedInputMesh(context)
-        vertsCount = len(verts)
-        trisCount = len(tris)
-        nverts = (int)(len(verts) / 3)
-        ntris = (int)(len(tris) / 3)
+        recast_navmesh = context.scene.recast_navmesh
+        cache = get_navmesh_build_cache(context.scene) if recast_navmesh.incremental else None
+        verts, tris = extractTriangulatedInputMesh(context, cache=cache)
         recastData = recastDataFromBlender(context.scene)
-        if context.scene.recast_navmesh.auto_cell:
+        if recast_navmesh.auto_cell:
             recastData.cellsize = get_auto_cell_size(context)
 
-        prevWorkingDir = os.getcwd()
-        nextWorkingDir = os.path.dirname(libpathr)
-        os.chdir(nextWorkingDir)
         try:
-            recast = ctypes.CDLL(libpathr)
+            recast = loadRecastLibrary(libpathr)
         except OSError as e:
             tracebackStr = traceback.format_exc()
             self.report(
@@ -405,52 +801,178 @@ class RecastNavMeshGenerateOperator(bpy.types.Operator):
                 'Failed to load shared library: %s\nPath to shared library: %s\n\nTraceback: %s' %
                 (str(e),
                  libpathr, tracebackStr))
-            os.chdir(prevWorkingDir)
             return {'FINISHED'}
 
-        os.chdir(prevWorkingDir)
+        if recast_navmesh.tiled:
+            if hasattr(recast, 'buildNavMeshTile'):
+                return self.start_tiled_build(context, recast, recastData, verts, tris, cache)
+            self.report({'WARNING'}, 'The recast library does not support tiled builds, rebuild it to use them. '
+                        'Building the navigation mesh as a single tile.')
 
-        pmesh = recast_polyMesh_holder()
-        dmesh = recast_polyMeshDetail_holder()
-        nreportMsg = 128
-        reportMsg = ctypes.create_string_buffer(b'\000' * nreportMsg)     # 128 chars mutable text
-        recast.buildNavMesh.argtypes = [
-            ctypes.POINTER(RecastData),
-            c_int, c_float * vertsCount, c_int, c_int * trisCount, ctypes.POINTER(recast_polyMesh_holder),
-            ctypes.POINTER(recast_polyMeshDetail_holder),
-            ctypes.c_char_p, c_int]
-        recast.buildNavMesh.restype = c_int
-        recast.freeNavMesh.argtypes = [
-            ctypes.POINTER(recast_polyMesh_holder),
-            ctypes.POINTER(recast_polyMeshDetail_holder),
-            ctypes.c_char_p, c_int]
-        recast.freeNavMesh.restype = c_int
+        if cache is not None:
+            # The tiles are only reused by tiled builds.
+            cache.tiles.clear()
+            cache.settings = None
 
-        ok = recast.buildNavMesh(recastData, nverts, (c_float * vertsCount)(* verts), ntris,
-                                 (c_int * trisCount)(*tris), pmesh, dmesh, reportMsg, nreportMsg)
-        print("Report msg: %s" % reportMsg.raw)
+        ok, message, data = buildDetailMesh(recast, recastData, verts, tris)
         if not ok:
-            self.report({'ERROR'}, 'buildNavMesh C++ error: %s' % reportMsg.value)
+            self.report({'ERROR'}, 'buildNavMesh C++ error: %s' % message)
 
-        if not dmesh.dmesh:
+        if data is None:
             self.report({'ERROR'}, 'buildNavMesh C++ error: %s' % 'No recast_polyMeshDetail')
         else:
-            # print("ABC %i" % pmesh.pmesh.contents.nverts)
-            # dmeshv1 = dmesh.dmesh.contents.verts[0]
-            # print("dmeshv1 %f" % dmeshv1)
+            createMesh(context, *data, obj=self.get_nav_mesh())
+
+        self.restore_selection(context)
 
-            createMesh(context, dmesh, obj=navMesh)
+        return {'FINISHED'}
 
-        # what was allocated in C/C++ should be also deallocated there
-        recast.freeNavMesh(pmesh, dmesh, reportMsg, nreportMsg)
+    def get_nav_mesh(self):
+        from ..components.definitions.nav_mesh import NavMesh
+        navMeshes = get_objects_with_component(NavMesh.get_name())
+        return navMeshes[0] if navMeshes else None
 
+    def restore_selection(self, context):
         bpy.ops.object.select_all(action='DESELECT')
-        for obj in selected_objects:
-            obj.select_set(True)
-        context.view_layer.objects.active = active_object
+        for obj in self.selected_objects:
+            try:
+                obj.select_set(True)
+            except (ReferenceError, RuntimeError):
+                # The object was removed or moved out of the view layer while the navmesh was building.
+                pass
+        try:
+            context.view_layer.objects.active = self.active_object
+        except ReferenceError:
+            pass
+
+    def start_tiled_build(self, context, recast, recastData, verts, tris, cache=None):
+        global navmesh_building
+
+        recast_navmesh = context.scene.recast_navmesh
+        self.tile_size, self.border_size = getTileGrid(recastData, recast_navmesh.tile_size)
+        # Keep the objects referenced by the structure alive while the threads are using it.
+        self.recast = recast
+        self.recastData = recastData
+        self.start_time = time.perf_counter()
+        self.cache = cache
+
+        border = self.border_size * recastData.cellsize
+        # Every tile uses the full height range, snapped to the cell height so all the tiles share the same voxels.
+        y = verts.reshape(-1, 3)[:, 1]
+        cellheight = recastData.cellheight
+        self.y_range = ((float(np.floor(y.min() / cellheight)) * cellheight,
+                         float(np.ceil(y.max() / cellheight)) * cellheight) if len(y) else (0.0, 0.0))
+        self.tile_keys = getTileKeys(verts, tris, self.tile_size, 0.0)
+        self.dirty_tile_keys = self.tile_keys
+        if cache is not None:
+            settings = (tuple(getattr(recastData, field) for field, _ in RecastData._fields_), self.tile_size)
+            if cache.settings == settings:
+                # Only rebuild the tiles touched by the changed objects and the ones that were never built.
+                self.dirty_tile_keys = (cache.get_dirty_tile_keys(self.tile_size) |
+                                        (self.tile_keys - cache.tiles.keys()))
+            else:
+                cache.tiles.clear()
+                cache.settings = settings
+
+            for tile_key in self.dirty_tile_keys | (cache.tiles.keys() - self.tile_keys):
+                cache.tiles.pop(tile_key, None)
+
+        tiles = splitIntoTiles(verts, tris, self.tile_size, border, tile_keys=self.dirty_tile_keys)
+        if cache is not None:
+            # Remember the tiles without any input so they aren't checked again until something moves into them.
+            for tile_key in self.dirty_tile_keys - tiles.keys():
+                cache.tiles[tile_key] = (np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int64))
+
+        if not tiles and not (cache is not None and cache.tiles):
+            self.report({'WARNING'}, 'No triangles to build the navigation mesh from')
+            return {'CANCELLED'}
+
+        max_workers = recast_navmesh.tile_threads or os.cpu_count()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cancel_event = threading.Event()
+        self.futures = [
+            self.executor.submit(buildTile, recast, recastData, tile_key,
+                                 tile_verts, tile_tris, self.tile_size, self.border_size, self.y_range,
+                                 self.cancel_event)
+            for tile_key, (tile_verts, tile_tris) in tiles.items()]
+        self.cancelled = False
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self.futures))
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        navmesh_building = True
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and not self.cancelled:
+            self.cancelled = True
+            self.cancel_event.set()
+            for future in self.futures:
+                future.cancel()
+            return {'RUNNING_MODAL'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        num_done = len([future for future in self.futures if future.done()])
+        context.window_manager.progress_update(num_done)
+        context.workspace.status_text_set(
+            f"Building navigation mesh tiles: {num_done}/{len(self.futures)} (Esc to cancel)")
+
+        if num_done < len(self.futures):
+            return {'PASS_THROUGH'}
+
+        self.finish(context)
+
+        if self.cancelled:
+            self.report({'WARNING'}, 'Navigation mesh build cancelled')
+            return {'CANCELLED'}
+
+        tile_data = []
+        for future in self.futures:
+            try:
+                tile_key, ok, message, data = future.result()
+            except Exception as e:
+                traceback.print_exc()
+                self.report({'ERROR'}, 'Navigation mesh tile build error: %s' % e)
+                continue
+            if not ok:
+                self.report({'ERROR'}, 'buildNavMesh C++ error in tile %s: %s' % (tile_key, message))
+            if data is not None:
+                tile_data.append(data)
+                if self.cache is not None and ok:
+                    self.cache.tiles[tile_key] = data
+
+        if self.cache is not None:
+            # Tiles that weren't rebuilt are taken from the cache.
+            tile_data.extend(data for tile_key, data in self.cache.tiles.items()
+                             if tile_key not in self.dirty_tile_keys)
+
+        if not tile_data:
+            self.report({'ERROR'}, 'buildNavMesh C++ error: %s' % 'No recast_polyMeshDetail')
+        else:
+            verts, faces = mergeTiles(tile_data)
+            faces = splitTileEdges(verts, faces, self.tile_size, self.recastData.cellsize * 0.01)
+            createMesh(context, verts, faces, obj=self.get_nav_mesh())
+
+        self.restore_selection(context)
+        self.report({'INFO'}, 'Navigation mesh built %d of %d tiles in %.2fs' %
+                    (len(self.futures), len(self.tile_keys), time.perf_counter() - self.start_time))
 
         return {'FINISHED'}
 
+    def finish(self, context):
+        global navmesh_building
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        self.executor.shutdown(wait=True)
+        self.executor = None
+        navmesh_building = False
+
 
 class RecastNavMeshPropertyGroup(PropertyGroup):
     # based on https://docs.blender.org/api/2.79/bpy.types.SceneGameRecastData.html
@@ -575,6 +1097,32 @@ class RecastNavMeshPropertyGroup(PropertyGroup):
 
     auto_cell: BoolProperty(name="Auto cell size", default=AUTO_CELL_DEFAULT)
 
+    tiled: BoolProperty(
+        name="Tiled build",
+        description="Split the input into tiles that are built in parallel. Recommended for large worlds",
+        default=TILED_DEFAULT)
+
+    tile_size: FloatProperty(
+        name="tile_size",
+        description="Size of the tiles on the ground plane",
+        default=TILE_SIZE_DEFAULT,
+        min=1.0,
+        max=10000.0,
+        subtype='DISTANCE')
+
+    incremental: BoolProperty(
+        name="Incremental rebuild",
+        description="Keep the triangulated input and the built tiles in memory so that rebuilding only processes "
+                    "the objects that changed and, for tiled builds, the tiles they touch",
+        default=INCREMENTAL_DEFAULT)
+
+    tile_threads: IntProperty(
+        name="tile_threads",
+        description="Number of threads used to build the tiles, 0 uses all the available processors",
+        default=TILE_THREADS_DEFAULT,
+        min=0,
+        max=256)
+
 
 class RecastAdvancedNavMeshPanel(bpy.types.Panel):
     bl_idname = "SCENE_PT_blendcast_adv"
@@ -603,6 +1151,18 @@ class RecastAdvancedNavMeshPanel(bpy.types.Panel):
         col.row().prop(recastPropertyGroup, "sample_dist", text="Sample distance")
         col.row().prop(recastPropertyGroup, "sample_max_error", text="Max sample error")
 
+        col.row().label(text="Tiling:")
+        tiled_supported = isTiledBuildSupported(getRecastLibPath(context))
+        row = col.row()
+        row.enabled = tiled_supported
+        row.prop(recastPropertyGroup, "tiled", text="Tiled build")
+        if not tiled_supported:
+            col.row().label(text="The recast library doesn't support tiled builds", icon='INFO')
+        col.row().prop(recastPropertyGroup, "incremental", text="Incremental rebuild")
+        if recastPropertyGroup.tiled and tiled_supported:
+            col.row().prop(recastPropertyGroup, "tile_size", text="Tile size")
+            col.row().prop(recastPropertyGroup, "tile_threads", text="Threads")
+
 
 class RecastNavMeshPanel(Panel):
     """Creates a Panel in the Object properties window"""
@@ -653,8 +1213,28 @@ def register():
         bpy.utils.register_class(cls)
     bpy.types.Scene.recast_navmesh = PointerProperty(type=RecastNavMeshPropertyGroup)
 
+    if navmesh_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(navmesh_depsgraph_update_post)
+    if navmesh_undo_post not in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.append(navmesh_undo_post)
+    if navmesh_undo_post not in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.append(navmesh_undo_post)
+    if navmesh_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(navmesh_load_post)
+
 
 def unregister():
+    if navmesh_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(navmesh_load_post)
+    if navmesh_undo_post in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(navmesh_undo_post)
+    if navmesh_undo_post in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(navmesh_undo_post)
+    if navmesh_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(navmesh_depsgraph_update_post)
+    navmesh_build_caches.clear()
+    geometry_revisions.clear()
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.recast_navmesh
@@ -35,11 +35,28 @@ def get_or_create_deps_path(name):
     return deps_path
 
 
+# Cached results of is_module_available, only invalidated when dependencies are installed/uninstalled.
+modules_availability = {}
+
+
+def invalidate_module_availability(name=None):
+    import importlib
+    importlib.invalidate_caches()
+    if name is None:
+        modules_availability.clear()
+    else:
+        modules_availability.pop(name, None)
+
+
 def is_module_available(name):
+    available = modules_availability.get(name)
+    if available is not None:
+        return available
+
     import sys
     old_syspath = sys.path[:]
-    old_sysmod = sys.modules.copy()
 
+    loader = None
     try:
         path = get_or_create_deps_path(name)
 
@@ -47,26 +64,28 @@ def is_module_available(name):
         sys.path.insert(0, str(path))
 
         try:
+            # Finding the spec of a top level module doesn't import it, so sys.modules doesn't need to be restored.
             loader = importlib.util.find_spec(name)
         except ImportError as ex:
             print(f'{name} not found')
 
         import os
         path = os.path.join(path, name)
-        return loader and os.path.exists(path)
+        available = bool(loader and os.path.exists(path))
 
     finally:
         # Restore without assigning a new list instance. That way references
         # held by other code will stay valid.
         sys.path[:] = old_syspath
-        sys.modules.clear()
-        sys.modules.update(old_sysmod)
+
+    modules_availability[name] = available
+    return available
 
 
 def load_dependency(name):
     import sys
     old_syspath = sys.path[:]
-    old_sysmod = sys.modules.copy()
+    old_sysmod = set(sys.modules)
 
     module = None
     try:
@@ -85,8 +104,9 @@ def load_dependency(name):
         # Restore without assigning a new list instance. That way references
         # held by other code will stay valid.
         sys.path[:] = old_syspath
-        sys.modules.clear()
-        sys.modules.update(old_sysmod)
+        # Only drop the modules imported by the dependency instead of rebuilding sys.modules.
+        for module_name in set(sys.modules) - old_sysmod:
+            del sys.modules[module_name]
 
     return module
 
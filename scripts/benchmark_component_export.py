@@ -0,0 +1,75 @@
+# Blender utility script to compare the component gather throughput of the per-class export plans
+# against the previous per-property RNA inspection.
+# Usage:
+# blender -b --factory-startup --addons io_hubs_addon --python scripts/benchmark_component_export.py -- [objects]
+# It creates a synthetic scene with the given number of objects (1000 by default), each with a few components
+# covering scalar, enum, string, vector, color and pointer properties.
+# Exits with an error if the planned gather output doesn't match the legacy gather output.
+
+import sys
+import time
+
+import bpy
+
+from io_hubs_addon.components.utils import add_component
+from io_hubs_addon.io.utils import gather_properties, gather_unplanned_property
+
+COMPONENTS = ["audio-params", "media-frame", "particle-emitter", "text"]
+ROUNDS = 5
+
+
+def create_scene(num_objects):
+    components = []
+    for i in range(num_objects):
+        ob = bpy.data.objects.new(f"Benchmark Object {i}", None)
+        bpy.context.scene.collection.objects.link(ob)
+        for component_name in COMPONENTS:
+            add_component(ob, component_name)
+            component_id = "hubs_component_" + component_name.replace('-', '_')
+            components.append((ob, getattr(ob, component_id)))
+    return components
+
+
+def gather_legacy(export_settings, components):
+    return [{key: gather_unplanned_property(export_settings, ob, component, key)
+             for key in component.get_properties()} for ob, component in components]
+
+
+def gather_planned(export_settings, components):
+    return [gather_properties(export_settings, ob, component) for ob, component in components]
+
+
+def benchmark(gather, export_settings, components):
+    best_time = None
+    for _ in range(ROUNDS):
+        start_time = time.perf_counter()
+        result = gather(export_settings, components)
+        elapsed_time = time.perf_counter() - start_time
+        best_time = elapsed_time if best_time is None else min(best_time, elapsed_time)
+    return best_time, result
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    num_objects = int(argv[0]) if argv else 1000
+
+    components = create_scene(num_objects)
+    export_settings = {'gltf_yup': True}
+
+    legacy_time, legacy_result = benchmark(gather_legacy, export_settings, components)
+    planned_time, planned_result = benchmark(gather_planned, export_settings, components)
+
+    mismatches = [(ob.name, component.get_name()) for (ob, component), legacy, planned in
+                  zip(components, legacy_result, planned_result) if legacy != planned]
+    if mismatches:
+        print(f"Error: the planned gather output differs from the legacy gather output for {len(mismatches)} "
+              f"components, first: {mismatches[0][0]} {mismatches[0][1]}")
+        sys.exit(1)
+
+    for label, elapsed_time in (("legacy", legacy_time), ("planned", planned_time)):
+        print(f"{label:>8}: {elapsed_time:.4f}s, {len(components) / elapsed_time:.0f} components/s")
+    print(f"Speedup: {legacy_time / planned_time:.2f}x ({len(components)} components, best of {ROUNDS})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 # Blender utility script to export a mesh in the Gizmo format.
+# The gizmo format is a binary file of packed little-endian float32 (x, y, z) triangle vertices in world space,
+# save it as addons/io_hubs_addon/components/models/<name>.bin and load it with models.load_model("<name>").
 # Usage:
 # Run Blender from the terminal.
 # Create a new script file, copy this script in the new file and run.
 
 import bpy
+import numpy as np
 
 from bpy.props import StringProperty
 from bpy_extras.io_utils import ImportHelper
@@ -11,20 +14,27 @@ from bpy.types import Operator
 
 
 def convert(objects):
-    '''Prints the model vertices in gizmo format and world space'''
-    out = 'SHAPE = ('
+    '''Returns the model vertices in gizmo format and world space'''
+    shapes = []
     for ob in objects:
         if ob.type == 'MESH':
             mesh = ob.data
-            mat = ob.matrix_world
             mesh.calc_loop_triangles()
-            for tri in mesh.loop_triangles:
-                for i in range(3):
-                    v_index = tri.vertices[i]
-                    v = mat @ mesh.vertices[v_index].co
-                    out += '(%f, %f, %f),' % (v.x, v.y, v.z)
-    out += ')'
-    return out
+
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            co = co.reshape(-1, 3)
+
+            tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", tris)
+
+            mat = np.array(ob.matrix_world, dtype=np.float32)
+            verts = co[tris] @ mat[:3, :3].T + mat[:3, 3]
+            shapes.append(verts)
+
+    if not shapes:
+        return b''
+    return np.concatenate(shapes).astype('<f4').tobytes()
 
 
 class SaveGizmoOperator(Operator, ImportHelper):
@@ -33,7 +43,7 @@ class SaveGizmoOperator(Operator, ImportHelper):
     bl_label = "Save Gizmo"
 
     filter_glob: StringProperty(
-        default='*.py;',
+        default='*.bin;',
         options={'HIDDEN'}
     )
 
@@ -41,7 +51,7 @@ class SaveGizmoOperator(Operator, ImportHelper):
         """Save gizmo outout to a file."""
         gizmo = convert(context.selected_objects)
 
-        f = open(self.filepath, "w")
+        f = open(self.filepath, "wb")
         f.write(gizmo)
         f.close()
 
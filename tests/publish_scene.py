@@ -0,0 +1,37 @@
+import bpy
+import json
+import os
+import sys
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    endpoint, model_path, screenshot_path, output_path = argv[:4]
+
+    from io_hubs_addon import api
+
+    # Keep the upload manifest next to the output so previous runs don't make the job reuse their uploads
+    manifest_path = os.path.join(os.path.dirname(output_path), api.UPLOAD_MANIFEST_FILE)
+    api.get_upload_manifest_path = lambda: manifest_path
+
+    scene_id = argv[argv.index('--scene-id') + 1] if '--scene-id' in argv else None
+    scene_data = {} if scene_id else {"name": "Test Scene"}
+    job = api.PublishJob(endpoint, "test-token", scene_data, model_path,
+                         screenshot_path=screenshot_path, scene_id=scene_id)
+    job.run()
+
+    if job.error:
+        raise job.error
+
+    with open(output_path, "w") as f:
+        json.dump(job.result, f)
+
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,103 @@
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const assert = require('assert');
+const utils = require('./utils.js');
+
+const OUT_PREFIX = process.env.OUT_PREFIX || '../tests_out';
+
+process.env['BLENDER_USER_SCRIPTS'] = path.join(process.cwd(), '..');
+
+const blenderVersions = (() => {
+  if (process.platform == 'darwin') {
+    return [
+      "/Applications/Blender.app/Contents/MacOS/Blender"
+    ];
+  }
+  else if (process.platform == 'linux') {
+    return [
+      "blender"
+    ];
+  }
+})();
+
+describe('Publisher', function () {
+  const outDirPath = path.resolve(OUT_PREFIX, 'publish');
+  const modelPath = path.resolve(outDirPath, 'scene.glb');
+  const screenshotPath = path.resolve(outDirPath, 'screenshot.png');
+  const manifestPath = path.resolve(outDirPath, 'upload_manifest.json');
+  const outPath = path.resolve(outDirPath, 'result.json');
+
+  let modelData = null;
+  let screenshotData = null;
+  let reticulum = null;
+
+  before(function () {
+    fs.mkdirSync(outDirPath, { recursive: true });
+  });
+
+  beforeEach(function () {
+    // New files every time so the job never reuses an upload from a previous test.
+    modelData = crypto.randomBytes(200 * 1024);
+    screenshotData = crypto.randomBytes(20 * 1024);
+    fs.writeFileSync(modelPath, modelData);
+    fs.writeFileSync(screenshotPath, screenshotData);
+    fs.rmSync(manifestPath, { force: true });
+    fs.rmSync(outPath, { force: true });
+  });
+
+  afterEach(function (done) {
+    reticulum.server.close(done);
+  });
+
+  const publish = (blenderVersion, failures, options, done) => {
+    reticulum = utils.createReticulum(failures);
+    reticulum.server.listen(0, '127.0.0.1', () => {
+      const endpoint = `http://127.0.0.1:${reticulum.server.address().port}`;
+      utils.blenderPublishScene(blenderVersion, endpoint, modelPath, screenshotPath, outPath, done, options);
+    });
+  };
+
+  // The uploads run concurrently, so look their ids up by content.
+  const uploadId = (data) => reticulum.state.uploads.findIndex(upload => Buffer.compare(upload.data, data) === 0);
+
+  blenderVersions.forEach(function (blenderVersion) {
+    describe(blenderVersion + '_publish', function () {
+      it('uploads the scene files and publishes the scene', function (done) {
+        publish(blenderVersion, {}, '', (error, data) => {
+          if (error)
+            return done(error);
+          assert.strictEqual(data.scenes[0].scene_id, 'scene-0');
+
+          const modelId = uploadId(modelData);
+          const screenshotId = uploadId(screenshotData);
+          assert.ok(modelId !== -1 && screenshotId !== -1);
+
+          assert.strictEqual(reticulum.state.scenes.length, 1);
+          const scene = reticulum.state.scenes[0];
+          assert.strictEqual(scene.method, 'POST');
+          assert.strictEqual(scene.authorization, 'Bearer test-token');
+          assert.deepStrictEqual(scene.body, {
+            scene: {
+              name: 'Test Scene',
+              model_file_id: `file-${modelId}`,
+              model_file_token: `token-${modelId}`,
+              screenshot_file_id: `file-${screenshotId}`,
+              screenshot_file_token: `token-${screenshotId}`
+            }
+          });
+          done();
+        });
+      });
+
+      it('does not publish the scene when an upload fails', function (done) {
+        publish(blenderVersion, { chunks: { 0: 400 } }, '', (error) => {
+          assert.ok(error);
+          assert.strictEqual(reticulum.state.scenes.length, 0);
+          assert.ok(!fs.existsSync(outPath));
+          done();
+        });
+      });
+    });
+  });
+});
@@ -0,0 +1,90 @@
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const assert = require('assert');
+const utils = require('./utils.js');
+
+const OUT_PREFIX = process.env.OUT_PREFIX || '../tests_out';
+
+process.env['BLENDER_USER_SCRIPTS'] = path.join(process.cwd(), '..');
+
+const blenderVersions = (() => {
+  if (process.platform == 'darwin') {
+    return [
+      "/Applications/Blender.app/Contents/MacOS/Blender"
+    ];
+  }
+  else if (process.platform == 'linux') {
+    return [
+      "blender"
+    ];
+  }
+})();
+
+describe('Uploader', function () {
+  const outDirPath = path.resolve(OUT_PREFIX, 'upload');
+  const filePath = path.resolve(outDirPath, 'media.bin');
+  const outPath = path.resolve(outDirPath, 'result.json');
+  const fileData = crypto.randomBytes(300 * 1024);
+
+  let reticulum = null;
+
+  before(function () {
+    fs.mkdirSync(outDirPath, { recursive: true });
+    fs.writeFileSync(filePath, fileData);
+  });
+
+  afterEach(function (done) {
+    reticulum.server.close(done);
+  });
+
+  const upload = (blenderVersion, failures, options, done) => {
+    reticulum = utils.createReticulum(failures);
+    reticulum.server.listen(0, '127.0.0.1', () => {
+      const endpoint = `http://127.0.0.1:${reticulum.server.address().port}`;
+      utils.blenderUploadMedia(blenderVersion, endpoint, filePath, outPath, done, options);
+    });
+  };
+
+  blenderVersions.forEach(function (blenderVersion) {
+    describe(blenderVersion + '_upload', function () {
+      it('resumes chunked uploads after server errors and dropped connections', function (done) {
+        upload(blenderVersion, { chunks: { 1: 503, 3: 'reset', 4: 502 } }, '--chunk-size 65536', (error, data) => {
+          if (error)
+            return done(error);
+          assert.deepStrictEqual(data, { file_id: 'file-0', access_token: 'token-0' });
+          assert.strictEqual(Buffer.compare(reticulum.state.uploads[0].data, fileData), 0);
+          done();
+        });
+      });
+
+      it('fails once a chunk runs out of retries', function (done) {
+        const chunks = Object.fromEntries([...Array(10).keys()].map(i => [i, 503]));
+        upload(blenderVersion, { chunks }, '--chunk-size 65536', (error) => {
+          assert.ok(error);
+          done();
+        });
+      });
+
+      it('falls back to a single upload when resumable uploads are not supported', function (done) {
+        upload(blenderVersion, { probe: 'not-found' }, '', (error, data) => {
+          if (error)
+            return done(error);
+          assert.deepStrictEqual(data, { file_id: 'file-media', access_token: 'token-media' });
+          assert.strictEqual(Buffer.compare(reticulum.state.media, fileData), 0);
+          done();
+        });
+      });
+
+      it('falls back to a single upload when the resumable upload request fails', function (done) {
+        upload(blenderVersion, { probe: 'reset' }, '', (error, data) => {
+          if (error)
+            return done(error);
+          assert.deepStrictEqual(data, { file_id: 'file-media', access_token: 'token-media' });
+          assert.strictEqual(Buffer.compare(reticulum.state.media, fileData), 0);
+          done();
+        });
+      });
+    });
+  });
+});
@@ -1,4 +1,5 @@
 const fs = require('fs');
+const http = require('http');
 const path = require('path');
 const validator = require('gltf-validator');
 
@@ -33,6 +34,112 @@ function blenderRoundtripGltf(blenderVersion, gltfPath, outDirName, done, option
   });
 }
 
+function blenderUploadMedia(blenderVersion, endpoint, filePath, outPath, done, options = '') {
+  const { exec } = require('child_process');
+  const cmd = `${blenderVersion} -b --factory-startup --addons io_hubs_addon -noaudio --python upload_media.py -- ${endpoint} ${filePath} ${outPath} ${options}`;
+  var prc = exec(cmd, (error, stdout, stderr) => {
+    if (error) {
+      done(error);
+      return;
+    }
+    done(null, JSON.parse(fs.readFileSync(outPath)));
+  });
+}
+
+function blenderPublishScene(blenderVersion, endpoint, modelPath, screenshotPath, outPath, done, options = '') {
+  const { exec } = require('child_process');
+  const cmd = `${blenderVersion} -b --factory-startup --addons io_hubs_addon -noaudio --python publish_scene.py -- ${endpoint} ${modelPath} ${screenshotPath} ${outPath} ${options}`;
+  var prc = exec(cmd, (error, stdout, stderr) => {
+    if (error) {
+      done(error);
+      return;
+    }
+    done(null, JSON.parse(fs.readFileSync(outPath)));
+  });
+}
+
+// Stand-in for the Reticulum media and scene endpoints.
+// failures.probe: 'reset' drops the connection of the resumable upload request, 'not-found' answers it with a 404.
+// failures.chunks: maps the index of a chunk request to 'reset' or to the HTTP status code to answer it with.
+function createReticulum(failures = {}) {
+  const state = { requests: [], uploads: [], chunkRequests: 0, media: null, scenes: [] };
+  const chunkFailures = failures.chunks || {};
+
+  const mediaResponse = (res, id) => {
+    res.writeHead(200, { 'content-type': 'application/json' });
+    res.end(JSON.stringify({ file_id: `file-${id}`, meta: { access_token: `token-${id}` } }));
+  };
+
+  const uploadStatus = (res, id) => {
+    const upload = state.uploads[id];
+    if (upload.data.length >= upload.length)
+      return mediaResponse(res, id);
+    res.writeHead(308, upload.data.length ? { range: `bytes=0-${upload.data.length - 1}` } : {});
+    res.end();
+  };
+
+  const handle = (req, res, body) => {
+    const url = req.url;
+    state.requests.push(`${req.method} ${url}`);
+
+    if (req.method === 'POST' && url === '/api/v1/media/uploads') {
+      if (failures.probe === 'reset')
+        return req.socket.destroy();
+      if (failures.probe === 'not-found') {
+        res.writeHead(404, { 'content-type': 'application/json' });
+        return res.end(JSON.stringify({ error: 'not_found' }));
+      }
+      state.uploads.push({ length: parseInt(req.headers['upload-length']), data: Buffer.alloc(0) });
+      res.writeHead(201, { location: `/api/v1/media/uploads/${state.uploads.length - 1}` });
+      return res.end();
+    }
+
+    const upload = url.match(/^\/api\/v1\/media\/uploads\/(\d+)$/);
+    if (req.method === 'PUT' && upload) {
+      const id = parseInt(upload[1]);
+      const range = req.headers['content-range'].match(/^bytes (\d+)-(\d+)\/(\d+)$/);
+      if (!range)
+        return uploadStatus(res, id);
+
+      const failure = chunkFailures[state.chunkRequests++];
+      if (failure === 'reset')
+        return req.socket.destroy();
+      if (failure) {
+        res.writeHead(failure);
+        return res.end();
+      }
+      if (parseInt(range[1]) === state.uploads[id].data.length)
+        state.uploads[id].data = Buffer.concat([state.uploads[id].data, body]);
+      return uploadStatus(res, id);
+    }
+
+    if (req.method === 'POST' && url === '/api/v1/media') {
+      const boundary = req.headers['content-type'].split('boundary=')[1];
+      const start = body.indexOf('\r\n\r\n') + 4;
+      state.media = body.subarray(start, body.lastIndexOf(`\r\n--${boundary}--`));
+      return mediaResponse(res, 'media');
+    }
+
+    const scene = url.match(/^\/api\/v1\/scenes(?:\/([^/]+))?$/);
+    if ((req.method === 'POST' && scene && !scene[1]) || (req.method === 'PUT' && scene && scene[1])) {
+      const sceneId = scene[1] || `scene-${state.scenes.length}`;
+      state.scenes.push({ method: req.method, authorization: req.headers['authorization'], body: JSON.parse(body) });
+      res.writeHead(200, { 'content-type': 'application/json' });
+      return res.end(JSON.stringify({ scenes: [{ scene_id: sceneId, url: `https://hubs.local/scenes/${sceneId}` }] }));
+    }
+
+    res.writeHead(404);
+    res.end();
+  };
+
+  const server = http.createServer((req, res) => {
+    const chunks = [];
+    req.on('data', chunk => chunks.push(chunk));
+    req.on('end', () => handle(req, res, Buffer.concat(chunks)));
+  });
+  return { server, state };
+}
+
 function validateGltf(gltfPath, done) {
   const asset = fs.readFileSync(gltfPath);
   validator.validateBytes(new Uint8Array(asset), {
@@ -93,6 +200,9 @@ module.exports = {
   UUID_REGEX,
   blenderFileToGltf,
   blenderRoundtripGltf,
+  blenderUploadMedia,
+  blenderPublishScene,
+  createReticulum,
   validateGltf,
   checkExtensionAdded,
   nodeWithName,
@@ -0,0 +1,31 @@
+import bpy
+import json
+import sys
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    endpoint, filepath, output_path = argv[:3]
+
+    from io_hubs_addon import api
+
+    with open(filepath, "rb") as file:
+        if '--chunk-size' in argv:
+            # Small chunks and retry delays so the failures can be injected in between chunks
+            chunk_size = int(argv[argv.index('--chunk-size') + 1])
+            data = api.upload_media_resumable(endpoint, file, chunk_size=chunk_size, retry_delay=0.01)
+        else:
+            data = api.upload_media(endpoint, file)
+
+    with open(output_path, "w") as f:
+        json.dump(data, f)
+
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
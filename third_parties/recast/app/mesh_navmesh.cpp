@@ -43,9 +43,12 @@
 #define RAD2DEGF(_rad) ((_rad)*(float)(180.0/M_PI))
 #define DEG2RADF(_deg) ((_deg)*(float)(M_PI/180.0))
 
-int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int ntris, int *tris,
-                 struct recast_polyMesh_holder *pmeshHolder, struct recast_polyMeshDetail_holder *dmeshHolder,
-                 char *reports, int reportsMaxChars)
+/* Builds the navmesh of the given bounds.  With a borderSize (in cells) the bounds are expanded by the border on the
+ * xz-plane so the geometry around them is taken into account, but only the polygons inside the bounds are kept. */
+static int buildNavMeshInBounds(const RecastData *recastParams, int nverts, float *verts, int ntris, int *tris,
+                                const float *boundsMin, const float *boundsMax, int borderSize,
+                                struct recast_polyMesh_holder *pmeshHolder, struct recast_polyMeshDetail_holder *dmeshHolder,
+                                char *reports, int reportsMaxChars)
 {
     float bmin[3], bmax[3];
     struct recast_heightfield *solid;
@@ -77,7 +80,12 @@ int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int n
     pmeshHolder->pmesh = NULL;
     dmeshHolder->dmesh = NULL;
 
-    recast_calcBounds(verts, nverts, bmin, bmax);
+    bmin[0] = boundsMin[0] - borderSize * recastParams->cellsize;
+    bmin[1] = boundsMin[1];
+    bmin[2] = boundsMin[2] - borderSize * recastParams->cellsize;
+    bmax[0] = boundsMax[0] + borderSize * recastParams->cellsize;
+    bmax[1] = boundsMax[1];
+    bmax[2] = boundsMax[2] + borderSize * recastParams->cellsize;
 
     /* ** Step 1. Initialize build config ** */
     walkableHeight = (int)ceilf(recastParams->agentheight / recastParams->cellheight);
@@ -159,7 +167,7 @@ int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int n
         }
 
         /* Partition the walkable surface into simple regions without holes */
-        if (!recast_buildRegions(chf, 0, minRegionArea, mergeRegionArea)) {
+        if (!recast_buildRegions(chf, borderSize, minRegionArea, mergeRegionArea)) {
             recast_destroyCompactHeightfield(chf);
 
             strncpy(reports, "Failed to build watershed regions", reportsMaxChars);
@@ -169,7 +177,7 @@ int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int n
     else if (recastParams->partitioning == RC_PARTITION_MONOTONE) {
         /* Partition the walkable surface into simple regions without holes */
         /* Monotone partitioning does not need distancefield. */
-        if (!recast_buildRegionsMonotone(chf, 0, minRegionArea, mergeRegionArea)) {
+        if (!recast_buildRegionsMonotone(chf, borderSize, minRegionArea, mergeRegionArea)) {
             recast_destroyCompactHeightfield(chf);
 
             strncpy(reports, "Failed to build monotone regions", reportsMaxChars);
@@ -178,7 +186,7 @@ int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int n
     }
     else { /* RC_PARTITION_LAYERS */
         /* Partition the walkable surface into simple regions without holes */
-        if (!recast_buildLayerRegions(chf, 0, minRegionArea)) {
+        if (!recast_buildLayerRegions(chf, borderSize, minRegionArea)) {
             recast_destroyCompactHeightfield(chf);
 
             strncpy(reports, "Failed to build layer regions", reportsMaxChars);
@@ -270,6 +278,28 @@ int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int n
     return 1;
 }
 
+int buildNavMesh(const RecastData *recastParams, int nverts, float *verts, int ntris, int *tris,
+                 struct recast_polyMesh_holder *pmeshHolder, struct recast_polyMeshDetail_holder *dmeshHolder,
+                 char *reports, int reportsMaxChars)
+{
+    float bmin[3], bmax[3];
+
+    recast_calcBounds(verts, nverts, bmin, bmax);
+
+    return buildNavMeshInBounds(recastParams, nverts, verts, ntris, tris, bmin, bmax, 0,
+                                pmeshHolder, dmeshHolder, reports, reportsMaxChars);
+}
+
+int buildNavMeshTile(const RecastData *recastParams, int nverts, float *verts, int ntris, int *tris,
+                     const float *tileBmin, const float *tileBmax, int borderSize,
+                     struct recast_polyMesh_holder *pmeshHolder, struct recast_polyMeshDetail_holder *dmeshHolder,
+                     char *reports, int reportsMaxChars)
+{
+    /* Tiles built with bounds on a shared cell grid and a border of at least the agent radius join up seamlessly. */
+    return buildNavMeshInBounds(recastParams, nverts, verts, ntris, tris, tileBmin, tileBmax, borderSize,
+                                pmeshHolder, dmeshHolder, reports, reportsMaxChars);
+}
+
 //int Sample_SoloMesh::handleBuild()
 //{
 //	if (!m_geom || !m_geom->getMesh())
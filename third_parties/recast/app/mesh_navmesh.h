@@ -88,6 +88,14 @@ int RECASTBLENDERADDON_EXPORT buildNavMesh(const RecastData *recastParams, int n
                                                      char *reports, int reportsMaxChars);
 
 
+/// Builds a single tile of a tiled navmesh.  tileBmin/tileBmax are the bounds of the tile, they should lie on a grid
+/// shared by all the tiles.  borderSize is the number of cells of geometry around the tile taken into account.
+int RECASTBLENDERADDON_EXPORT buildNavMeshTile(const RecastData *recastParams, int nverts, float *verts, int ntris, int *tris,
+                                                         const float *tileBmin, const float *tileBmax, int borderSize,
+                                                         struct recast_polyMesh_holder *pmeshHolder, struct recast_polyMeshDetail_holder *dmeshHolder,
+                                                         char *reports, int reportsMaxChars);
+
+
 int RECASTBLENDERADDON_EXPORT freeNavMesh(struct recast_polyMesh_holder *pmeshHolder, struct recast_polyMeshDetail_holder *dmeshHolder,
                                                     char *reports, int reportsMaxChars);
 
@@ -32,10 +32,15 @@
 #include <math.h>
 #include "Recast.h"
 
-static rcContext *sctx;
+/* Every thread gets its own context, so navmesh tiles can be built from several threads at once. */
+static rcContext *get_sctx(void)
+{
+	static thread_local rcContext ctx(false);
+	return &ctx;
+}
 
 #define INIT_SCTX()			\
-	if (sctx == NULL) sctx = new rcContext(false)
+	rcContext *sctx = get_sctx()
 
 //int recast_buildMeshAdjacency(unsigned short* polys, const int npolys,
 //			const int nverts, const int vertsPerPoly)